@@ -20,7 +20,7 @@ from rank_utils import create_rank_icon, apply_rank_label_style
 
 
 class ActiveMatchToast(QFrame):
-    """Card displaying a single active match — styled to match MatchCard."""
+    """Card displaying a single active match — styled to match the match history cards."""
 
     def __init__(self, match_data: dict, parent=None):
         super().__init__(parent)
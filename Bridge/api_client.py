@@ -1,93 +1,196 @@
-"""REST client for Server communication. All calls are synchronous (use from worker threads)."""
+"""REST client for Server communication. All calls are synchronous (use from worker threads).
+
+Requests go through one pooled requests.Session so connections to the
+server are kept alive between calls. Idempotent GETs are retried with
+backoff on connection errors and 502/503/504; POSTs are never retried.
+
+Leaderboard and fastest-times responses are kept in a small conditional-GET
+cache: within HTTP_CACHE_TTL the cached object is returned without a
+request, after that the server is asked with If-None-Match /
+If-Modified-Since and a 304 returns the cached object unchanged.
+
+requests (and urllib3) are imported with the session on the first call,
+not at import time, to keep them off the Bridge's startup path.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from config import (
+    SERVER_URL,
+    HTTP_POOL_SIZE,
+    HTTP_RETRY_TOTAL,
+    HTTP_RETRY_BACKOFF,
+    HTTP_TIMEOUTS,
+    HTTP_CACHE_TTL,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _make_session() -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,  # everything goes to SERVER_URL
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-import requests
 
-from config import SERVER_URL
+_shared_session: "requests.Session | None" = None
+_session_lock = threading.Lock()
 
 
-def get_server_version() -> dict:
-    resp = requests.get(f"{SERVER_URL}/version", timeout=10)
+def _session() -> "requests.Session":
+    global _shared_session
+    if _shared_session is None:
+        with _session_lock:
+            if _shared_session is None:
+                _shared_session = _make_session()
+    return _shared_session
+
+
+def __getattr__(name: str):
+    # api_client.HTTPError for callers, without importing requests up front
+    if name == "HTTPError":
+        import requests
+        return requests.HTTPError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _timeout(path: str) -> float:
+    return HTTP_TIMEOUTS.get(path, HTTP_TIMEOUTS["default"])
+
+
+def _get(path: str, params: dict | None = None) -> "requests.Response":
+    resp = _session().get(f"{SERVER_URL}{path}", params=params, timeout=_timeout(path))
     resp.raise_for_status()
-    return resp.json()
+    return resp
 
 
-def login(steam_id: str) -> dict:
-    resp = requests.post(
-        f"{SERVER_URL}/auth/login",
-        json={"steam_id": steam_id},
-        timeout=10,
-    )
+def _post(path: str, payload: dict) -> "requests.Response":
+    resp = _session().post(f"{SERVER_URL}{path}", json=payload, timeout=_timeout(path))
     resp.raise_for_status()
-    return resp.json()
+    return resp
+
+
+# path -> {"data", "etag", "last_modified", "fetched_at"}
+_http_cache: dict[str, dict] = {}
+_cache_lock = threading.Lock()
+_cache_stats = {"fresh_hits": 0, "revalidated": 0, "misses": 0}
+
+
+def _cached_get(path: str, ttl: float = HTTP_CACHE_TTL) -> dict:
+    """GET path and return its parsed JSON, using the conditional-GET cache.
+
+    A 304 returns the identical cached object, so callers can skip
+    re-rendering with an `is` / == check against what they last showed.
+    """
+    with _cache_lock:
+        entry = _http_cache.get(path)
+        if entry and time.monotonic() - entry["fetched_at"] < ttl:
+            _cache_stats["fresh_hits"] += 1
+            return entry["data"]
+
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = _session().get(f"{SERVER_URL}{path}", headers=headers, timeout=_timeout(path))
+    with _cache_lock:
+        if resp.status_code == 304 and entry:
+            entry["fetched_at"] = time.monotonic()
+            _cache_stats["revalidated"] += 1
+            return entry["data"]
+        resp.raise_for_status()
+        data = resp.json()
+        _http_cache[path] = {
+            "data": data,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fetched_at": time.monotonic(),
+        }
+        _cache_stats["misses"] += 1
+        return data
+
+
+def cache_stats() -> dict:
+    """Return a copy of the conditional-GET cache hit/miss counters."""
+    with _cache_lock:
+        return dict(_cache_stats)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _http_cache.clear()
+
+
+def get_server_version() -> dict:
+    return _get("/version").json()
+
+
+def login(steam_id: str) -> dict:
+    return _post("/auth/login", {"steam_id": steam_id}).json()
 
 
 def register(steam_id: str, player_name: str) -> dict:
-    resp = requests.post(
-        f"{SERVER_URL}/auth/register",
-        json={"steam_id": steam_id, "player_name": player_name},
-        timeout=10,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return _post("/auth/register", {"steam_id": steam_id, "player_name": player_name}).json()
 
 
-def register_raw(steam_id: str, player_name: str) -> requests.Response:
+def register_raw(steam_id: str, player_name: str) -> "requests.Response":
     """Like register() but returns the raw Response so the caller can inspect status codes."""
-    return requests.post(
+    return _session().post(
         f"{SERVER_URL}/auth/register",
         json={"steam_id": steam_id, "player_name": player_name},
-        timeout=10,
+        timeout=_timeout("/auth/register"),
     )
 
 
 def queue_join(steam_id: str) -> dict:
-    resp = requests.post(
-        f"{SERVER_URL}/queue/join",
-        json={"steam_id": steam_id},
-        timeout=10,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return _post("/queue/join", {"steam_id": steam_id}).json()
 
 
 def queue_leave(steam_id: str) -> dict:
-    resp = requests.post(
-        f"{SERVER_URL}/queue/leave",
-        json={"steam_id": steam_id},
-        timeout=10,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return _post("/queue/leave", {"steam_id": steam_id}).json()
 
 
 def queue_stats() -> dict:
-    resp = requests.get(f"{SERVER_URL}/queue/stats", timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    return _get("/queue/stats").json()
 
 
 def get_active_matches() -> dict:
-    resp = requests.get(f"{SERVER_URL}/matches/active", timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    return _get("/matches/active").json()
 
 
 def get_matches(player_id: str | None = None, offset: int = 0, limit: int = 10) -> list[dict]:
     params: dict = {"offset": offset, "limit": limit}
     if player_id:
         params["player_id"] = player_id
-    resp = requests.get(f"{SERVER_URL}/matches", params=params, timeout=10)
-    resp.raise_for_status()
-    return resp.json().get("matches", [])
+    return _get("/matches", params=params).json().get("matches", [])
 
 
 def get_leaderboard() -> list[dict]:
-    resp = requests.get(f"{SERVER_URL}/leaderboard", timeout=10)
-    resp.raise_for_status()
-    return resp.json().get("players", [])
+    return _cached_get("/leaderboard").get("players", [])
 
 
 def get_fastest_times() -> dict:
-    resp = requests.get(f"{SERVER_URL}/leaderboard/fastest", timeout=10)
-    resp.raise_for_status()
-    return resp.json().get("fastest_times", {})
+    return _cached_get("/leaderboard/fastest").get("fastest_times", {})
@@ -1,5 +1,8 @@
 """Entry point for the Bridge application."""
 
+import startup_timeline  # first, so its clock starts before the heavy imports
+
+import importlib
 import logging
 import os
 import sys
@@ -8,24 +11,22 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QFontDatabase, QIcon
 
+import settings_store
+import task_pool
 from bridge_controller import BridgeController
 from main_window import MainWindow
+from rank_utils import warm_rank_icons
 from config import (
-    ASSETS_DIR, CLR_MAIN_BG, CLR_WIDGET_BG, CLR_BUTTON_BG,
+    ASSETS_DIR, LOG_PATH, CLR_MAIN_BG, CLR_WIDGET_BG, CLR_BUTTON_BG,
     CLR_ACTIVE_BTN, CLR_TEXT,
 )
 
 # ---- Logging setup ----
-if getattr(sys, "frozen", False):
-    _log_dir = os.path.dirname(sys.executable)
-else:
-    _log_dir = os.path.dirname(os.path.abspath(__file__))
-
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[
-        logging.FileHandler(os.path.join(_log_dir, "bridge.log"), encoding="utf-8"),
+        logging.FileHandler(LOG_PATH, encoding="utf-8"),
         logging.StreamHandler(sys.stdout),
     ],
 )
@@ -112,8 +113,20 @@ QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
 """
 
 
+def _after_first_paint(auto_login: bool) -> None:
+    if not auto_login:
+        startup_timeline.finish("login ready")
+    # Off the path to the login screen, but before anything needs them:
+    # rank icons for the profile page, and the WS stack (socketio pulls in
+    # engineio and requests) for start_networking after login
+    warm_rank_icons()
+    task_pool.submit(importlib.import_module, "socketio")
+
+
 def main():
+    startup_timeline.mark("imports")
     app = QApplication(sys.argv)
+    startup_timeline.mark("QApplication")
 
     # Load custom font
     font_path = os.path.join(ASSETS_DIR, "Tekton-Bold.otf")
@@ -126,6 +139,7 @@ def main():
 
     app.setFont(QFont(font_family))
     app.setStyleSheet(_build_stylesheet(font_family))
+    startup_timeline.mark("font load")
 
     # Set application icon
     icon_path = os.path.join(ASSETS_DIR, "appicon.png")
@@ -133,8 +147,20 @@ def main():
         app.setWindowIcon(QIcon(icon_path))
 
     controller = BridgeController()
+    # Ready once the login screen can be used, or once a cached auto-login
+    # (started by MainWindow) has an outcome
+    auto_login = bool(settings_store.get_steam_id())
+    if auto_login:
+        for signal in (controller.login_success, controller.login_failed,
+                       controller.registration_needed, controller.bridge_version_mismatch):
+            signal.connect(lambda *_: startup_timeline.finish("login ready"))
+    startup_timeline.on_first_paint(app, lambda: _after_first_paint(auto_login))
     window = MainWindow(controller)
     window.show()
+    startup_timeline.mark("window shown")
+
+    # Settings are written behind; make sure the last change reaches disk
+    app.aboutToQuit.connect(settings_store.flush)
 
     sys.exit(app.exec())
 
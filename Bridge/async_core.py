@@ -0,0 +1,216 @@
+"""Optional asyncio networking core (SPEEDRUN_ASYNC_NETWORKING=1).
+
+The UDP relay and, when aiohttp is installed, the Socket.IO client run as
+coroutines and callbacks on one shared event-loop thread instead of the
+recv/ping threads and socketio's transport threads:
+
+  - UDP is an asyncio.DatagramProtocol; datagrams are dispatched as they
+    arrive and the heartbeat is a loop.call_later chain, so there is no 1 s
+    recvfrom timeout or sleeping ping thread.
+  - Critical message resends are loop timers, cancelled together on stop().
+  - Everything that waits has a deadline (WS_CONNECT_TIMEOUT,
+    ASYNC_STOP_TIMEOUT), applied with asyncio.wait_for.
+
+Qt keeps its own event loop on the GUI thread. The two loops meet the same
+way qasync-style bridges do: loop -> GUI through Qt signals (queued onto the
+receiver's thread), GUI -> loop through call_soon_threadsafe /
+run_coroutine_threadsafe. HTTP stays on task_pool; its workers only exist
+while requests are being made.
+"""
+
+import asyncio
+import concurrent.futures
+import importlib.util
+import logging
+import socket
+import threading
+from typing import Callable, Coroutine
+
+import socketio
+
+from ws_client import WSClient
+from udp_relay import UDPRelay
+from config import (
+    WS_URL,
+    WS_NAMESPACE,
+    WS_CONNECT_TIMEOUT,
+    UDP_HOST,
+    BRIDGE_UDP_PORT,
+    UDP_PING_INTERVAL,
+    ASYNC_STOP_TIMEOUT,
+)
+
+log = logging.getLogger(__name__)
+
+# socketio.AsyncClient needs aiohttp for its transports
+HAS_AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="asyncio", daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+def in_loop_thread() -> bool:
+    return _loop_thread is not None and threading.current_thread() is _loop_thread
+
+
+def run(coro: Coroutine, timeout: float | None = None) -> concurrent.futures.Future:
+    """Schedule coro on the loop from any thread, optionally with a deadline."""
+    if timeout is not None:
+        coro = asyncio.wait_for(coro, timeout)
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def call_soon(fn: Callable, *args) -> None:
+    """Run fn(*args) on the loop thread (directly if already on it)."""
+    if in_loop_thread():
+        fn(*args)
+    else:
+        get_loop().call_soon_threadsafe(fn, *args)
+
+
+def create_transports() -> tuple[WSClient, UDPRelay]:
+    """Build the WS client and UDP relay for the controller."""
+    if HAS_AIOHTTP:
+        ws = AsyncWSClient()
+    else:
+        log.warning("aiohttp is not installed; the WS client stays on threads")
+        ws = WSClient()
+    return ws, AsyncUDPRelay()
+
+
+class _GameProtocol(asyncio.DatagramProtocol):
+    def __init__(self, relay: "AsyncUDPRelay"):
+        self._relay = relay
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._relay._handle_datagram(data)
+
+    def error_received(self, exc: Exception) -> None:
+        # Windows reports ICMP "port unreachable" (WinError 10054) for pings
+        # sent before the Game listens; the endpoint stays usable.
+        log.debug("UDP error: %s", exc)
+
+
+class AsyncUDPRelay(UDPRelay):
+    """UDPRelay driven by the shared event loop instead of recv/ping threads."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._transport: asyncio.DatagramTransport | None = None
+        self._heartbeat_handle: asyncio.TimerHandle | None = None
+        self._retransmits: dict[int, asyncio.TimerHandle] = {}
+
+    def start(self) -> None:
+        """Bind to the Bridge's known port and attach it to the loop."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((UDP_HOST, BRIDGE_UDP_PORT))
+        sock.setblocking(False)
+        self._running = True
+        run(self._open(sock), ASYNC_STOP_TIMEOUT).result()
+
+    async def _open(self, sock: socket.socket) -> None:
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(lambda: _GameProtocol(self), sock=sock)
+        self._heartbeat_handle = loop.call_later(UDP_PING_INTERVAL, self._tick)
+
+    def stop(self) -> None:
+        """Cancel pending retries and the heartbeat, then close the socket."""
+        self._running = False
+        self._cancel_pending()
+        if self._transport is None:
+            return
+        try:
+            run(self._close(), ASYNC_STOP_TIMEOUT).result()
+        except Exception as e:
+            log.warning("UDP relay did not stop cleanly: %s", e)
+
+    async def _close(self) -> None:
+        if self._heartbeat_handle:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+        for handle in self._retransmits.values():
+            handle.cancel()
+        self._retransmits.clear()
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+    def _send_raw(self, raw: bytes) -> None:
+        # Transports aren't thread-safe; GUI-thread sends hop onto the loop
+        call_soon(self._sendto, raw)
+
+    def _sendto(self, raw: bytes) -> None:
+        if self._transport:
+            self._transport.sendto(raw, self._game_addr)
+
+    def _tick(self) -> None:
+        if not self._running:
+            return
+        self._heartbeat()
+        self._heartbeat_handle = get_loop().call_later(UDP_PING_INTERVAL, self._tick)
+
+    def call_later(self, delay: float, fn: Callable[[], None]) -> None:
+        call_soon(get_loop().call_later, delay, fn)
+
+    def _schedule_retransmit(self, delay: float, seq: int) -> None:
+        # Resends are loop timers rather than the base class's timer thread
+        call_soon(self._call_later, delay, seq)
+
+    def _call_later(self, delay: float, seq: int) -> None:
+        if self._running:
+            handle = get_loop().call_later(delay, self._fire_retransmit, seq)
+            self._retransmits[seq] = handle
+
+    def _fire_retransmit(self, seq: int) -> None:
+        self._retransmits.pop(seq, None)
+        self._retransmit(seq)
+
+
+class AsyncWSClient(WSClient):
+    """WSClient over socketio.AsyncClient on the shared event loop.
+
+    Handlers are plain functions, so AsyncClient calls them on the loop
+    thread and they emit the same Qt signals as the threaded client.
+    """
+
+    _client_class = "AsyncClient"
+
+    def _start_connect(self) -> None:
+        run(self._connect(self._sio))
+
+    async def _connect(self, sio: socketio.AsyncClient) -> None:
+        try:
+            await asyncio.wait_for(
+                sio.connect(
+                    WS_URL,
+                    namespaces=[WS_NAMESPACE],
+                    auth={"steam_id": self._steam_id},
+                    wait_timeout=10,
+                ),
+                WS_CONNECT_TIMEOUT,
+            )
+        except Exception:
+            self.disconnected.emit()
+
+    def _close_client(self) -> None:
+        if self._sio:
+            run(self._sio.disconnect(), ASYNC_STOP_TIMEOUT)
+
+    def _send(self, event: str, data: dict) -> None:
+        # Emits are serialized on the loop; failures are logged, not raised
+        future = run(self._sio.emit(event, data, namespace=WS_NAMESPACE), WS_CONNECT_TIMEOUT)
+        future.add_done_callback(lambda f: f.cancelled() or f.exception() is None
+                                 or log.warning("Dropped %s to server: %s", event, f.exception()))
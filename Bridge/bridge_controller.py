@@ -5,21 +5,42 @@ signals. The controller owns the WSClient, UDPRelay, and session state.
 """
 
 import logging
-import threading
-
-import requests
+import sqlite3
 
 from PySide6.QtCore import QObject, Signal, QTimer
 
 import api_client
 import match_cache
+import task_pool
+from event_coalescer import EventCoalescer
+from poll_scheduler import PollScheduler
 from ws_client import WSClient
 from udp_relay import UDPRelay
-from config import QUEUE_POLL_INTERVAL, BRIDGE_VERSION
+from config import (
+    QUEUE_POLL_INTERVAL,
+    BRIDGE_VERSION,
+    MATCH_SYNC_PAGE_SIZE,
+    ACTIVE_FEED_SNAPSHOT_TIMEOUT,
+    ACTIVE_FEED_FINISHED_KEEP,
+    ACTIVE_MATCHES_FAST_INTERVAL,
+    ACTIVE_MATCHES_MAX_INTERVAL,
+    PLAYER_REFRESH_INTERVAL,
+    POLL_MAX_INTERVAL,
+    ASYNC_NETWORKING,
+    RELAY_FAST_PATH,
+)
 
 log = logging.getLogger(__name__)
 
 
+def _progress_field(data: dict, key: str) -> int:
+    """A non-negative whole number from a progress event, else ValueError."""
+    value = data.get(key, 0)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0 or value != int(value):
+        raise ValueError(key)
+    return int(value)
+
+
 class BridgeController(QObject):
     """Owns networking objects and session state. Bridges WS ↔ UDP."""
 
@@ -60,6 +81,7 @@ class BridgeController(QObject):
         self.steam_id: str = ""
         self.player_name: str = ""
         self.player_data: dict = {}
+        self._session_token = 0  # bumped on logout; background jobs check it
         self.in_queue: bool = False
         self.in_ban_phase: bool = False
         self.in_match: bool = False
@@ -75,13 +97,34 @@ class BridgeController(QObject):
         self._ws_intentional_disconnect: bool = False
 
         # Networking
-        self.ws = WSClient()
-        self.udp = UDPRelay()
+        if ASYNC_NETWORKING:
+            import async_core
+            self.ws, self.udp = async_core.create_transports()
+        else:
+            self.ws = WSClient()
+            self.udp = UDPRelay()
+
+        # Active matches feed: pushed over WS while subscribed, REST polling as fallback
+        self._watching_active: bool = False
+        self._feed_live: bool = False
+        self._feed_active: dict = {}    # match_id -> match
+        self._feed_finished: dict = {}  # match_id -> match, oldest first
+
+        self._last_polled_active: dict | None = None
+        self._active_poller = PollScheduler(
+            "active matches", self._poll_active_matches,
+            QUEUE_POLL_INTERVAL, ACTIVE_MATCHES_MAX_INTERVAL, ACTIVE_MATCHES_FAST_INTERVAL, self,
+        )
+        self._player_poller = PollScheduler(
+            "player data", self._poll_player_data,
+            PLAYER_REFRESH_INTERVAL, POLL_MAX_INTERVAL, parent=self,
+        )
 
-        # Active matches polling timer
-        self._poll_timer = QTimer(self)
-        self._poll_timer.setInterval(QUEUE_POLL_INTERVAL * 1000)
-        self._poll_timer.timeout.connect(self._poll_active_matches)
+        # Falls back to polling if the subscription isn't answered with a snapshot
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(ACTIVE_FEED_SNAPSHOT_TIMEOUT * 1000)
+        self._snapshot_timer.timeout.connect(self._on_snapshot_timeout)
 
         # Wire WS signals → controller signals + UDP relay
         self.ws.connected.connect(self._on_ws_connected)
@@ -97,24 +140,37 @@ class BridgeController(QObject):
         self.ws.do_seed_change.connect(self._on_ws_do_seed_change)
         self.ws.receive_draw_request.connect(self._on_ws_receive_draw_request)
         self.ws.postmatch_closed.connect(self._on_ws_postmatch_closed)
+        self.ws.active_matches_snapshot.connect(self._on_feed_snapshot)
+        self.ws.active_match_added.connect(self._on_feed_match_added)
+        self.ws.active_match_progress.connect(self._on_feed_match_progress)
+        self.ws.active_match_finished.connect(self._on_feed_match_finished)
 
         # Wire UDP signals → WS relay
         self.udp.game_queue_ready.connect(self._on_game_queue_ready)
         self.udp.game_queue_leave.connect(self._on_game_queue_leave)
         self.udp.game_ban.connect(self._on_game_ban)
-        self.udp.game_progress.connect(self._on_game_progress)
-        self.udp.game_death.connect(self._on_game_death)
-        self.udp.game_instant_restart.connect(self._on_game_instant_restart)
-        self.udp.game_completion.connect(self._on_game_completion)
         self.udp.game_connected.connect(self._on_game_connected)
         self.udp.game_disconnected.connect(self._on_game_disconnected)
         self.udp.game_version_received.connect(self._on_game_version_received)
         self.udp.game_send_chat.connect(self._on_game_send_chat)
-        self.udp.game_request_seed_change.connect(self._on_game_request_seed_change)
-        self.udp.game_request_draw.connect(self._on_game_request_draw)
-        self.udp.game_forfeit.connect(self._on_game_forfeit)
         self.udp.game_close_postmatch.connect(self._on_game_close_postmatch)
 
+        # Bursts of progress / death / restart are merged before reaching the WS
+        self._match_events = EventCoalescer(self._send_match_event, self.udp.call_later)
+
+        # Match events go to the WS straight from the UDP receive thread, or
+        # through the GUI thread like everything else when the fast path is off
+        if RELAY_FAST_PATH:
+            self.udp.set_fast_path(self._forward_match_event)
+        else:
+            self.udp.game_progress.connect(self._on_game_progress)
+            self.udp.game_death.connect(self._on_game_death)
+            self.udp.game_instant_restart.connect(self._on_game_instant_restart)
+            self.udp.game_completion.connect(self._on_game_completion)
+            self.udp.game_request_seed_change.connect(self._on_game_request_seed_change)
+            self.udp.game_request_draw.connect(self._on_game_request_draw)
+            self.udp.game_forfeit.connect(self._on_game_forfeit)
+
     # ---- Public API ----
 
     def login(self, steam_id: str) -> None:
@@ -156,7 +212,7 @@ class BridgeController(QObject):
                 log.error("Login failed: %s", e)
                 self.login_failed.emit(str(e))
 
-        threading.Thread(target=_do, daemon=True).start()
+        task_pool.submit(_do)
 
     def register(self, steam_id: str, player_name: str) -> None:
         """Create a new player account with the chosen name. Runs in background thread."""
@@ -175,31 +231,35 @@ class BridgeController(QObject):
             except Exception as e:
                 self.registration_failed.emit(str(e))
 
-        threading.Thread(target=_do, daemon=True).start()
+        task_pool.submit(_do)
 
     def start_networking(self) -> None:
         """Start UDP server and WS connection after login."""
         self._ws_intentional_disconnect = False
         self.udp.start()
         self.ws.connect_to_server(self.steam_id)
+        self._player_poller.start(immediate=False)
 
     def stop_networking(self) -> None:
         """Shut down all networking."""
         self._ws_intentional_disconnect = True
         self.stop_active_matches_polling()
+        self._player_poller.stop()
         self.ws.disconnect_from_server()
         self.udp.stop()
+        self._match_events.reset()
 
     def logout(self) -> None:
         """Leave queue if active, stop all networking, clear cache, and reset session state."""
         if self.in_queue:
-            steam_id = self.steam_id
-            threading.Thread(
-                target=lambda: api_client.queue_leave(steam_id),
-                daemon=True,
-            ).start()
+            task_pool.submit(api_client.queue_leave, self.steam_id)
         self.stop_networking()
-        match_cache.save_cached_matches([])
+        task_pool.cancel_group("session")
+        self._session_token += 1
+        try:
+            match_cache.clear()
+        except sqlite3.Error as e:
+            log.warning("Could not clear the match cache: %s", e)
         self.steam_id = ""
         self.player_name = ""
         self.player_data = {}
@@ -211,13 +271,31 @@ class BridgeController(QObject):
         self.match_opponent_elo = 0
 
     def start_active_matches_polling(self) -> None:
-        """Immediately poll active matches, then repeat every QUEUE_POLL_INTERVAL."""
-        self._poll_active_matches()
-        self._poll_timer.start()
+        """Start delivering active_matches_updated while the page is visible.
+
+        Subscribes to the server's pushed feed when the WS is up; polls
+        /matches/active (adaptive, from QUEUE_POLL_INTERVAL) only while it is not.
+        """
+        self._watching_active = True
+        # Recorded even while disconnected so WSClient subscribes on (re)connect
+        self.ws.subscribe_active_matches()
+        if self.ws.is_connected:
+            self._snapshot_timer.start()
+        else:
+            self._start_fallback_polling()
 
     def stop_active_matches_polling(self) -> None:
-        """Stop the active matches polling timer."""
-        self._poll_timer.stop()
+        """Stop the active matches feed and any fallback polling."""
+        self._watching_active = False
+        self._feed_live = False
+        self._snapshot_timer.stop()
+        self._active_poller.stop()
+        self.ws.unsubscribe_active_matches()
+
+    def pause_polling_while_hidden(self, window) -> None:
+        """Pause background polls while window is hidden or minimized."""
+        self._active_poller.pause_while_hidden(window)
+        self._player_poller.pause_while_hidden(window)
 
     def fetch_my_matches(self, offset: int = 0, limit: int = 10) -> list[dict]:
         """Fetch player's matches. Returns cached + server data."""
@@ -247,42 +325,184 @@ class BridgeController(QObject):
                     self.player_data_refreshed.emit(data)
             except Exception:
                 pass
-        threading.Thread(target=_do, daemon=True).start()
+        task_pool.submit(_do, key="player_data", group="session")
+
+    def _poll_player_data(self) -> None:
+        """Scheduled refresh; only emits when the data actually changed."""
+        def _do():
+            try:
+                data = api_client.login(self.steam_id)
+                changed = not data.get("new_player") and data != self.player_data
+                if changed:
+                    self.player_data = data
+                    self.player_data_refreshed.emit(data)
+                self._player_poller.report_result(changed)
+            except Exception as e:
+                log.error("Failed to refresh player data: %s", e)
+                self._player_poller.report_error()
+        task_pool.submit(_do, group="session")
 
     def initialize_match_cache(self) -> None:
-        """On first login, fetch all player matches and populate cache."""
-        cached = match_cache.load_cached_matches()
-        if cached:
-            return  # Cache already populated
+        """Bring the local match cache up to date with the server.
+
+        Runs in a background thread and persists every page as it arrives:
+          1. Forward sync — page from the newest match until reaching the
+             high-water mark (newest cached match_id). The mark and the
+             offset reached are kept in the cache's meta table, so an
+             interrupted sync resumes from the same page toward the same
+             target instead of starting over at the head.
+          2. Backfill — until the server has returned every older match,
+             continue from offset = number of cached matches.
+        Returning players with a complete cache fetch a single page.
+
+        The job stops at the next page once its player logs out (or another
+        logs in); cancel_group can't stop a job that's already running.
+        """
+        steam_id, token = self.steam_id, self._session_token
+
+        def _current() -> bool:
+            if self.steam_id != steam_id or self._session_token != token:
+                log.info("Match cache sync for %s abandoned (session ended)", steam_id)
+                return False
+            return True
+
+        def _forward(floor: str, offset: int) -> bool:
+            """Page down from offset until reaching floor; False if abandoned.
+
+            The offset reached is saved after every page so an interrupted
+            walk resumes there. Matches played meanwhile only push old pages
+            further back, so resuming re-reads a few cached rows but skips none.
+            """
+            match_cache.set_meta("sync_floor", floor, owner=steam_id)
+            while True:
+                if not _current():
+                    return False
+                batch = api_client.get_matches(
+                    player_id=steam_id, offset=offset, limit=MATCH_SYNC_PAGE_SIZE
+                )
+                if not _current():
+                    return False
+                ids = [str(m.get("match_id")) for m in batch]
+                if floor in ids:
+                    match_cache.append_matches(batch[:ids.index(floor)], owner=steam_id)
+                    break
+                match_cache.append_matches(batch, owner=steam_id)
+                if len(batch) < MATCH_SYNC_PAGE_SIZE:
+                    break
+                offset += len(batch)
+                match_cache.set_meta("sync_offset", str(offset), owner=steam_id)
+            match_cache.set_meta("sync_offset", None, owner=steam_id)
+            match_cache.set_meta("sync_floor", None, owner=steam_id)
+            return True
 
         def _do():
             try:
-                offset = 0
-                all_matches = []
-                while True:
-                    batch = api_client.get_matches(
-                        player_id=self.steam_id, offset=offset, limit=100
-                    )
-                    if not batch:
-                        break
-                    all_matches.extend(batch)
-                    offset += len(batch)
-                match_cache.save_cached_matches(all_matches)
-            except Exception:
-                pass
+                if not _current():
+                    return
+                if not match_cache.claim(steam_id):
+                    # Left behind by another player
+                    match_cache.clear()
+                    match_cache.set_meta("owner", steam_id)
+
+                floor = match_cache.get_meta("sync_floor") or match_cache.newest_match_id()
+                if floor is not None:
+                    offset = int(match_cache.get_meta("sync_offset") or 0)
+                    if not _forward(floor, offset):
+                        return
+                    if offset:
+                        # The resumed walk's target predates anything played
+                        # since; one more walk from the head picks that up
+                        if not _forward(match_cache.newest_match_id(), 0):
+                            return
+                    log.info("Match cache forward sync complete")
+
+                if match_cache.get_meta("backfill_complete") != "1":
+                    offset = match_cache.count()
+                    while True:
+                        if not _current():
+                            return
+                        batch = api_client.get_matches(
+                            player_id=steam_id, offset=offset, limit=MATCH_SYNC_PAGE_SIZE
+                        )
+                        if not _current():
+                            return
+                        match_cache.append_matches(batch, owner=steam_id)
+                        if len(batch) < MATCH_SYNC_PAGE_SIZE:
+                            break
+                        offset += len(batch)
+                    match_cache.set_meta("backfill_complete", "1", owner=steam_id)
+                    log.info("Match cache backfill complete (%d matches)", match_cache.count())
+            except Exception as e:
+                log.error("Match cache sync failed: %s", e)
+
+        # Keyed per session so a new login never coalesces onto the previous
+        # session's sync that is still winding down
+        task_pool.submit(_do, key=("match_cache_sync", steam_id, token), group="session")
+
+    # ---- Active matches feed ----
+
+    def _start_fallback_polling(self) -> None:
+        self._active_poller.start()
+
+    def _on_snapshot_timeout(self) -> None:
+        if self._watching_active and not self._feed_live:
+            log.warning("No active matches snapshot over WS — polling instead")
+            self._start_fallback_polling()
+
+    def _emit_active_feed(self) -> None:
+        self.active_matches_updated.emit({
+            "active_matches": list(self._feed_active.values()),
+            "recently_finished": list(self._feed_finished.values()),
+        })
 
-        threading.Thread(target=_do, daemon=True).start()
+    def _on_feed_snapshot(self, data: dict) -> None:
+        if not self._watching_active:
+            return
+        self._feed_live = True
+        self._snapshot_timer.stop()
+        self._active_poller.stop()
+        self._feed_active = {m["match_id"]: m for m in data.get("active_matches", [])}
+        self._feed_finished = {m["match_id"]: m for m in data.get("recently_finished", [])}
+        self._emit_active_feed()
+
+    def _on_feed_match_added(self, match: dict) -> None:
+        if not self._feed_live:
+            return
+        self._feed_active[match["match_id"]] = match
+        self._emit_active_feed()
 
-    # ---- Active matches polling ----
+    def _on_feed_match_progress(self, delta: dict) -> None:
+        if not self._feed_live:
+            return
+        match = self._feed_active.get(delta.get("match_id"))
+        if match is None:
+            return
+        self._feed_active[match["match_id"]] = {**match, **delta}
+        self._emit_active_feed()
+
+    def _on_feed_match_finished(self, data: dict) -> None:
+        if not self._feed_live:
+            return
+        mid = data.get("match_id")
+        match = self._feed_active.pop(mid, {})
+        self._feed_finished[mid] = {**match, **data}
+        while len(self._feed_finished) > ACTIVE_FEED_FINISHED_KEEP:
+            del self._feed_finished[next(iter(self._feed_finished))]
+        self._emit_active_feed()
 
     def _poll_active_matches(self) -> None:
         def _do():
             try:
                 data = api_client.get_active_matches()
+                changed = data != self._last_polled_active
+                self._last_polled_active = data
                 self.active_matches_updated.emit(data)
+                # Poll faster while there are live matches on screen
+                self._active_poller.report_result(changed, fast=bool(data.get("active_matches")))
             except Exception as e:
                 log.error("Failed to poll active matches: %s", e)
-        threading.Thread(target=_do, daemon=True).start()
+                self._active_poller.report_error()
+        task_pool.submit(_do, key="active_matches", group="session")
 
     # ---- WS connect/disconnect ----
 
@@ -296,7 +516,7 @@ class BridgeController(QObject):
                 try:
                     api_client.queue_join(steam_id)
                     log.info("Re-queue join succeeded for %s", steam_id)
-                except requests.HTTPError as e:
+                except api_client.HTTPError as e:
                     if e.response is not None and e.response.status_code == 403:
                         log.warning("Re-queue join rejected — player is banned: %s", steam_id)
                         self.in_queue = False
@@ -305,11 +525,18 @@ class BridgeController(QObject):
                         log.error("Re-queue join failed: %s", e)
                 except Exception as e:
                     log.error("Re-queue join failed: %s", e)
-            threading.Thread(target=_rejoin, daemon=True).start()
+            task_pool.submit(_rejoin)
+        # WSClient re-subscribes on connect; wait for its snapshot before dropping polling
+        if self._watching_active and not self._feed_live:
+            self._snapshot_timer.start()
         self.ws_connected.emit()
 
     def _on_ws_disconnected(self) -> None:
         log.warning("WebSocket disconnected from server (intentional=%s)", self._ws_intentional_disconnect)
+        if self._watching_active:
+            self._feed_live = False
+            self._snapshot_timer.stop()
+            self._start_fallback_polling()
         self.ws_disconnected.emit()
         # Issue 4: reconnect automatically if this wasn't a deliberate shutdown
         if self.steam_id and not self._ws_intentional_disconnect:
@@ -348,7 +575,7 @@ class BridgeController(QObject):
                 log.info("Queue join succeeded for %s", self.steam_id)
                 self.in_queue = True
                 self.queue_joined.emit()
-            except requests.HTTPError as e:
+            except api_client.HTTPError as e:
                 if e.response is not None and e.response.status_code == 403:
                     log.warning("Queue join rejected — player is banned: %s", self.steam_id)
                     self.udp.send_to_game({"event": "is_banned"})
@@ -356,7 +583,7 @@ class BridgeController(QObject):
                     log.error("Queue join failed: %s", e)
             except Exception as e:
                 log.error("Queue join failed: %s", e)
-        threading.Thread(target=_do, daemon=True).start()
+        task_pool.submit(_do)
 
     def _on_game_queue_leave(self) -> None:
         self._leave_queue()
@@ -381,32 +608,76 @@ class BridgeController(QObject):
                 self.queue_left.emit()
             except Exception as e:
                 log.error("Queue leave failed: %s", e)
-        threading.Thread(target=_do, daemon=True).start()
+        task_pool.submit(_do)
 
     def _on_game_ban(self, category: str) -> None:
         if not self.in_ban_phase:
             return
         self.ws.send_ban(category)
 
+    # Queued path for match events (RELAY_FAST_PATH off)
+
     def _on_game_progress(self, area: int, level: int, theme: int) -> None:
-        if not self.in_match:
-            return
-        self.ws.send_progress(area, level, theme)
+        self._forward_match_event("progress", {"area": area, "level": level, "theme": theme})
 
     def _on_game_death(self) -> None:
-        if not self.in_match:
-            return
-        self.ws.send_death()
+        self._forward_match_event("death", {})
 
     def _on_game_instant_restart(self) -> None:
-        if not self.in_match:
-            return
-        self.ws.send_instant_restart()
+        self._forward_match_event("instant_restart", {})
 
     def _on_game_completion(self) -> None:
+        self._forward_match_event("completion", {})
+
+    def _forward_match_event(self, event: str, data: dict) -> bool:
+        """Validate a match event and pass it on through the coalescer.
+
+        On the fast path this runs on the UDP receive thread. in_match is
+        read without a lock; it only flips on WS events, and an event
+        racing the flip was equally racy on the queued path.
+        """
         if not self.in_match:
-            return
-        self.ws.send_completion()
+            return False
+        if event == "progress":
+            try:
+                area, level, theme = (_progress_field(data, key) for key in ("area", "level", "theme"))
+            except ValueError:
+                log.warning("Dropped malformed progress event: %s", data)
+                return False
+            data = {"area": area, "level": level, "theme": theme}
+        self._match_events.submit(event, data)
+        return True
+
+    def _send_match_event(self, event: str, data: dict) -> None:
+        """Coalescer output: emit one match event on the WS."""
+        if event == "progress":
+            self.ws.send_progress(data["area"], data["level"], data["theme"])
+        elif event == "death":
+            self.ws.send_death()
+        elif event == "instant_restart":
+            self.ws.send_instant_restart()
+        elif event == "completion":
+            self.ws.send_completion()
+        elif event == "request_seed_change":
+            self.ws.send_request_seed_change()
+        elif event == "request_draw":
+            self.ws.send_request_draw()
+        elif event == "forfeit":
+            self.ws.send_forfeit()
+
+    def relay_latency_stats(self) -> dict:
+        """Game -> WS relay latency over recent match events (fast path only)."""
+        return self.udp.relay_latency.summary()
+
+    def _log_relay_latency(self) -> None:
+        stats = self.udp.relay_latency.summary()
+        if stats["count"]:
+            log.info("Relay latency over %d events: p50 %.2f ms, p99 %.2f ms, max %.2f ms",
+                     stats["count"], stats["p50_ms"], stats["p99_ms"], stats["max_ms"])
+        self.udp.relay_latency.clear()
+        coalesced = self._match_events.stats()
+        if coalesced["saved"]:
+            log.info("Coalesced %d match events into %d emits", coalesced["events"], coalesced["emits"])
 
     # ---- Server → Game relay (WS events forwarded to UDP) ----
 
@@ -427,6 +698,7 @@ class BridgeController(QObject):
     def _on_ws_match_start(self, data: dict) -> None:
         log.info("WS: match_start — category=%s seed=%s", data.get("category"), data.get("seed"))
         self.in_ban_phase = False
+        self._match_events.reset()
         self.in_match = True
         self.match_category = data.get("category", "")
         # Critical message — retry until ack
@@ -441,6 +713,7 @@ class BridgeController(QObject):
         log.info("WS: match_result — result=%s elo_change=%s", data.get("result"), data.get("elo_change"))
         self.in_match = False
         self.in_ban_phase = False
+        self._log_relay_latency()
         # Send the result string and elo change to the Game, not the full match record
         self.udp.send_critical({
             "event": "match_result",
@@ -450,7 +723,11 @@ class BridgeController(QObject):
         # Cache the match
         match_data = data.get("match_data")
         if match_data:
-            match_cache.append_match(match_data)
+            try:
+                match_cache.append_match(match_data)
+            except sqlite3.Error as e:
+                # The next sync picks it up from the server
+                log.warning("Could not cache match: %s", e)
         # Refresh player data after match completes
         self.refresh_player_data()
         self.match_result.emit(data)
@@ -458,6 +735,7 @@ class BridgeController(QObject):
     def _on_ws_match_scrapped(self) -> None:
         self.in_match = False
         self.in_ban_phase = False
+        self._log_relay_latency()
         self.udp.send_to_game({"event": "match_scrapped"})
         self.match_scrapped.emit()
 
@@ -468,19 +746,13 @@ class BridgeController(QObject):
         self.udp.send_to_game({"event": "receive_chat", "message": message, "sender_name": sender_name})
 
     def _on_game_request_seed_change(self) -> None:
-        if not self.in_match:
-            return
-        self.ws.send_request_seed_change()
+        self._forward_match_event("request_seed_change", {})
 
     def _on_game_request_draw(self) -> None:
-        if not self.in_match:
-            return
-        self.ws.send_request_draw()
+        self._forward_match_event("request_draw", {})
 
     def _on_game_forfeit(self) -> None:
-        if not self.in_match:
-            return
-        self.ws.send_forfeit()
+        self._forward_match_event("forfeit", {})
 
     def _on_game_close_postmatch(self) -> None:
         self.ws.send_close_postmatch()
@@ -10,6 +10,28 @@ BRIDGE_VERSION = 1.02
 SERVER_URL = os.environ.get("SPEEDRUN_SERVER_URL", "http://140.82.40.6:5000")
 WS_URL = os.environ.get("SPEEDRUN_WS_URL", "http://140.82.40.6:5000")
 WS_NAMESPACE = "/ws/match"
+WS_CONNECT_TIMEOUT = 15      # seconds for the whole connect handshake (async core)
+
+# Run the UDP relay and WS client on one asyncio loop thread (see async_core.py)
+ASYNC_NETWORKING = os.environ.get("SPEEDRUN_ASYNC_NETWORKING", "") == "1"
+ASYNC_STOP_TIMEOUT = 2       # seconds stop() waits for the loop to close sockets
+
+# HTTP (api_client)
+HTTP_POOL_SIZE = 8           # keep-alive connections held open to the server
+HTTP_RETRY_TOTAL = 3         # retries for idempotent GETs
+HTTP_RETRY_BACKOFF = 0.3     # seconds; doubles on each retry
+# Per-endpoint request timeouts in seconds, keyed by path
+HTTP_TIMEOUTS = {
+    "default": 10,
+    "/version": 5,
+    "/matches/active": 5,
+    "/queue/join": 10,
+    "/queue/leave": 10,
+    "/matches": 15,
+    "/leaderboard": 15,
+    "/leaderboard/fastest": 15,
+}
+HTTP_CACHE_TTL = 30          # seconds a cached leaderboard/fastest response is reused without asking
 
 # UDP — both sides listen on known ports
 UDP_HOST = "127.0.0.1"
@@ -17,13 +39,29 @@ GAME_UDP_PORT = 21587
 BRIDGE_UDP_PORT = 21588
 UDP_BUFFER_SIZE = 4096
 
+# Shared worker pool for HTTP calls and cache reads (see task_pool.py)
+TASK_POOL_WORKERS = 6
+
 # Timing (seconds)
-QUEUE_POLL_INTERVAL = 15  # seconds between /matches/active polls
+QUEUE_POLL_INTERVAL = 15  # seconds between /matches/active polls (fallback when the WS feed is down)
+ACTIVE_FEED_SNAPSHOT_TIMEOUT = 5  # seconds to wait for the WS snapshot before falling back to polling
+ACTIVE_FEED_FINISHED_KEEP = 20    # recently finished matches kept in the pushed feed
+ACTIVE_MATCHES_FAST_INTERVAL = 5  # fallback poll interval while watched matches are live
+ACTIVE_MATCHES_MAX_INTERVAL = 60  # fallback poll backoff ceiling, so new matches still show up
+LEADERBOARD_REFRESH_INTERVAL = 60  # seconds between leaderboard refreshes while it is shown
+PLAYER_REFRESH_INTERVAL = 60       # seconds between background player data refreshes
+POLL_MAX_INTERVAL = 300   # ceiling for poll backoff on errors / unchanged data
+POLL_JITTER = 0.2         # +/- fraction applied to every poll delay
 FINISHED_MATCH_DISPLAY_SECONDS = 60  # seconds to show finished matches on active page
 UDP_PING_INTERVAL = 2.5   # seconds between pings to Game
 UDP_PONG_TIMEOUT = 5.0     # seconds before considering Game disconnected
-UDP_RETRY_INTERVAL = 0.5   # seconds between critical message retries
-UDP_RETRY_MAX = 5           # max retry attempts for critical messages
+UDP_RETRY_INTERVAL = 0.5   # seconds before the first critical message resend
+UDP_RETRY_BACKOFF = 1.5     # each further resend waits this much longer
+UDP_RETRY_MAX_INTERVAL = 2.0  # cap on the wait between resends
+UDP_RETRY_MAX = 5           # max sends of a critical message
+RELAY_FAST_PATH = True      # relay match events to the WS from the UDP thread (see UDPRelay.set_fast_path)
+RELAY_LATENCY_WINDOW = 500  # recent relay latencies kept for stats
+RELAY_COALESCE_WINDOW = 0.25  # seconds; a progress burst within it becomes one emit of the latest state
 
 # Local file storage — relative to executable for PyInstaller
 if getattr(sys, "frozen", False):
@@ -32,10 +70,21 @@ if getattr(sys, "frozen", False):
 else:
     _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     _BUNDLE_DIR = _BASE_DIR
+# Settings, match cache and bridge.log can be redirected (e.g. by tools/bench_startup.py)
+_BASE_DIR = os.environ.get("SPEEDRUN_DATA_DIR") or _BASE_DIR
 
-MATCH_CACHE_PATH = os.path.join(_BASE_DIR, "match_cache.json")
+MATCH_CACHE_PATH = os.path.join(_BASE_DIR, "match_cache.json")  # legacy, migrated on first open
+MATCH_CACHE_DB_PATH = os.path.join(_BASE_DIR, "match_cache.db")
+MATCH_CACHE_BUSY_TIMEOUT = 5.0  # seconds to wait on a lock held by another Bridge before failing
+MATCH_SYNC_PAGE_SIZE = 100  # matches per /matches request during cache sync
 SETTINGS_PATH = os.path.join(_BASE_DIR, "settings.json")
+SETTINGS_SAVE_DELAY = 1.0  # seconds; settings changes within it are written once
 ASSETS_DIR = os.path.join(_BUNDLE_DIR, "assets")
+LOG_PATH = os.path.join(_BASE_DIR, "bridge.log")
+
+# When set, the startup timeline is also written here as JSON and the
+# Bridge quits once the login screen is ready (see startup_timeline.py)
+STARTUP_REPORT_PATH = os.environ.get("SPEEDRUN_STARTUP_REPORT", "")
 
 # Default settings
 DEFAULT_OVERLAY_COLOR = "#00FF00"
@@ -107,6 +156,7 @@ RANK_COLORS = {
     "cosmic": "#5c40db",
 }
 COSMIC_GRADIENT = ("5c40db", "4061db")  # for QSS gradient stops
+COSMIC_PIXMAP_CACHE_BYTES = 4 * 1024 * 1024  # budget for memoized gradient name pixmaps
 
 # Spelunky 2 theme IDs → display names
 # Theme IDs match state.theme from the game engine
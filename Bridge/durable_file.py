@@ -0,0 +1,71 @@
+"""Crash-safe writes and validated reads for small JSON files (settings.json).
+
+write_json never leaves a half-written file at path: the data goes to a
+temp file that is fsynced and then renamed over path, and the previous
+version is kept as path + ".bak". read_json falls back to that backup when
+path is missing, truncated, unparsable or fails validation.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable
+
+log = logging.getLogger(__name__)
+
+
+def _write_bytes(f, data: bytes) -> None:
+    f.write(data)
+
+
+def _fsync_dir(path: str) -> None:
+    # Makes the renames themselves durable; not possible (or needed) on Windows
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_json(path: str, data: Any, indent: int | None = 2) -> None:
+    """Atomically replace path with data as JSON, rotating the old file to .bak."""
+    payload = json.dumps(data, indent=indent).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        _write_bytes(f, payload)
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.exists(path):
+        os.replace(path, path + ".bak")
+    os.replace(tmp_path, path)
+    _fsync_dir(path)
+
+
+def _read(path: str, validate: Callable[[Any], bool] | None) -> Any:
+    with open(path, "rb") as f:
+        data = json.loads(f.read().decode("utf-8"))
+    if validate is not None and not validate(data):
+        raise ValueError("failed validation")
+    return data
+
+
+def read_json(path: str, default: Any = None, validate: Callable[[Any], bool] | None = None) -> Any:
+    """Load path, falling back to path + ".bak", then to default.
+
+    A file counts as bad if it can't be read or parsed, or if validate
+    returns False for it.
+    """
+    for candidate in (path, path + ".bak"):
+        if not os.path.exists(candidate):
+            continue
+        try:
+            data = _read(candidate, validate)
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable %s: %s", candidate, e)
+            continue
+        if candidate != path:
+            log.warning("Recovered %s from its backup", path)
+        return data
+    return default
@@ -0,0 +1,100 @@
+"""Coalescing of bursty Game -> server match events.
+
+Restart spam and death/reset sequences make the Game send several
+progress events within a few frames (the warp back to a checkpoint), and
+each one becomes a WS emit, an opponent_progress fan-out and an overlay
+update on the other side. EventCoalescer throttles progress per window:
+
+  - progress that hasn't been sent within the last window goes out at
+    once, so a lone level transition isn't delayed
+  - further progress within the window is held, keeping only the latest
+    state, and sent when the window ends (which restarts the window
+    while the burst lasts)
+  - every other event (death, instant_restart, completion, ...) is sent
+    at once, one emit per event, after whatever progress is held, so
+    nothing is reordered ahead of earlier events
+
+death / instant_restart are deliberately not merged: the server counts
+one per event, so merging them would need a server-side change.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from config import RELAY_COALESCE_WINDOW
+
+COALESCABLE = frozenset({"progress"})
+
+
+class EventCoalescer:
+    """Throttles match events on their way to send(event, data).
+
+    call_later(delay, fn) must run fn on some thread after delay seconds.
+    submit() may be called from any thread; send is always called with the
+    internal lock held, so events go out in a single total order.
+    """
+
+    def __init__(self, send: Callable[[str, dict], None],
+                 call_later: Callable[[float, Callable[[], None]], None],
+                 window: float = RELAY_COALESCE_WINDOW):
+        self._send = send
+        self._call_later = call_later
+        self._window = window
+        self._lock = threading.Lock()
+        self._held: OrderedDict[str, dict] = OrderedDict()  # event -> latest data
+        self._open: set[str] = set()  # kinds sent within the last window
+        self._generation = 0  # stale window timers are ignored after reset()
+        self._stats = {"events": 0, "emits": 0}
+
+    def submit(self, event: str, data: dict) -> None:
+        with self._lock:
+            self._stats["events"] += 1
+            if event in self._open:
+                self._held[event] = data
+                self._held.move_to_end(event)
+                return
+            self._flush_locked()
+            self._emit_locked(event, data)
+            if event in COALESCABLE:
+                self._open_window_locked(event)
+
+    def reset(self) -> None:
+        """Drop anything held and zero the stats (e.g. when a match starts)."""
+        with self._lock:
+            self._held.clear()
+            self._open.clear()
+            self._generation += 1
+            self._stats = {"events": 0, "emits": 0}
+
+    def stats(self) -> dict:
+        """events submitted, emits sent, and emits saved by coalescing."""
+        with self._lock:
+            return {**self._stats, "saved": self._stats["events"] - self._stats["emits"]}
+
+    # ---- internals (lock held) ----
+
+    def _emit_locked(self, event: str, data: dict) -> None:
+        self._stats["emits"] += 1
+        self._send(event, data)
+
+    def _flush_locked(self) -> None:
+        while self._held:
+            event, data = self._held.popitem(last=False)
+            self._emit_locked(event, data)
+            if event not in self._open:
+                self._open_window_locked(event)
+
+    def _open_window_locked(self, event: str) -> None:
+        self._open.add(event)
+        generation = self._generation
+        self._call_later(self._window, lambda: self._on_window_end(event, generation))
+
+    def _on_window_end(self, event: str, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._open.discard(event)
+            if event in self._held:
+                # Still bursting: send what's held, which restarts the window
+                self._flush_locked()
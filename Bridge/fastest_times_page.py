@@ -1,8 +1,10 @@
-"""Fastest Times page showing global top 3 records per category."""
+"""Fastest Times page showing global top 3 records per category.
 
-import threading
+Each category keeps one section widget for the life of the page; new data
+is diffed against it and only changed records are updated in place.
+"""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -13,20 +15,162 @@ from PySide6.QtWidgets import (
 )
 
 import api_client
-from rank_utils import create_rank_icon, apply_rank_label_style
+import task_pool
+from rank_utils import create_rank_icon, apply_rank_label_style, get_rank_pixmap
 from config import CLR_WIDGET_BG, CLR_BUTTON_BG, CLR_TEXT, CLR_TEXT_BRIGHT, CLR_ACTIVE_BTN, format_time
 
 
+def _rank_style(rank: int) -> str:
+    if rank == 1:
+        return "color: #ffd700; font-size: 24px; font-weight: bold;"
+    elif rank == 2:
+        return "color: #c0c0c0; font-size: 24px; font-weight: bold;"
+    elif rank == 3:
+        return "color: #cd7f32; font-size: 24px; font-weight: bold;"
+    return f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold;"
+
+
+def _make_separator() -> QFrame:
+    sep = QFrame()
+    sep.setFixedHeight(1)
+    sep.setStyleSheet(f"background-color: {CLR_BUTTON_BG};")
+    return sep
+
+
+class _RecordRow(QWidget):
+    """One record: position, rank icon + name, completion time."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entry: dict | None = None
+        self.setStyleSheet("background: transparent;")
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(16, 10, 16, 10)
+
+        self._rank_label = QLabel()
+        self._rank_label.setFixedWidth(30)
+        self._rank_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._rank_label)
+
+        # Rank icon adjacent to player name
+        self._icon = create_rank_icon(0, size=24)
+        layout.addWidget(self._icon)
+
+        self._name_label = QLabel()
+        layout.addWidget(self._name_label, stretch=1)
+
+        self._time_label = QLabel()
+        self._time_label.setFixedWidth(140)
+        self._time_label.setAlignment(Qt.AlignCenter)
+        self._time_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold;")
+        layout.addWidget(self._time_label)
+
+    def set_entry(self, entry: dict) -> None:
+        """Update only the labels whose fields differ from the last entry."""
+        old = self._entry or {}
+        if entry == old:
+            return
+        self._entry = entry
+
+        rank = entry.get("rank", 0)
+        if not old or rank != old.get("rank"):
+            self._rank_label.setText(f"{rank}.")
+            self._rank_label.setStyleSheet(_rank_style(rank))
+
+        elo = entry.get("elo", 0)
+        name = entry.get("player_name", "Unknown")
+        if not old or elo != old.get("elo", 0):
+            pixmap = get_rank_pixmap(elo, 24)
+            if not pixmap.isNull():
+                self._icon.setPixmap(pixmap)
+        if not old or elo != old.get("elo", 0) or name != old.get("player_name", "Unknown"):
+            self._name_label.setText(name)
+            apply_rank_label_style(self._name_label, elo, 24)
+
+        completion_time = entry.get("completion_time", 0)
+        if not old or completion_time != old.get("completion_time", 0):
+            self._time_label.setText(format_time(completion_time))
+
+
+class _CategorySection(QWidget):
+    """Category header bar + records container, reused across refreshes."""
+
+    def __init__(self, category: str, parent=None):
+        super().__init__(parent)
+        self._records: list | None = None
+        self._rows: list[_RecordRow] = []
+        self._separators: list[QFrame] = []
+
+        section_layout = QVBoxLayout(self)
+        section_layout.setContentsMargins(0, 0, 0, 0)
+        section_layout.setSpacing(0)
+
+        # Category header bar (like leaderboard header)
+        header_bar = QFrame()
+        header_bar.setStyleSheet(
+            f"QFrame {{ background-color: {CLR_BUTTON_BG}; "
+            f"border-top-left-radius: 4px; border-top-right-radius: 4px; }}"
+        )
+        header_layout = QHBoxLayout(header_bar)
+        header_layout.setContentsMargins(16, 10, 16, 10)
+
+        cat_label = QLabel(category)
+        cat_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 28px; font-weight: bold;")
+        header_layout.addWidget(cat_label)
+        header_layout.addStretch()
+
+        section_layout.addWidget(header_bar)
+
+        # Records container (bordered, linked to header)
+        records_frame = QFrame()
+        records_frame.setStyleSheet(
+            f"QFrame {{ background-color: {CLR_WIDGET_BG}; "
+            f"border-bottom-left-radius: 4px; border-bottom-right-radius: 4px; }}"
+        )
+        self._records_layout = QVBoxLayout(records_frame)
+        self._records_layout.setContentsMargins(0, 0, 0, 0)
+        self._records_layout.setSpacing(0)
+
+        self._empty_label = QLabel("  No records yet")
+        self._empty_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold; padding: 12px 16px;")
+        self._records_layout.addWidget(self._empty_label)
+
+        section_layout.addWidget(records_frame)
+
+    def set_records(self, records: list) -> None:
+        """Grow or shrink the row list to fit records and update rows in place."""
+        if records == self._records:
+            return
+        self._records = records
+
+        # Rows alternate with separators (none after the last row)
+        while len(self._rows) < len(records):
+            if self._rows:
+                sep = _make_separator()
+                self._separators.append(sep)
+                self._records_layout.addWidget(sep)
+            row = _RecordRow()
+            self._rows.append(row)
+            self._records_layout.addWidget(row)
+        while len(self._rows) > len(records):
+            self._rows.pop().deleteLater()
+            if self._separators:
+                self._separators.pop().deleteLater()
+
+        for row, entry in zip(self._rows, records):
+            row.set_entry(entry)
+        self._empty_label.setVisible(not records)
+
+
 class FastestTimesPage(QWidget):
     """Global fastest completion times per category."""
 
-    _data_loaded = Signal(object)
-
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self._controller = controller
+        self._data: dict | None = None  # last data rendered
+        self._sections: dict[str, _CategorySection] = {}
         self._setup_ui()
-        self._data_loaded.connect(self._populate_data)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -68,127 +212,45 @@ class FastestTimesPage(QWidget):
         super().showEvent(event)
         self._fetch_data()
 
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        task_pool.cancel_group("fastest_times_page")
+
     def _fetch_data(self):
         self._loading_label.show()
+        task_pool.submit(
+            api_client.get_fastest_times, key="fastest_times", group="fastest_times_page",
+            on_result=self._populate_data, on_error=self._on_data_error,
+        )
 
-        def _do():
-            try:
-                data = api_client.get_fastest_times()
-                self._data_loaded.emit(data)
-            except Exception:
-                self._data_loaded.emit({})
-
-        threading.Thread(target=_do, daemon=True).start()
+    def _on_data_error(self, error: Exception):
+        # Keep showing the last good times; only a first load falls back to empty
+        self._populate_data(self._data if self._data is not None else {})
 
     def _populate_data(self, data: dict):
         self._loading_label.hide()
 
-        # Save scroll position before clearing
-        saved_scroll = self._scroll.verticalScrollBar().value()
-
-        # Clear existing widgets (except trailing stretch)
-        while self._list_layout.count() > 1:
-            item = self._list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for category, records in data.items():
-            section = self._create_category_section(category, records)
-            self._list_layout.insertWidget(self._list_layout.count() - 1, section)
-
-        # Delay scroll restore to let deleteLater() and layout fully settle
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(50, lambda sv=saved_scroll: self._scroll.verticalScrollBar().setValue(sv))
-
-    def _create_category_section(self, category: str, records: list) -> QWidget:
-        """Create a category section with header bar + records container."""
-        section = QWidget()
-        section_layout = QVBoxLayout(section)
-        section_layout.setContentsMargins(0, 0, 0, 0)
-        section_layout.setSpacing(0)
-
-        # Category header bar (like leaderboard header)
-        header_bar = QFrame()
-        header_bar.setStyleSheet(
-            f"QFrame {{ background-color: {CLR_BUTTON_BG}; "
-            f"border-top-left-radius: 4px; border-top-right-radius: 4px; }}"
-        )
-        header_layout = QHBoxLayout(header_bar)
-        header_layout.setContentsMargins(16, 10, 16, 10)
-
-        cat_label = QLabel(category)
-        cat_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 28px; font-weight: bold;")
-        header_layout.addWidget(cat_label)
-        header_layout.addStretch()
-
-        section_layout.addWidget(header_bar)
-
-        # Records container (bordered, linked to header)
-        records_frame = QFrame()
-        records_frame.setStyleSheet(
-            f"QFrame {{ background-color: {CLR_WIDGET_BG}; "
-            f"border-bottom-left-radius: 4px; border-bottom-right-radius: 4px; }}"
-        )
-        records_layout = QVBoxLayout(records_frame)
-        records_layout.setContentsMargins(0, 0, 0, 0)
-        records_layout.setSpacing(0)
-
-        if not records:
-            empty = QLabel("  No records yet")
-            empty.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold; padding: 12px 16px;")
-            records_layout.addWidget(empty)
-        else:
-            for i, entry in enumerate(records):
-                row = self._create_record_row(entry)
-                records_layout.addWidget(row)
-                # Add separator between rows (not after last)
-                if i < len(records) - 1:
-                    sep = QFrame()
-                    sep.setFixedHeight(1)
-                    sep.setStyleSheet(f"background-color: {CLR_BUTTON_BG};")
-                    records_layout.addWidget(sep)
-
-        section_layout.addWidget(records_frame)
-        return section
-
-    def _create_record_row(self, entry: dict) -> QWidget:
-        row = QWidget()
-        row.setStyleSheet("background: transparent;")
-        layout = QHBoxLayout(row)
-        layout.setContentsMargins(16, 10, 16, 10)
-
-        rank = entry.get("rank", 0)
-        rank_label = QLabel(f"{rank}.")
-        rank_label.setFixedWidth(30)
-        rank_label.setAlignment(Qt.AlignCenter)
-        rank_label.setStyleSheet(self._rank_style(rank))
-        layout.addWidget(rank_label)
-
-        # Rank icon adjacent to player name
-        elo = entry.get("elo", 0)
-        icon = create_rank_icon(elo, size=24)
-        layout.addWidget(icon)
-
-        name = entry.get("player_name", "Unknown")
-        name_label = QLabel(name)
-        apply_rank_label_style(name_label, elo, 24)
-        layout.addWidget(name_label, stretch=1)
-
-        time_label = QLabel(format_time(entry.get("completion_time", 0)))
-        time_label.setFixedWidth(140)
-        time_label.setAlignment(Qt.AlignCenter)
-        time_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold;")
-        layout.addWidget(time_label)
-
-        return row
-
-
-    @staticmethod
-    def _rank_style(rank: int) -> str:
-        if rank == 1:
-            return "color: #ffd700; font-size: 24px; font-weight: bold;"
-        elif rank == 2:
-            return "color: #c0c0c0; font-size: 24px; font-weight: bold;"
-        elif rank == 3:
-            return "color: #cd7f32; font-size: 24px; font-weight: bold;"
-        return f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold;"
+        # Unchanged since the last render (e.g. served from the HTTP cache) — nothing to do
+        if data == self._data:
+            return
+        self._data = data
+
+        for category in list(self._sections):
+            if category not in data:
+                # Out of the layout now, not when deleteLater runs, so the
+                # indexOf positions below don't count it
+                section = self._sections.pop(category)
+                self._list_layout.removeWidget(section)
+                section.deleteLater()
+
+        # Sections are laid out in data order ahead of the trailing stretch;
+        # a section is only re-inserted when it is out of place
+        for pos, (category, records) in enumerate(data.items()):
+            section = self._sections.get(category)
+            if section is None:
+                section = self._sections[category] = _CategorySection(category)
+                self._list_layout.insertWidget(pos, section)
+            elif self._list_layout.indexOf(section) != pos:
+                self._list_layout.removeWidget(section)
+                self._list_layout.insertWidget(pos, section)
+            section.set_records(records)
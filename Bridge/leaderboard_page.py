@@ -1,32 +1,245 @@
-"""Leaderboard page showing player rankings by elo."""
+"""Leaderboard page showing player rankings by elo.
 
-import threading
+Rows are painted by LeaderboardDelegate from a LeaderboardModel, so the
+widget count stays constant no matter how many players are ranked.
+"""
 
-from PySide6.QtCore import Qt, Signal
+import bisect
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QScrollArea,
     QFrame,
+    QListView,
+    QAbstractItemView,
+    QStyledItemDelegate,
 )
 
 import api_client
-from rank_utils import create_rank_icon, apply_rank_label_style
-from config import CLR_WIDGET_BG, CLR_BUTTON_BG, CLR_TEXT, CLR_TEXT_BRIGHT, CLR_ACTIVE_BTN
+import task_pool
+from poll_scheduler import PollScheduler
+from rank_utils import get_rank_name, get_rank_pixmap, get_rank_color, cosmic_text_pixmap
+from config import CLR_WIDGET_BG, CLR_BUTTON_BG, CLR_TEXT_BRIGHT, CLR_ACTIVE_BTN, LEADERBOARD_REFRESH_INTERVAL, POLL_MAX_INTERVAL
+
+PlayerRole = Qt.UserRole + 1
+
+_FONT_PX = 26
+_ICON_SIZE = 26
+_ROW_SPACING = 4         # gap between rows
+_ROW_PADDING = (16, 12)  # horizontal, vertical padding inside a row
+_RANK_WIDTH = 50
+_ELO_WIDTH = 80
+
+
+def _rank_color(rank: int) -> str:
+    """Return the text color for a leaderboard position."""
+    if rank == 1:
+        return "#ffd700"
+    elif rank == 2:
+        return "#a8c0d4"
+    elif rank == 3:
+        return "#cd7f32"
+    return CLR_TEXT_BRIGHT
+
+
+def _player_key(player: dict) -> str:
+    """Stable identity for a leaderboard row."""
+    return str(player.get("player_id") or player.get("steam_id") or player.get("player_name", ""))
+
+
+def _longest_increasing_run(seq: list[int]) -> list[int]:
+    """Indices into seq of one longest strictly increasing subsequence."""
+    tails: list[int] = []       # tails[k] = index of smallest tail of a run of length k+1
+    tail_values: list[int] = []
+    prev = [-1] * len(seq)
+    for i, value in enumerate(seq):
+        k = bisect.bisect_left(tail_values, value)
+        if k:
+            prev[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+    run = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        run.append(i)
+        i = prev[i]
+    return run[::-1]
+
+
+class LeaderboardModel(QAbstractListModel):
+    """List model of player dicts in leaderboard order."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._players: list[dict] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._players)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        player = self._players[index.row()]
+        if role == Qt.DisplayRole:
+            return player.get("player_name", "Unknown")
+        if role == PlayerRole:
+            return player
+        return None
+
+    def set_players(self, players: list[dict]) -> None:
+        """Reconcile to a new ranking with minimal row operations.
+
+        Rows are matched by player key. Players that left are removed, new
+        ones inserted, and reordered ones moved; rows whose data changed get
+        dataChanged. Only players outside the longest run that kept its
+        relative order are moved, so a single climber or faller is one move.
+        """
+        new_keys = [_player_key(p) for p in players]
+        new_index = {k: i for i, k in enumerate(new_keys)}
+        if len(new_index) != len(new_keys):
+            # Duplicate keys can't be reconciled — fall back to a reset
+            self.beginResetModel()
+            self._players = list(players)
+            self.endResetModel()
+            return
+
+        cur = self._players
+        cur_keys = [_player_key(p) for p in cur]
+        parent = QModelIndex()
+
+        # Removals, bottom-up so earlier row numbers stay valid
+        for row in range(len(cur_keys) - 1, -1, -1):
+            if cur_keys[row] not in new_index:
+                self.beginRemoveRows(parent, row, row)
+                del cur[row], cur_keys[row]
+                self.endRemoveRows()
+
+        stable = {cur_keys[i] for i in _longest_increasing_run([new_index[k] for k in cur_keys])}
+        old_by_key = dict(zip(cur_keys, cur))
+        changed = []
+
+        for i, key in enumerate(new_keys):
+            if key not in old_by_key:
+                self.beginInsertRows(parent, i, i)
+                cur.insert(i, players[i])
+                cur_keys.insert(i, key)
+                self.endInsertRows()
+                continue
+
+            if key in stable:
+                # Anything ahead of a stable row is a mover still waiting for its slot
+                while cur_keys[i] != key:
+                    last = len(cur_keys)
+                    self.beginMoveRows(parent, i, i, parent, last)
+                    cur.append(cur.pop(i))
+                    cur_keys.append(cur_keys.pop(i))
+                    self.endMoveRows()
+            elif cur_keys[i] != key:
+                j = cur_keys.index(key, i)
+                self.beginMoveRows(parent, j, j, parent, i)
+                cur.insert(i, cur.pop(j))
+                cur_keys.insert(i, cur_keys.pop(j))
+                self.endMoveRows()
+
+            if cur[i] != players[i]:
+                cur[i] = players[i]
+                changed.append(i)
+
+        for row in changed:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx)
+
+
+class LeaderboardDelegate(QStyledItemDelegate):
+    """Paints one leaderboard row: position, rank icon + name, elo."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont()
+        self._font.setPixelSize(_FONT_PX)
+        self._font.setBold(True)
+        self._row_height = QFontMetrics(self._font).height() + 2 * _ROW_PADDING[1]
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self._row_height + _ROW_SPACING)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        player = index.data(PlayerRole)
+        if player is None:
+            return
+        rank = index.row() + 1
+        elo = player.get("elo", 0)
+        name = player.get("player_name", "Unknown")
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        fm = QFontMetrics(self._font)
+
+        row = QRect(option.rect)
+        row.setHeight(self._row_height)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(CLR_WIDGET_BG))
+        painter.drawRoundedRect(row, 4, 4)
+
+        inner = row.adjusted(_ROW_PADDING[0], 0, -_ROW_PADDING[0], 0)
+
+        # Position number on the left
+        painter.setPen(QColor(_rank_color(rank)))
+        rank_rect = QRect(inner.left(), inner.top(), _RANK_WIDTH, inner.height())
+        painter.drawText(rank_rect, Qt.AlignCenter, f"{rank}.")
+
+        # Elo on the right
+        painter.setPen(QColor(CLR_TEXT_BRIGHT))
+        elo_rect = QRect(inner.right() - _ELO_WIDTH + 1, inner.top(), _ELO_WIDTH, inner.height())
+        painter.drawText(elo_rect, Qt.AlignCenter, str(elo))
+
+        # Icon + name grouped together and centered in the space between
+        middle = QRect(rank_rect.right() + 1, inner.top(), elo_rect.left() - rank_rect.right() - 1, inner.height())
+        cosmic = get_rank_name(elo) == "cosmic"
+        name_pixmap = cosmic_text_pixmap(name, _FONT_PX) if cosmic else None
+        # Pixmaps carry the screen's devicePixelRatio; lay them out in logical px
+        name_width = round(name_pixmap.deviceIndependentSize().width()) if cosmic else fm.horizontalAdvance(name)
+        group_width = _ICON_SIZE + 6 + name_width
+        x = middle.left() + max(0, (middle.width() - group_width) // 2)
+
+        icon = get_rank_pixmap(elo, _ICON_SIZE)
+        if not icon.isNull():
+            icon_h = round(icon.deviceIndependentSize().height())
+            painter.drawPixmap(x, middle.top() + (middle.height() - icon_h) // 2, icon)
+        x += _ICON_SIZE + 6
+
+        if cosmic:
+            name_h = round(name_pixmap.deviceIndependentSize().height())
+            painter.drawPixmap(x, middle.top() + (middle.height() - name_h) // 2, name_pixmap)
+        else:
+            painter.setPen(QColor(get_rank_color(elo)))
+            name_rect = QRect(x, middle.top(), max(0, middle.right() - x), middle.height())
+            painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        painter.restore()
 
 
 class LeaderboardPage(QWidget):
     """Leaderboard page displaying players ranked by elo."""
 
-    _data_loaded = Signal(list)
-
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self._controller = controller
+        self._players: list | None = None  # last list rendered
+        self._poller = PollScheduler(
+            "leaderboard", self._fetch_leaderboard,
+            LEADERBOARD_REFRESH_INTERVAL, POLL_MAX_INTERVAL, parent=self,
+        )
         self._setup_ui()
-        self._data_loaded.connect(self._populate_leaderboard)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -64,23 +277,19 @@ class LeaderboardPage(QWidget):
 
         layout.addWidget(header_row)
 
-        # Scroll area for player list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background-color: transparent; }"
-        )
-
-        self._list_container = QWidget()
-        self._list_layout = QVBoxLayout(self._list_container)
-        self._list_layout.setContentsMargins(0, 0, 0, 0)
-        self._list_layout.setSpacing(4)
-        self._list_layout.addStretch()
-
-        scroll.setWidget(self._list_container)
-        self._scroll = scroll
-        layout.addWidget(scroll, stretch=1)
+        # Virtualized player list — the delegate paints only the visible rows
+        self._model = LeaderboardModel(self)
+        self._view = QListView()
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(LeaderboardDelegate(self._view))
+        self._view.setUniformItemSizes(True)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._view.setFocusPolicy(Qt.NoFocus)
+        self._view.setFrameShape(QFrame.NoFrame)
+        self._view.setStyleSheet("QListView { border: none; background-color: transparent; }")
+        layout.addWidget(self._view, stretch=1)
 
         # Loading label (shown when fetching)
         self._loading_label = QLabel("Loading...")
@@ -90,92 +299,42 @@ class LeaderboardPage(QWidget):
         layout.addWidget(self._loading_label)
 
     def showEvent(self, event):
-        """Fetch leaderboard data when page becomes visible."""
+        """Refresh the leaderboard periodically while the page is visible."""
         super().showEvent(event)
-        self._fetch_leaderboard()
+        self._poller.pause_while_hidden(self.window())
+        self._poller.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._poller.stop()
+        task_pool.cancel_group("leaderboard_page")
 
     def _fetch_leaderboard(self):
-        """Fetch leaderboard in background thread."""
-        self._loading_label.show()
+        """Fetch leaderboard on the shared worker pool."""
+        if self._players is None:
+            self._loading_label.show()
+        task_pool.submit(
+            api_client.get_leaderboard, key="leaderboard", group="leaderboard_page",
+            on_result=self._on_leaderboard, on_error=self._on_leaderboard_error,
+        )
 
-        def _do():
-            try:
-                players = api_client.get_leaderboard()
-                self._data_loaded.emit(players)
-            except Exception:
-                self._data_loaded.emit([])
+    def _on_leaderboard(self, players: list):
+        self._poller.report_result(players != self._players)
+        self._populate_leaderboard(players)
 
-        threading.Thread(target=_do, daemon=True).start()
+    def _on_leaderboard_error(self, error: Exception):
+        # Keep showing the last good list; only a first load falls back to empty
+        self._poller.report_error()
+        self._populate_leaderboard(self._players if self._players is not None else [])
 
     def _populate_leaderboard(self, players: list):
         """Populate the leaderboard with player data."""
         self._loading_label.hide()
 
-        # Save scroll position before clearing
-        saved_scroll = self._scroll.verticalScrollBar().value()
-
-        # Clear existing rows (except the stretch at the end)
-        while self._list_layout.count() > 1:
-            item = self._list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Add player rows
-        for i, player in enumerate(players):
-            row = self._create_player_row(i + 1, player)
-            self._list_layout.insertWidget(self._list_layout.count() - 1, row)
-
-        # Restore scroll position after layout settles
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(0, lambda: self._scroll.verticalScrollBar().setValue(saved_scroll))
-
-    def _create_player_row(self, rank: int, player: dict) -> QFrame:
-        """Create a row widget for a player."""
-        row = QFrame()
-        row.setStyleSheet(
-            f"QFrame {{ background-color: {CLR_WIDGET_BG}; border-radius: 4px; }}"
-        )
-
-        layout = QHBoxLayout(row)
-        layout.setContentsMargins(16, 12, 16, 12)
-
-        # Rank number on the left
-        rank_label = QLabel(f"{rank}.")
-        rank_label.setFixedWidth(50)
-        rank_label.setAlignment(Qt.AlignCenter)
-        rank_label.setStyleSheet(self._rank_style(rank))
-        layout.addWidget(rank_label)
+        # Unchanged since the last render (e.g. served from the HTTP cache) — nothing to do
+        if players == self._players:
+            return
+        self._players = players
 
-        # Icon + name grouped together (icon adjacent to name)
-        elo = player.get("elo", 0)
-        name = player.get("player_name", "Unknown")
-        name_group = QHBoxLayout()
-        name_group.setSpacing(6)
-        name_group.addStretch()
-        icon = create_rank_icon(elo, size=26)
-        name_group.addWidget(icon)
-        name_label = QLabel(name)
-        apply_rank_label_style(name_label, elo, 26)
-        name_group.addWidget(name_label)
-        name_group.addStretch()
-
-        layout.addLayout(name_group, stretch=1)
-
-        elo_label = QLabel(str(elo))
-        elo_label.setFixedWidth(80)
-        elo_label.setAlignment(Qt.AlignCenter)
-        elo_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 26px; font-weight: bold;")
-        layout.addWidget(elo_label)
-
-        return row
-
-    def _rank_style(self, rank: int) -> str:
-        """Return style for rank label based on position."""
-        if rank == 1:
-            return "color: #ffd700; font-size: 26px; font-weight: bold;"
-        elif rank == 2:
-            return "color: #a8c0d4; font-size: 26px; font-weight: bold;"
-        elif rank == 3:
-            return "color: #cd7f32; font-size: 26px; font-weight: bold;"
-        else:
-            return f"color: {CLR_TEXT_BRIGHT}; font-size: 26px; font-weight: bold;"
+        # Rows are reconciled in place, so the view keeps its scroll position
+        self._model.set_players(players)
@@ -2,8 +2,14 @@
 
 Sidebar layout (top to bottom):
   Active Matches, Match History, Leaderboard, Fastest Times, (stretch), Overlay, Settings, Profile
+
+Only the login page is built at startup. The other pages (and their
+modules) are imported and built the first time they are shown, and the
+overlay window on login.
 """
 
+from typing import Callable
+
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -17,14 +23,6 @@ from PySide6.QtWidgets import (
 )
 
 from login_page import LoginPage
-from profile_page import ProfilePage
-from active_matches_page import ActiveMatchesPage
-from match_history_page import MatchHistoryPage
-from match_detail_page import MatchDetailPage
-from leaderboard_page import LeaderboardPage
-from fastest_times_page import FastestTimesPage
-from settings_page import SettingsPage
-from overlay_window import OverlayWindow
 from config import CLR_MAIN_BG, CLR_WIDGET_BG, CLR_BUTTON_BG, CLR_ACTIVE_BTN, CLR_TEXT, CLR_TEXT_BRIGHT
 
 
@@ -44,6 +42,7 @@ class MainWindow(QMainWindow):
     def __init__(self, controller):
         super().__init__()
         self._controller = controller
+        self._controller.pause_polling_while_hidden(self)
         self.setWindowTitle("S2Ranked")
         self.resize(960, 640)
 
@@ -86,25 +85,19 @@ class MainWindow(QMainWindow):
         self._stack = QStackedWidget()
         root.addWidget(self._stack, stretch=1)
 
-        # Page indices
+        # Page indices; lazy pages hold a placeholder until first shown
+        self._page_builders: dict[int, Callable[[], QWidget]] = {}
         self._login_page = LoginPage(self._controller)
-        self._profile_page = ProfilePage(self._controller)
-        self._active_matches_page = ActiveMatchesPage(self._controller)
-        self._history_page = MatchHistoryPage(self._controller)
-        self._detail_page = MatchDetailPage(self._controller)
-        self._leaderboard_page = LeaderboardPage(self._controller)
-        self._fastest_page = FastestTimesPage(self._controller)
-        self._settings_page = SettingsPage(self._controller)
         self._match_mode_page = self._create_match_mode_page()
 
         self._LOGIN_IDX = self._stack.addWidget(self._login_page)
-        self._PROFILE_IDX = self._stack.addWidget(self._profile_page)
-        self._ACTIVE_MATCHES_IDX = self._stack.addWidget(self._active_matches_page)
-        self._HISTORY_IDX = self._stack.addWidget(self._history_page)
-        self._DETAIL_IDX = self._stack.addWidget(self._detail_page)
-        self._LEADERBOARD_IDX = self._stack.addWidget(self._leaderboard_page)
-        self._FASTEST_IDX = self._stack.addWidget(self._fastest_page)
-        self._SETTINGS_IDX = self._stack.addWidget(self._settings_page)
+        self._PROFILE_IDX = self._add_lazy_page(self._build_profile_page)
+        self._ACTIVE_MATCHES_IDX = self._add_lazy_page(self._build_active_matches_page)
+        self._HISTORY_IDX = self._add_lazy_page(self._build_history_page)
+        self._DETAIL_IDX = self._add_lazy_page(self._build_detail_page)
+        self._LEADERBOARD_IDX = self._add_lazy_page(self._build_leaderboard_page)
+        self._FASTEST_IDX = self._add_lazy_page(self._build_fastest_page)
+        self._SETTINGS_IDX = self._add_lazy_page(self._build_settings_page)
         self._version_mismatch_page = self._create_version_mismatch_page()
         self._disconnected_page = self._create_disconnected_page()
         self._MATCHMODE_IDX = self._stack.addWidget(self._match_mode_page)
@@ -124,16 +117,8 @@ class MainWindow(QMainWindow):
         for btn in self._btn_page_map:
             btn.clicked.connect(lambda checked=False, b=btn: self._nav_to(b))
 
-        # Back from detail page
-        self._detail_page.set_back_callback(
-            lambda: self._stack.setCurrentIndex(self._HISTORY_IDX)
-        )
-
-        # Match card click → detail page
-        self._history_page.match_selected.connect(self._show_match_detail)
-
-        # Overlay window (created but hidden)
-        self._overlay = OverlayWindow(self._controller)
+        # Overlay window (created hidden on login, see _ensure_overlay)
+        self._overlay = None
 
         # Start/stop active matches polling when navigating to/from active matches page
         self._stack.currentChanged.connect(self._on_page_changed)
@@ -147,7 +132,6 @@ class MainWindow(QMainWindow):
         self._controller.game_version_mismatch.connect(self._show_game_version_mismatch)
         self._controller.ws_connected.connect(self._on_ws_reconnected)
         self._controller.ws_disconnected.connect(self._on_ws_disconnected)
-        self._settings_page.logout_requested.connect(self._on_logout)
 
         # Reconnect timer
         self._reconnect_timer = QTimer(self)
@@ -174,10 +158,75 @@ class MainWindow(QMainWindow):
     def _nav_to(self, btn: QPushButton):
         idx = self._btn_page_map.get(btn)
         if idx is not None:
-            self._stack.setCurrentIndex(idx)
+            self._show_page(idx)
         for b in self._nav_buttons:
             b.setChecked(b is btn)
 
+    def _add_lazy_page(self, build: Callable[[], QWidget]) -> int:
+        idx = self._stack.addWidget(QWidget())
+        self._page_builders[idx] = build
+        return idx
+
+    def _page(self, idx: int) -> QWidget:
+        """The page at idx, built now if it hasn't been yet."""
+        build = self._page_builders.pop(idx, None)
+        if build is not None:
+            placeholder = self._stack.widget(idx)
+            self._stack.insertWidget(idx, build())
+            self._stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return self._stack.widget(idx)
+
+    def _show_page(self, idx: int):
+        self._page(idx)
+        self._stack.setCurrentIndex(idx)
+
+    def _build_profile_page(self) -> QWidget:
+        from profile_page import ProfilePage
+        page = ProfilePage(self._controller)
+        # Built on login, after the login_success it would have shown
+        if self._controller.player_data:
+            page.update_data(self._controller.player_data)
+        return page
+
+    def _build_active_matches_page(self) -> QWidget:
+        from active_matches_page import ActiveMatchesPage
+        return ActiveMatchesPage(self._controller)
+
+    def _build_history_page(self) -> QWidget:
+        from match_history_page import MatchHistoryPage
+        page = MatchHistoryPage(self._controller)
+        # Match card click → detail page
+        page.match_selected.connect(self._show_match_detail)
+        return page
+
+    def _build_detail_page(self) -> QWidget:
+        from match_detail_page import MatchDetailPage
+        page = MatchDetailPage(self._controller)
+        page.set_back_callback(lambda: self._show_page(self._HISTORY_IDX))
+        return page
+
+    def _build_leaderboard_page(self) -> QWidget:
+        from leaderboard_page import LeaderboardPage
+        return LeaderboardPage(self._controller)
+
+    def _build_fastest_page(self) -> QWidget:
+        from fastest_times_page import FastestTimesPage
+        return FastestTimesPage(self._controller)
+
+    def _build_settings_page(self) -> QWidget:
+        from settings_page import SettingsPage
+        page = SettingsPage(self._controller)
+        page.logout_requested.connect(self._on_logout)
+        return page
+
+    def _ensure_overlay(self):
+        # Before networking starts, so it sees every match signal
+        if self._overlay is None:
+            from overlay_window import OverlayWindow
+            self._overlay = OverlayWindow(self._controller)
+        return self._overlay
+
     def _create_match_mode_page(self) -> QWidget:
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -243,7 +292,7 @@ class MainWindow(QMainWindow):
         # Only restore UI if we're on the disconnected page
         if self._stack.currentIndex() == self._DISCONNECTED_IDX:
             self._sidebar.setVisible(True)
-            self._stack.setCurrentIndex(self._PROFILE_IDX)
+            self._show_page(self._PROFILE_IDX)
             self._profile_btn.setChecked(True)
             self._controller.refresh_player_data()
 
@@ -254,8 +303,9 @@ class MainWindow(QMainWindow):
             self._controller.stop_active_matches_polling()
 
     def _on_login_success(self, data: dict):
+        self._ensure_overlay()
         self._sidebar.setVisible(True)
-        self._stack.setCurrentIndex(self._PROFILE_IDX)
+        self._show_page(self._PROFILE_IDX)
         self._profile_btn.setChecked(True)
         self._controller.start_networking()
         self._controller.initialize_match_cache()
@@ -282,7 +332,7 @@ class MainWindow(QMainWindow):
     def _exit_match_mode(self, data=None):
         for btn in self._nav_buttons:
             btn.setEnabled(True)
-        self._stack.setCurrentIndex(self._PROFILE_IDX)
+        self._show_page(self._PROFILE_IDX)
         self._profile_btn.setChecked(True)
         # Refresh profile after match
         self._controller.refresh_player_data()
@@ -290,7 +340,7 @@ class MainWindow(QMainWindow):
     def _on_logout(self):
         self._reconnect_timer.stop()
         self._controller.logout()
-        if self._overlay.isVisible():
+        if self._overlay is not None and self._overlay.isVisible():
             self._overlay.hide()
             self._update_overlay_btn_style()
         for btn in self._nav_buttons:
@@ -300,6 +350,7 @@ class MainWindow(QMainWindow):
         self._stack.setCurrentIndex(self._LOGIN_IDX)
 
     def _toggle_overlay(self):
+        self._ensure_overlay()
         if self._overlay.isVisible():
             self._overlay.hide()
         else:
@@ -317,10 +368,11 @@ class MainWindow(QMainWindow):
             self._overlay_btn.setStyleSheet(_SIDEBAR_BTN)
 
     def _show_match_detail(self, match_data: dict):
-        self._detail_page.load_match(match_data)
-        self._stack.setCurrentIndex(self._DETAIL_IDX)
+        self._page(self._DETAIL_IDX).load_match(match_data)
+        self._show_page(self._DETAIL_IDX)
 
     def closeEvent(self, event):
         self._controller.stop_networking()
-        self._overlay.close()
+        if self._overlay is not None:
+            self._overlay.close()
         super().closeEvent(event)
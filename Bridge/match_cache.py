@@ -1,27 +1,264 @@
-"""Local match cache stored in match_cache.json next to the executable."""
+"""Local match cache stored in match_cache.db next to the executable.
+
+Matches live in a SQLite table indexed by match_id and by start time, so
+appending a result and reading a newest-first page never touch the rest of
+the history. A legacy match_cache.json is imported on first open and then
+renamed out of the way. A corrupt database is set aside and rebuilt.
+"""
 
 import json
+import logging
 import os
+import sqlite3
+import threading
+
+import durable_file
+from config import MATCH_CACHE_PATH, MATCH_CACHE_DB_PATH, MATCH_CACHE_BUSY_TIMEOUT
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id TEXT NOT NULL UNIQUE,
+    match_start_time TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_newest ON matches (match_start_time DESC, seq DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Newest first; seq breaks ties between matches with the same (or no) start time
+_ORDER = "ORDER BY match_start_time DESC, seq DESC"
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+
+
+class _CorruptDatabase(Exception):
+    pass
+
+
+def _is_corruption(e: sqlite3.DatabaseError) -> bool:
+    # OperationalError (locked, busy, can't open, ...) is a DatabaseError
+    # too, but says nothing about the file's contents
+    if isinstance(e, sqlite3.OperationalError):
+        return False
+    code = getattr(e, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_CORRUPT, sqlite3.SQLITE_NOTADB)
+    message = str(e).lower()
+    return "not a database" in message or "malformed" in message
+
 
-from config import MATCH_CACHE_PATH
+def _open_db(path: str = MATCH_CACHE_DB_PATH) -> sqlite3.Connection:
+    """Open and check the database. Raises _CorruptDatabase only for real
+    corruption; anything else (e.g. still locked after the busy timeout)
+    propagates as the original sqlite3 error."""
+    conn = sqlite3.connect(path, timeout=MATCH_CACHE_BUSY_TIMEOUT, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        if result != "ok":
+            raise _CorruptDatabase(result)
+    except sqlite3.DatabaseError as e:
+        conn.close()
+        if _is_corruption(e):
+            raise _CorruptDatabase(str(e)) from e
+        raise
+    except _CorruptDatabase:
+        conn.close()
+        raise
+    return conn
+
+
+def _quarantine() -> sqlite3.Connection:
+    """Move a corrupt database (with its -wal/-shm) aside and start empty.
+
+    The files are renamed, never deleted. If they can't be (read-only or
+    missing directory, or still open elsewhere on Windows), the cache
+    lives in memory for this session instead.
+    """
+    try:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(MATCH_CACHE_DB_PATH + suffix):
+                os.replace(MATCH_CACHE_DB_PATH + suffix, MATCH_CACHE_DB_PATH + ".corrupt" + suffix)
+        return _open_db()
+    except (OSError, sqlite3.Error) as e:
+        log.warning("Could not set the corrupt match cache aside (%s); using memory this session", e)
+        return _open_db(":memory:")
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the database on first use and migrate any legacy JSON cache.
+
+    The cache can always be rebuilt from the server, so a database that is
+    corrupt (e.g. after a crash or disk error) is moved aside to .corrupt
+    and replaced with an empty one; the next sync refills it. Other errors,
+    such as a lock held past MATCH_CACHE_BUSY_TIMEOUT, are raised and the
+    next call tries again.
+    """
+    global _conn
+    if _conn is None:
+        try:
+            conn = _open_db()
+        except _CorruptDatabase as e:
+            log.warning("Match cache is corrupt (%s); starting a new one", e)
+            conn = _quarantine()
+        _conn = conn
+        _migrate_json()
+    return _conn
+
+
+def _migrate_json() -> None:
+    if not os.path.exists(MATCH_CACHE_PATH):
+        return
+    matches = durable_file.read_json(MATCH_CACHE_PATH, [], validate=lambda d: isinstance(d, list))
+    # Legacy file is newest-first; insert oldest first so seq keeps that order
+    _insert_many(reversed(matches))
+    _conn.commit()
+    os.replace(MATCH_CACHE_PATH, MATCH_CACHE_PATH + ".migrated")
+    log.info("Migrated %d matches from %s", len(matches), MATCH_CACHE_PATH)
+
+
+def _insert_many(matches) -> int:
+    """INSERT OR IGNORE each match; returns how many rows were new."""
+    rows = [
+        (str(m["match_id"]), m.get("match_start_time") or "", json.dumps(m))
+        for m in matches
+        if m.get("match_id") is not None
+    ]
+    before = _conn.total_changes
+    _conn.executemany(
+        "INSERT OR IGNORE INTO matches (match_id, match_start_time, data) VALUES (?, ?, ?)",
+        rows,
+    )
+    return _conn.total_changes - before
 
 
 def load_cached_matches() -> list[dict]:
-    if os.path.exists(MATCH_CACHE_PATH):
-        with open(MATCH_CACHE_PATH, "r") as f:
-            return json.load(f)
-    return []
+    """Return the whole cache, newest first."""
+    with _lock:
+        rows = _connect().execute(f"SELECT data FROM matches {_ORDER}").fetchall()
+    return [json.loads(r[0]) for r in rows]
+
+
+def load_page(offset: int, limit: int) -> list[dict]:
+    """Return up to limit cached matches starting offset rows from the newest."""
+    with _lock:
+        rows = _connect().execute(
+            f"SELECT data FROM matches {_ORDER} LIMIT ? OFFSET ?", (limit, offset)
+        ).fetchall()
+    return [json.loads(r[0]) for r in rows]
+
+
+def count() -> int:
+    with _lock:
+        return _connect().execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+
+def has_match(match_id) -> bool:
+    with _lock:
+        row = _connect().execute(
+            "SELECT 1 FROM matches WHERE match_id = ?", (str(match_id),)
+        ).fetchone()
+    return row is not None
 
 
 def save_cached_matches(matches: list[dict]) -> None:
-    with open(MATCH_CACHE_PATH, "w") as f:
-        json.dump(matches, f, indent=2)
+    """Replace the whole cache with matches (given newest first)."""
+    with _lock:
+        conn = _connect()
+        conn.execute("DELETE FROM matches")
+        _insert_many(reversed(matches))
+        conn.commit()
 
 
 def append_match(match_data: dict) -> None:
-    matches = load_cached_matches()
-    # Avoid duplicates by match_id
-    existing_ids = {m["match_id"] for m in matches}
-    if match_data.get("match_id") not in existing_ids:
-        matches.insert(0, match_data)  # newest first
-        save_cached_matches(matches)
+    """Add a single match; ignored if its match_id is already cached."""
+    with _lock:
+        conn = _connect()
+        _insert_many([match_data])
+        conn.commit()
+
+
+def _owned_by_locked(owner: str | None) -> bool:
+    if owner is None:
+        return True
+    row = _conn.execute("SELECT value FROM meta WHERE key = 'owner'").fetchone()
+    return row is not None and row[0] == owner
+
+
+def claim(owner: str) -> bool:
+    """Make sure the cache belongs to owner; False if it holds someone else's.
+
+    A cache with no recorded owner (new, or imported from the legacy JSON
+    file) is taken over when every cached match has owner as a player.
+    """
+    with _lock:
+        conn = _connect()
+        row = conn.execute("SELECT value FROM meta WHERE key = 'owner'").fetchone()
+        if row is not None:
+            return row[0] == owner
+        for (data,) in conn.execute("SELECT data FROM matches"):
+            m = json.loads(data)
+            if owner not in (str(m.get("player_1_id")), str(m.get("player_2_id"))):
+                return False
+        conn.execute("INSERT INTO meta (key, value) VALUES ('owner', ?)", (owner,))
+        conn.commit()
+    return True
+
+
+def append_matches(matches: list[dict], owner: str | None = None) -> int:
+    """Add a page of matches in one transaction; returns how many were new.
+
+    With owner, nothing is written unless the cache still belongs to that
+    player (a sync that outlived its session must not touch the next one's).
+    """
+    with _lock:
+        conn = _connect()
+        if not _owned_by_locked(owner):
+            return 0
+        added = _insert_many(reversed(matches))
+        conn.commit()
+    return added
+
+
+def newest_match_id() -> str | None:
+    """Return the match_id of the newest cached match (the sync high-water mark)."""
+    with _lock:
+        row = _connect().execute(f"SELECT match_id FROM matches {_ORDER} LIMIT 1").fetchone()
+    return row[0] if row else None
+
+
+def get_meta(key: str, default: str | None = None) -> str | None:
+    with _lock:
+        row = _connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def set_meta(key: str, value: str | None, owner: str | None = None) -> None:
+    """Store a sync bookkeeping value; None deletes the key. owner as in append_matches."""
+    with _lock:
+        conn = _connect()
+        if not _owned_by_locked(owner):
+            return
+        if value is None:
+            conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        conn.commit()
+
+
+def clear() -> None:
+    """Drop every cached match and all sync state (used on logout)."""
+    with _lock:
+        conn = _connect()
+        conn.execute("DELETE FROM matches")
+        conn.execute("DELETE FROM meta")
+        conn.commit()
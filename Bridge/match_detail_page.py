@@ -1,7 +1,6 @@
 """Expanded Match View with top summary and progress timeline."""
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QFontMetrics, QPixmap
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -12,7 +11,8 @@ from PySide6.QtWidgets import (
     QScrollArea,
 )
 
-from rank_utils import create_rank_icon, get_rank_icon_path
+from rank_utils import get_rank_pixmap
+from text_fit import fit_font_size
 from config import CLR_WIDGET_BG, CLR_TEXT, CLR_TEXT_BRIGHT, CLR_ACTIVE_BTN, CLR_BUTTON_BG, CLR_MAIN_BG, RANK_COLORS, format_time, full_match_datetime
 
 
@@ -23,13 +23,7 @@ def _elo_change_text(change: int) -> str:
 
 def _apply_name_style(label: "QLabel", text: str, color: str, max_width: int = 180) -> None:
     """Set label text with a font size shrunk to fit within max_width."""
-    size = 24
-    f = QFont()
-    f.setPixelSize(size)
-    f.setBold(True)
-    while size > 10 and QFontMetrics(f).horizontalAdvance(text) > max_width:
-        size -= 2
-        f.setPixelSize(size)
+    size = fit_font_size(text, max_width, step=2)
     label.setText(text)
     label.setStyleSheet(f"color: {color}; font-size: {size}px; font-weight: bold;")
 
@@ -443,11 +437,9 @@ class MatchDetailPage(QWidget):
             self._p1_elo_change_label.setVisible(False)
 
         # Update P1 rank icon
-        p1_pixmap = QPixmap(get_rank_icon_path(p1_elo))
+        p1_pixmap = get_rank_pixmap(p1_elo, 24)
         if not p1_pixmap.isNull():
-            self._p1_icon.setPixmap(
-                p1_pixmap.scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self._p1_icon.setPixmap(p1_pixmap)
 
         _apply_name_style(self._p2_label, p2_name, p2_color)
         self._p2_elo_label.setText(str(p2_elo))
@@ -460,11 +452,9 @@ class MatchDetailPage(QWidget):
             self._p2_elo_change_label.setVisible(False)
 
         # Update P2 rank icon
-        p2_pixmap = QPixmap(get_rank_icon_path(p2_elo))
+        p2_pixmap = get_rank_pixmap(p2_elo, 24)
         if not p2_pixmap.isNull():
-            self._p2_icon.setPixmap(
-                p2_pixmap.scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self._p2_icon.setPixmap(p2_pixmap)
 
         self._cat_label.setText(category)
         self._time_label.setText(format_time(comp_time) if comp_time else "—")
@@ -1,186 +1,234 @@
-"""Match History page with My Matches / All Matches toggle and pagination."""
+"""Match History page with My Matches / All Matches toggle and infinite scroll.
 
-import threading
+Matches are held in a MatchListModel and painted by MatchCardDelegate, so
+the widget count stays constant however far the history is scrolled. The
+next page is fetched as the list nears its end.
+"""
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
     QFrame,
+    QListView,
+    QAbstractItemView,
+    QStyledItemDelegate,
+    QStyle,
 )
 
 import match_cache
-from rank_utils import create_rank_icon
+import task_pool
+from rank_utils import get_rank_pixmap
+from text_fit import fit_font_size
 from config import CLR_WIDGET_BG, CLR_BUTTON_BG, CLR_ACTIVE_BTN, CLR_TEXT, CLR_TEXT_BRIGHT, format_time, relative_time
 
+MatchRole = Qt.UserRole + 1
+
+PAGE_SIZE = 10
+PREFETCH_ROWS = 3  # start loading the next page this many rows before the end
+
+_CARD_HEIGHT = 96
+_CARD_GAP = 4        # space above and below the divider between cards
+_ICON_SIZE = 24
+_NAME_WIDTH = 180
+_ELO_WIDTH = 50
+_SPACING = 8
+_MARGIN = 12
+
 
 def _elo_change_text(change: int) -> str:
     return f"+{change}" if change >= 0 else str(change)
 
 
-
-def _make_name_label(text: str, color: str, alignment: Qt.AlignmentFlag, max_width: int = 180) -> "QLabel":
-    """Create a player name label that shrinks font size to fit within max_width."""
-    size = 24
+def _make_font(size: int, bold: bool = True) -> QFont:
     f = QFont()
     f.setPixelSize(size)
-    f.setBold(True)
-    while size > 10 and QFontMetrics(f).horizontalAdvance(text) > max_width:
-        size -= 2
-        f.setPixelSize(size)
-    lbl = QLabel(text)
-    lbl.setStyleSheet(f"background: transparent; color: {color}; font-size: {size}px; font-weight: bold;")
-    lbl.setFixedWidth(max_width)
-    lbl.setAlignment(alignment)
-    return lbl
+    f.setBold(bold)
+    return f
+
 
+def _card_colors(match_data: dict) -> tuple[str, str, str, str, str, str]:
+    """Return (p1, p2, p1_change, p2_change, time_text, time_color) for a match."""
+    p1_id = match_data.get("player_1_id", "")
+    p2_id = match_data.get("player_2_id", "")
+    winner_id = match_data.get("winner_id", "")
+    comp_time = match_data.get("completion_time", 0)
+    match_type = match_data.get("match_type", "normal")
 
-class MatchCard(QFrame):
-    """A single match entry displayed as a horizontal card."""
+    if match_type == "draw":
+        return CLR_TEXT_BRIGHT, CLR_TEXT_BRIGHT, "#ffee44", "#ffee44", "Draw", "#ffee44"
+    p1_color = "#66ff66" if p1_id == winner_id else "#ff6666"
+    p2_color = "#66ff66" if p2_id == winner_id else "#ff6666"
+    if match_type == "forfeit":
+        return p1_color, p2_color, p1_color, p2_color, "Forfeit", "#ffaa44"
+    time_str = format_time(comp_time) if comp_time else "—"
+    return p1_color, p2_color, p1_color, p2_color, time_str, CLR_TEXT_BRIGHT
 
-    clicked = Signal(dict)
 
-    def __init__(self, match_data: dict, parent=None):
+class MatchListModel(QAbstractListModel):
+    """Append-only list model of match dicts, newest first; each match_id once."""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self._data = match_data
-        self.setCursor(Qt.PointingHandCursor)
-        self.setFixedHeight(96)
-        self.setStyleSheet(
-            f"MatchCard {{ background-color: {CLR_WIDGET_BG}; border-radius: 6px; padding: 8px; }}"
-            f"MatchCard:hover {{ background-color: {CLR_BUTTON_BG}; }}"
-        )
+        self._matches: list[dict] = []
+        self._ids: set = set()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._matches)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == MatchRole:
+            return self._matches[index.row()]
+        return None
+
+    def append_matches(self, batch: list[dict]) -> None:
+        # A page can overlap the previous one when matches were played (or
+        # the cache filled) between fetches; rows already shown are skipped
+        batch = [m for m in batch if m.get("match_id") not in self._ids]
+        if not batch:
+            return
+        self._ids.update(m.get("match_id") for m in batch)
+        first = len(self._matches)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._matches.extend(batch)
+        self.endInsertRows()
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 4, 12, 4)
-        layout.setSpacing(8)
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._matches = []
+        self._ids = set()
+        self.endResetModel()
 
-        p1_id = match_data.get("player_1_id", "")
-        p2_id = match_data.get("player_2_id", "")
-        winner_id = match_data.get("winner_id", "")
-        p1_elo = match_data.get("player_1_elo", 0)
-        p2_elo = match_data.get("player_2_elo", 0)
-        category = match_data.get("category", "")
-        comp_time = match_data.get("completion_time", 0)
-        match_type = match_data.get("match_type", "normal")
-
-        if match_type == "draw":
-            p1_color = CLR_TEXT_BRIGHT
-            p2_color = CLR_TEXT_BRIGHT
-            p1_change_color = "#ffee44"
-            p2_change_color = "#ffee44"
-            time_str = "Draw"
-            time_color = "#ffee44"
-        elif match_type == "forfeit":
-            p1_color = "#66ff66" if p1_id == winner_id else "#ff6666"
-            p2_color = "#66ff66" if p2_id == winner_id else "#ff6666"
-            p1_change_color = p1_color
-            p2_change_color = p2_color
-            time_str = "Forfeit"
-            time_color = "#ffaa44"
-        else:
-            p1_color = "#66ff66" if p1_id == winner_id else "#ff6666"
-            p2_color = "#66ff66" if p2_id == winner_id else "#ff6666"
-            p1_change_color = p1_color
-            p2_change_color = p2_color
-            time_str = format_time(comp_time) if comp_time else "—"
-            time_color = CLR_TEXT_BRIGHT
-
-        # Player 1 (icon + name + elo), fixed widths keep left/right sides symmetric
-        p1_icon = create_rank_icon(p1_elo, size=24)
-        layout.addWidget(p1_icon)
-        p1_name = _make_name_label(
-            match_data.get("player_1_name") or p1_id, p1_color, Qt.AlignLeft | Qt.AlignVCenter
+
+class MatchCardDelegate(QStyledItemDelegate):
+    """Paints a match as the horizontal card: P1 icon/name/elo, category/time, P2 mirrored."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._elo_font = _make_font(22)
+        self._change_font = _make_font(18)
+        self._center_font = _make_font(22)
+        self._rel_font = _make_font(20, bold=False)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), _CARD_HEIGHT + 2 * _CARD_GAP + 1)
+
+    def _draw_elo(self, painter: QPainter, rect: QRect, elo: int, change, change_color: str) -> None:
+        elo_h = QFontMetrics(self._elo_font).height()
+        change_h = QFontMetrics(self._change_font).height() if change is not None else 0
+        top = rect.top() + (rect.height() - elo_h - change_h) // 2
+        painter.setFont(self._elo_font)
+        painter.setPen(QColor(CLR_TEXT_BRIGHT))
+        painter.drawText(QRect(rect.left(), top, rect.width(), elo_h), Qt.AlignCenter, str(elo))
+        if change is not None:
+            painter.setFont(self._change_font)
+            painter.setPen(QColor(change_color))
+            painter.drawText(
+                QRect(rect.left(), top + elo_h, rect.width(), change_h), Qt.AlignCenter, _elo_change_text(change)
+            )
+
+    def _draw_name(self, painter: QPainter, rect: QRect, text: str, color: str, align) -> None:
+        painter.setFont(_make_font(fit_font_size(text, _NAME_WIDTH, step=2)))
+        painter.setPen(QColor(color))
+        painter.drawText(rect, align | Qt.AlignVCenter, text)
+
+    def _draw_icon(self, painter: QPainter, x: int, card: QRect, elo: int) -> None:
+        icon = get_rank_pixmap(elo, _ICON_SIZE)
+        if not icon.isNull():
+            # Logical height: the pixmap carries the screen's devicePixelRatio
+            icon_h = round(icon.deviceIndependentSize().height())
+            painter.drawPixmap(x, card.top() + (card.height() - icon_h) // 2, icon)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        m = index.data(MatchRole)
+        if m is None:
+            return
+        p1_color, p2_color, p1_change_color, p2_change_color, time_str, time_color = _card_colors(m)
+        p1_elo = m.get("player_1_elo", 0)
+        p2_elo = m.get("player_2_elo", 0)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Divider above every card but the first
+        if index.row() > 0:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(CLR_BUTTON_BG))
+            painter.drawRect(option.rect.left(), option.rect.top(), option.rect.width(), 1)
+
+        card = QRect(option.rect.left(), option.rect.top() + 1 + _CARD_GAP, option.rect.width(), _CARD_HEIGHT)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(CLR_BUTTON_BG if hovered else CLR_WIDGET_BG))
+        painter.drawRoundedRect(card, 6, 6)
+
+        inner = card.adjusted(_MARGIN, 4, -_MARGIN, -4)
+
+        # Player 1 (icon + name + elo); fixed widths keep both sides symmetric
+        x = inner.left()
+        self._draw_icon(painter, x, card, p1_elo)
+        x += _ICON_SIZE + _SPACING
+        self._draw_name(
+            painter, QRect(x, inner.top(), _NAME_WIDTH, inner.height()),
+            m.get("player_1_name") or m.get("player_1_id", ""), p1_color, Qt.AlignLeft,
+        )
+        x += _NAME_WIDTH + _SPACING
+        p1_elo_rect = QRect(x, inner.top(), _ELO_WIDTH, inner.height())
+        self._draw_elo(painter, p1_elo_rect, p1_elo, m.get("player_1_elo_change"), p1_change_color)
+
+        # Player 2 (elo + name + icon), mirrored from the right edge
+        x = inner.right() + 1 - _ICON_SIZE
+        self._draw_icon(painter, x, card, p2_elo)
+        x -= _SPACING + _NAME_WIDTH
+        self._draw_name(
+            painter, QRect(x, inner.top(), _NAME_WIDTH, inner.height()),
+            m.get("player_2_name") or m.get("player_2_id", ""), p2_color, Qt.AlignRight,
         )
-        layout.addWidget(p1_name)
-        p1_elo_widget = QWidget()
-        p1_elo_widget.setFixedWidth(50)
-        p1_elo_widget.setStyleSheet("background: transparent;")
-        p1_elo_col = QVBoxLayout(p1_elo_widget)
-        p1_elo_col.setSpacing(0)
-        p1_elo_col.setContentsMargins(0, 0, 0, 0)
-        p1_elo_lbl = QLabel(str(p1_elo))
-        p1_elo_lbl.setStyleSheet(f"background: transparent; color: {CLR_TEXT_BRIGHT}; font-size: 22px; font-weight: bold;")
-        p1_elo_lbl.setAlignment(Qt.AlignCenter)
-        p1_elo_col.addWidget(p1_elo_lbl)
-        p1_change = match_data.get("player_1_elo_change")
-        if p1_change is not None:
-            p1_change_lbl = QLabel(_elo_change_text(p1_change))
-            p1_change_lbl.setStyleSheet(f"background: transparent; color: {p1_change_color}; font-size: 18px; font-weight: bold;")
-            p1_change_lbl.setAlignment(Qt.AlignCenter)
-            p1_elo_col.addWidget(p1_change_lbl)
-        layout.addWidget(p1_elo_widget)
-
-        layout.addStretch()
-
-        # Center: category + time — flanked by equal stretches so it stays at midpoint
-        center = QVBoxLayout()
-        center.setSpacing(0)
-        cat_lbl = QLabel(category)
-        cat_lbl.setStyleSheet(f"background: transparent; color: {CLR_TEXT_BRIGHT}; font-size: 22px; font-weight: bold;")
-        cat_lbl.setAlignment(Qt.AlignCenter)
-        center.addWidget(cat_lbl)
-
-        time_lbl = QLabel(time_str)
-        time_lbl.setStyleSheet(f"background: transparent; color: {time_color}; font-size: 22px; font-weight: bold;")
-        time_lbl.setAlignment(Qt.AlignCenter)
-        center.addWidget(time_lbl)
-
-        rel_lbl = QLabel(relative_time(match_data.get("match_start_time", "")))
-        rel_lbl.setStyleSheet(f"background: transparent; color: {CLR_TEXT}; font-size: 20px;")
-        rel_lbl.setAlignment(Qt.AlignCenter)
-        center.addWidget(rel_lbl)
-
-        layout.addLayout(center)
-
-        layout.addStretch()
-
-        # Player 2 (elo + name + icon), mirrors player 1 widths exactly
-        p2_elo_widget = QWidget()
-        p2_elo_widget.setFixedWidth(50)
-        p2_elo_widget.setStyleSheet("background: transparent;")
-        p2_elo_col = QVBoxLayout(p2_elo_widget)
-        p2_elo_col.setSpacing(0)
-        p2_elo_col.setContentsMargins(0, 0, 0, 0)
-        p2_elo_lbl = QLabel(str(p2_elo))
-        p2_elo_lbl.setStyleSheet(f"background: transparent; color: {CLR_TEXT_BRIGHT}; font-size: 22px; font-weight: bold;")
-        p2_elo_lbl.setAlignment(Qt.AlignCenter)
-        p2_elo_col.addWidget(p2_elo_lbl)
-        p2_change = match_data.get("player_2_elo_change")
-        if p2_change is not None:
-            p2_change_lbl = QLabel(_elo_change_text(p2_change))
-            p2_change_lbl.setStyleSheet(f"background: transparent; color: {p2_change_color}; font-size: 18px; font-weight: bold;")
-            p2_change_lbl.setAlignment(Qt.AlignCenter)
-            p2_elo_col.addWidget(p2_change_lbl)
-        layout.addWidget(p2_elo_widget)
-        p2_name = _make_name_label(
-            match_data.get("player_2_name") or p2_id, p2_color, Qt.AlignRight | Qt.AlignVCenter
+        x -= _SPACING + _ELO_WIDTH
+        p2_elo_rect = QRect(x, inner.top(), _ELO_WIDTH, inner.height())
+        self._draw_elo(painter, p2_elo_rect, p2_elo, m.get("player_2_elo_change"), p2_change_color)
+
+        # Center: category, time, relative time — centered between the two sides
+        center = QRect(p1_elo_rect.right() + 1, inner.top(), p2_elo_rect.left() - p1_elo_rect.right() - 1, inner.height())
+        line_h = QFontMetrics(self._center_font).height()
+        rel_h = QFontMetrics(self._rel_font).height()
+        top = center.top() + (center.height() - 2 * line_h - rel_h) // 2
+        painter.setFont(self._center_font)
+        painter.setPen(QColor(CLR_TEXT_BRIGHT))
+        painter.drawText(QRect(center.left(), top, center.width(), line_h), Qt.AlignCenter, m.get("category", ""))
+        painter.setPen(QColor(time_color))
+        painter.drawText(QRect(center.left(), top + line_h, center.width(), line_h), Qt.AlignCenter, time_str)
+        painter.setFont(self._rel_font)
+        painter.setPen(QColor(CLR_TEXT))
+        painter.drawText(
+            QRect(center.left(), top + 2 * line_h, center.width(), rel_h), Qt.AlignCenter,
+            relative_time(m.get("match_start_time", "")),
         )
-        layout.addWidget(p2_name)
-        p2_icon = create_rank_icon(p2_elo, size=24)
-        layout.addWidget(p2_icon)
 
-    def mousePressEvent(self, event):
-        self.clicked.emit(self._data)
+        painter.restore()
 
 
 class MatchHistoryPage(QWidget):
-    """Match history list with toggle and pagination."""
+    """Match history list with toggle and infinite scroll."""
 
     match_selected = Signal(dict)  # Emitted when a match card is clicked
-    _batch_ready = Signal(list)    # Internal signal for thread-safe UI update
 
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self._controller = controller
         self._my_matches_mode = True
         self._offset = 0
-        self._matches: list[dict] = []
-        self._batch_ready.connect(self._do_append_matches)
+        self._loading = False
+        self._has_more = True
+        # Bumped whenever the list is reset or the page hidden; a response
+        # carrying an older generation is dropped before touching the UI
+        self._generation = 0
         self._setup_ui()
 
     def _setup_ui(self):
@@ -212,49 +260,50 @@ class MatchHistoryPage(QWidget):
 
         self._update_toggle_style()
 
-        # Scrollable match list with filled border
+        # Match list with filled border
         self._scroll_frame = QFrame()
         self._scroll_frame.setStyleSheet(
             f"QFrame#matchListFrame {{ background-color: {CLR_WIDGET_BG}; "
             f"border: 2px solid {CLR_BUTTON_BG}; border-radius: 8px; }}"
         )
         self._scroll_frame.setObjectName("matchListFrame")
-        scroll_frame_layout = QVBoxLayout(self._scroll_frame)
-        scroll_frame_layout.setContentsMargins(4, 4, 4, 4)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll_frame_layout.addWidget(scroll)
-
-        self._list_container = QWidget()
-        self._list_container.setStyleSheet(f"background-color: {CLR_WIDGET_BG};")
-        self._list_layout = QVBoxLayout(self._list_container)
-        self._list_layout.setSpacing(4)
-        self._list_layout.setContentsMargins(0, 0, 0, 0)
+        frame_layout = QVBoxLayout(self._scroll_frame)
+        frame_layout.setContentsMargins(4, 4, 4, 4)
 
         # Empty state label — centered in the frame
         self._empty_label = QLabel("No matches played.")
         self._empty_label.setStyleSheet(f"color: {CLR_TEXT_BRIGHT}; font-size: 24px; font-weight: bold;")
         self._empty_label.setAlignment(Qt.AlignCenter)
-        self._list_layout.addWidget(self._empty_label, stretch=1)
-
-        # Show More button — lives inside the scroll list so it scrolls with the content
-        self._more_btn = QPushButton("Show More")
-        self._more_btn.setFixedHeight(40)
-        self._more_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {CLR_BUTTON_BG}; color: {CLR_TEXT}; "
-            f"border-radius: 4px; font-size: 24px; font-weight: bold; }}"
-            f"QPushButton:hover {{ background-color: #3e4278; }}"
-        )
-        self._more_btn.clicked.connect(self._load_more)
-        self._more_btn.setVisible(False)
-        self._list_layout.addWidget(self._more_btn)
-
-        scroll.setWidget(self._list_container)
+        frame_layout.addWidget(self._empty_label, stretch=1)
+
+        self._model = MatchListModel(self)
+        self._view = QListView()
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(MatchCardDelegate(self._view))
+        self._view.setUniformItemSizes(True)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._view.setFocusPolicy(Qt.NoFocus)
+        self._view.setFrameShape(QFrame.NoFrame)
+        self._view.setMouseTracking(True)
+        self._view.viewport().setCursor(Qt.PointingHandCursor)
+        self._view.setStyleSheet(f"QListView {{ border: none; background-color: {CLR_WIDGET_BG}; }}")
+        self._view.clicked.connect(lambda index: self.match_selected.emit(index.data(MatchRole)))
+        self._view.verticalScrollBar().valueChanged.connect(self._maybe_prefetch)
+        self._view.verticalScrollBar().rangeChanged.connect(self._maybe_prefetch)
+        self._view.setVisible(False)
+        frame_layout.addWidget(self._view, stretch=1)
 
         layout.addWidget(self._scroll_frame, stretch=1)
 
+        # Shown after a failed page fetch; scrolling to the end retries too
+        self._retry_btn = QPushButton("Couldn't load matches. Retry")
+        self._retry_btn.setFixedHeight(44)
+        self._retry_btn.clicked.connect(self._retry)
+        self._retry_btn.setVisible(False)
+        layout.addWidget(self._retry_btn, alignment=Qt.AlignCenter)
+
     def _update_toggle_style(self):
         active = (
             f"QPushButton {{ background-color: {CLR_ACTIVE_BTN}; color: white; "
@@ -275,89 +324,95 @@ class MatchHistoryPage(QWidget):
             return
         self._my_matches_mode = my_matches
         self._update_toggle_style()
-        self._offset = 0
-        self._matches.clear()
-        self._clear_list()
         self.refresh()
 
     def showEvent(self, event):
         super().showEvent(event)
-        if not self._matches:
+        if not self._model.rowCount():
             self.refresh()
+        else:
+            self._maybe_prefetch()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._abandon_loads()
 
     def refresh(self):
+        self._abandon_loads()
+        self._retry_btn.setVisible(False)
         self._offset = 0
-        self._matches.clear()
+        self._has_more = True
         self._clear_list()
         self._load_batch()
 
-    def _load_more(self):
-        self._load_batch()
+    def _abandon_loads(self):
+        """Drop every in-flight page fetch; their results will be ignored."""
+        self._generation += 1
+        self._loading = False
+        task_pool.cancel_group("match_history_page")
 
-    def _load_batch(self):
-        def _do():
-            try:
-                if self._my_matches_mode:
-                    # Try cache first for offset 0
-                    if self._offset == 0:
-                        cached = match_cache.load_cached_matches()
-                        if cached:
-                            batch = cached[:10]
-                            self._offset = len(cached)
-                            self._append_matches(batch)
-                            return
-                    batch = self._controller.fetch_my_matches(
-                        offset=self._offset, limit=10
-                    )
-                else:
-                    batch = self._controller.fetch_all_matches(
-                        offset=self._offset, limit=10
-                    )
-                self._offset += len(batch)
-                self._append_matches(batch)
-            except Exception:
-                pass
-
-        threading.Thread(target=_do, daemon=True).start()
-
-    def _append_matches(self, batch: list[dict]):
-        # Emit signal to update UI on the main thread
-        self._batch_ready.emit(batch)
-
-    def _do_append_matches(self, batch):
-        if not isinstance(batch, list):
+    def _maybe_prefetch(self, *args):
+        """Load the next page once the list is scrolled near its end (or doesn't fill the view)."""
+        if self._loading or not self._has_more or not self._model.rowCount():
             return
+        bar = self._view.verticalScrollBar()
+        row_height = self._view.sizeHintForRow(0)
+        if bar.maximum() - bar.value() <= PREFETCH_ROWS * row_height:
+            self._load_batch()
 
-        # Hide empty label once we have matches
-        if batch:
-            self._empty_label.setVisible(False)
-
-        for m in batch:
-            # Add divider before card if there are already matches
-            if self._matches:
-                divider = QFrame()
-                divider.setFrameShape(QFrame.HLine)
-                divider.setStyleSheet(f"background-color: {CLR_BUTTON_BG}; max-height: 1px;")
-                idx = self._list_layout.count() - 1
-                self._list_layout.insertWidget(idx, divider)
-
-            self._matches.append(m)
-            card = MatchCard(m)
-            card.clicked.connect(self.match_selected.emit)
-            # Insert before the stretch
-            idx = self._list_layout.count() - 1
-            self._list_layout.insertWidget(idx, card)
+    def _load_batch(self):
+        self._loading = True
+        generation, my_matches, offset = self._generation, self._my_matches_mode, self._offset
+        task_pool.submit(
+            self._fetch_batch, my_matches, offset,
+            key=("match_history", my_matches, offset), group="match_history_page",
+            on_result=lambda batch: self._on_batch(generation, batch),
+            on_error=lambda e: self._on_batch_error(generation, e),
+        )
 
-        self._more_btn.setVisible(len(batch) >= 10)
+    def _fetch_batch(self, my_matches: bool, offset: int) -> list[dict]:
+        """Worker side: read one page without touching page state."""
+        if not my_matches:
+            return self._controller.fetch_all_matches(offset=offset, limit=PAGE_SIZE)
+        # Cache offsets only line up with the server's once the cache holds
+        # the whole history, so until the sync has backfilled every page
+        # the list pages through the server instead
+        if match_cache.get_meta("backfill_complete") == "1":
+            return match_cache.load_page(offset, PAGE_SIZE)
+        return self._controller.fetch_my_matches(offset=offset, limit=PAGE_SIZE)
+
+    def _on_batch(self, generation: int, batch: list[dict]):
+        if generation != self._generation:
+            return  # mode changed or page hidden since this was requested
+        # Offset and end-of-list follow what the source returned, not
+        # how many rows were new to the model
+        self._offset += len(batch)
+        self._loading = False
+        self._retry_btn.setVisible(False)
+        self._empty_label.setText("No matches played.")
+        self._has_more = len(batch) >= PAGE_SIZE
+        self._model.append_matches(batch)
+
+        has_matches = self._model.rowCount() > 0
+        self._empty_label.setVisible(not has_matches)
+        self._view.setVisible(has_matches)
+        self._maybe_prefetch()
+
+    def _on_batch_error(self, generation: int, error: Exception):
+        if generation != self._generation:
+            return
+        # Keep _offset and _has_more: the next scroll or Retry asks for the
+        # same page again. No prefetch here, or a dead server is retried in a loop.
+        self._loading = False
+        self._retry_btn.setVisible(True)
+        if not self._model.rowCount():
+            self._empty_label.setText("Couldn't load matches.")
 
-        # Show empty label if still no matches
-        if not self._matches:
-            self._empty_label.setVisible(True)
+    def _retry(self):
+        if not self._loading:
+            self._load_batch()
 
     def _clear_list(self):
-        # Keep the empty label and trailing stretch
-        while self._list_layout.count() > 2:  # keep empty_label + stretch
-            item = self._list_layout.takeAt(1)  # take after empty_label
-            if item.widget():
-                item.widget().deleteLater()
+        self._model.clear()
+        self._view.setVisible(False)
         self._empty_label.setVisible(True)
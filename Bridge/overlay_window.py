@@ -5,11 +5,12 @@ Resizable and movable. Background color is configurable via Settings.
 """
 
 from PySide6.QtCore import Qt, QPoint, QSize
-from PySide6.QtGui import QFont, QFontMetrics, QCursor, QPixmap
+from PySide6.QtGui import QFont, QCursor
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 
 import settings_store
-from rank_utils import get_rank_icon_path
+from rank_utils import get_rank_pixmap
+from text_fit import fit_font_size
 from config import THEME_NAMES
 
 # Resize handle size in pixels
@@ -44,6 +45,7 @@ class OverlayWindow(QWidget):
         self._controller.match_started.connect(self._on_match_start)
         self._controller.match_result.connect(lambda _: self._reset())
         self._controller.match_scrapped.connect(self._reset)
+        settings_store.notifier.changed.connect(self._on_setting_changed)
 
     def _setup_ui(self):
         self._root = QVBoxLayout(self)
@@ -112,31 +114,14 @@ class OverlayWindow(QWidget):
             if not text:
                 continue
 
-            # Binary search for optimal font size
-            min_size = 8
-            max_size = min(line_height, 72)
-            optimal_size = min_size
-
-            while min_size <= max_size:
-                mid_size = (min_size + max_size) // 2
+            bold = label == self._opponent_label
+            optimal_size = fit_font_size(text, width, line_height, bold=bold,
+                                         min_size=8, max_size=min(line_height, 72))
+            if label.font().pixelSize() != optimal_size:
                 font = QFont()
-                font.setPixelSize(mid_size)
-                font.setBold(label == self._opponent_label)
-                metrics = QFontMetrics(font)
-
-                text_width = metrics.horizontalAdvance(text)
-                text_height = metrics.height()
-
-                if text_width <= width and text_height <= line_height:
-                    optimal_size = mid_size
-                    min_size = mid_size + 1
-                else:
-                    max_size = mid_size - 1
-
-            font = QFont()
-            font.setPixelSize(optimal_size)
-            font.setBold(label == self._opponent_label)
-            label.setFont(font)
+                font.setPixelSize(optimal_size)
+                font.setBold(bold)
+                label.setFont(font)
 
             # Scale opponent icon to match opponent label font size
             if label == self._opponent_label:
@@ -144,12 +129,9 @@ class OverlayWindow(QWidget):
                 self._opponent_icon.setFixedSize(icon_size, icon_size)
                 # Re-apply icon at new size
                 elo = self._controller.match_opponent_elo if self._controller.in_match else 200
-                path = get_rank_icon_path(elo)
-                pixmap = QPixmap(path)
+                pixmap = get_rank_pixmap(elo, icon_size)
                 if not pixmap.isNull():
-                    self._opponent_icon.setPixmap(
-                        pixmap.scaled(icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    )
+                    self._opponent_icon.setPixmap(pixmap)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -167,17 +149,18 @@ class OverlayWindow(QWidget):
 
     def _update_opponent_icon(self, elo: int):
         """Update the rank icon for the opponent's elo."""
-        path = get_rank_icon_path(elo)
-        pixmap = QPixmap(path)
+        pixmap = get_rank_pixmap(elo, 20)
         if not pixmap.isNull():
-            self._opponent_icon.setPixmap(
-                pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self._opponent_icon.setPixmap(pixmap)
 
     def _apply_bg_color(self):
         color = settings_store.get_overlay_color()
         self.setStyleSheet(f"OverlayWindow {{ background-color: {color}; }}")
 
+    def _on_setting_changed(self, key: str, value):
+        if key == "overlay_color":
+            self._apply_bg_color()
+
     def _on_match_start(self, data: dict):
         opponent = self._controller.match_opponent
         elo = self._controller.match_opponent_elo
@@ -185,7 +168,6 @@ class OverlayWindow(QWidget):
         self._update_opponent_icon(elo)
         self._category_label.setText(data.get("category", "—"))
         self._progress_label.setText("Started Match")
-        self._apply_bg_color()
         self._update_font_sizes()
 
     def _on_progress(self, area: int, theme: int):
@@ -0,0 +1,173 @@
+"""Adaptive polling on the Qt event loop.
+
+A PollScheduler calls its poll function, waits for the outcome to be
+reported, then schedules the next call:
+  - changed data resets the interval to base (or fast while fast mode is on)
+  - unchanged data or an error doubles it, up to max_interval
+  - every delay is jittered by +/- POLL_JITTER so clients don't synchronize
+  - while the watched window is hidden or minimized nothing fires; a poll
+    that came due meanwhile runs as soon as the window is shown again
+"""
+
+import logging
+import random
+import time
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer, QEvent, Signal
+from PySide6.QtWidgets import QWidget
+
+from config import POLL_JITTER
+
+log = logging.getLogger(__name__)
+
+
+class PollScheduler(QObject):
+    """Calls poll() repeatedly with an adaptive, jittered interval (seconds).
+
+    poll() should only start the request, typically on a worker thread, and
+    report the outcome with report_result() or report_error() from any
+    thread. The next poll is scheduled when the outcome arrives, so polls
+    never overlap.
+    """
+
+    _outcome = Signal(object, object)  # changed (None = error), fast
+
+    def __init__(self, name: str, poll: Callable[[], None], base_interval: float,
+                 max_interval: float, fast_interval: float | None = None, parent=None):
+        super().__init__(parent)
+        self._name = name
+        self._poll = poll
+        self._base = base_interval
+        self._max = max_interval
+        self._fast_interval = fast_interval if fast_interval is not None else base_interval
+        self._interval = base_interval
+        self._fast = False
+        self._running = False
+        self._in_flight = False
+        self._requeue = False  # a poll came due while one was in flight
+        self._paused = False
+        self._due_at = 0.0
+        self._errors = 0
+        self._window: QWidget | None = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+        self._outcome.connect(self._on_outcome)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, immediate: bool = True) -> None:
+        """Start polling; the first poll runs now unless immediate is False."""
+        if self._running:
+            return
+        self._running = True
+        self._interval = self._current_floor()
+        self._schedule(0 if immediate else self._jittered(self._interval))
+
+    def stop(self) -> None:
+        """Stop polling; the outcome of a poll still in flight is ignored."""
+        self._running = False
+        self._in_flight = False
+        self._requeue = False
+        self._timer.stop()
+
+    def poll_now(self) -> None:
+        """Skip the remaining wait and poll as soon as the current request finishes."""
+        if self._running:
+            self._schedule(0)
+
+    def set_fast(self, fast: bool) -> None:
+        """Poll at fast_interval, e.g. while matches the user is watching are live."""
+        if fast == self._fast:
+            return
+        self._fast = fast
+        if fast and self._interval > self._fast_interval:
+            self._interval = self._fast_interval
+            remaining = self._due_at - time.monotonic()
+            if self._running and not self._in_flight and remaining > self._interval:
+                self._schedule(self._jittered(self._interval))
+
+    def pause_while_hidden(self, window: QWidget) -> None:
+        """Pause while window is hidden or minimized."""
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+        self._window = window
+        window.installEventFilter(self)
+        self._set_paused(not window.isVisible() or window.isMinimized())
+
+    def report_result(self, changed: bool, fast: bool | None = None) -> None:
+        """Report a successful poll. Thread-safe."""
+        self._outcome.emit(bool(changed), fast)
+
+    def report_error(self) -> None:
+        """Report a failed poll. Thread-safe."""
+        self._outcome.emit(None, None)
+
+    # ---- internals ----
+
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self._window and event.type() in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange):
+            self._set_paused(not obj.isVisible() or obj.isMinimized())
+        return False
+
+    def _current_floor(self) -> float:
+        return self._fast_interval if self._fast else self._base
+
+    @staticmethod
+    def _jittered(seconds: float) -> float:
+        return seconds * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+    def _schedule(self, delay: float) -> None:
+        self._due_at = time.monotonic() + delay
+        if not self._paused:
+            self._timer.start(int(delay * 1000))
+
+    def _set_paused(self, paused: bool) -> None:
+        if paused == self._paused:
+            return
+        self._paused = paused
+        if paused:
+            self._timer.stop()
+        elif self._running and not self._in_flight:
+            self._timer.start(int(max(0.0, self._due_at - time.monotonic()) * 1000))
+
+    def _fire(self) -> None:
+        if not self._running or self._paused:
+            return
+        if self._in_flight:
+            self._requeue = True
+            return
+        self._in_flight = True
+        try:
+            self._poll()
+        except Exception as e:
+            log.error("%s poll failed to start: %s", self._name, e)
+            self._on_outcome(None, None)
+
+    def _on_outcome(self, changed, fast) -> None:
+        if not self._in_flight:
+            return
+        self._in_flight = False
+        if fast is not None:
+            self._fast = fast
+
+        if changed is None:
+            self._errors += 1
+            self._interval = min(self._interval * 2, self._max)
+            log.warning("%s poll failed (%d in a row), next in ~%.0fs", self._name, self._errors, self._interval)
+        else:
+            self._errors = 0
+            if changed:
+                self._interval = self._current_floor()
+            else:
+                self._interval = min(self._interval * 2, self._max)
+            if self._fast:
+                self._interval = min(self._interval, self._fast_interval)
+
+        if self._running:
+            self._schedule(0 if self._requeue else self._jittered(self._interval))
+        self._requeue = False
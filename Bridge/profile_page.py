@@ -11,8 +11,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
 )
 
-from PySide6.QtGui import QPixmap
-from rank_utils import get_rank_icon_path, apply_rank_label_style
+from rank_utils import get_rank_pixmap, apply_rank_label_style
 from config import CLR_WIDGET_BG, CLR_TEXT, CLR_TEXT_BRIGHT, format_time
 
 
@@ -119,11 +118,9 @@ class ProfilePage(QWidget):
         self._elo_label.setText(str(elo))
 
         # Update rank icon
-        pixmap = QPixmap(get_rank_icon_path(elo))
+        pixmap = get_rank_pixmap(elo, 36)
         if not pixmap.isNull():
-            self._rank_icon.setPixmap(
-                pixmap.scaled(36, 36, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self._rank_icon.setPixmap(pixmap)
         total = data.get("total_matches", 0)
         wins = data.get("total_wins", 0)
         losses = data.get("total_losses", 0)
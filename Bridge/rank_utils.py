@@ -1,6 +1,7 @@
 """Rank name/icon helpers based on elo thresholds."""
 
 import os
+from collections import OrderedDict
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import (
@@ -9,7 +10,7 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QApplication, QLabel
 
-from config import RANK_THRESHOLDS, ASSETS_DIR, RANK_COLORS, COSMIC_GRADIENT
+from config import RANK_THRESHOLDS, ASSETS_DIR, RANK_COLORS, COSMIC_GRADIENT, COSMIC_PIXMAP_CACHE_BYTES
 
 
 def get_rank_name(elo: int) -> str:
@@ -29,13 +30,55 @@ def get_rank_icon_path(elo: int) -> str:
     return os.path.join(ASSETS_DIR, f"{rank}rank.png")
 
 
+# Decoded source PNG per rank, and scaled variants per (rank, size, device pixel ratio)
+_icon_sources: dict[str, QPixmap] = {}
+_icon_scaled: dict[tuple[str, int, float], QPixmap] = {}
+
+# Sizes used across the pages and overlay, decoded up front by warm_rank_icons()
+RANK_ICON_SIZES = (20, 24, 26, 36)
+
+
+def get_rank_pixmap(elo: int, size: int, dpr: float | None = None) -> QPixmap:
+    """Return the rank icon for elo scaled to size x size logical pixels.
+
+    Each PNG is decoded once and each (rank, size, dpr) variant is scaled
+    once; later calls return the cached pixmap. The result may be null if
+    the asset is missing.
+    """
+    if dpr is None:
+        app = QApplication.instance()
+        dpr = app.devicePixelRatio() if app else 1.0
+    rank = get_rank_name(elo)
+    key = (rank, size, dpr)
+    pixmap = _icon_scaled.get(key)
+    if pixmap is None:
+        source = _icon_sources.get(rank)
+        if source is None:
+            source = _icon_sources[rank] = QPixmap(get_rank_icon_path(elo))
+        if source.isNull():
+            pixmap = source
+        else:
+            px = round(size * dpr)
+            pixmap = source.scaled(px, px, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap.setDevicePixelRatio(dpr)
+        _icon_scaled[key] = pixmap
+    return pixmap
+
+
+def warm_rank_icons(sizes: tuple[int, ...] = RANK_ICON_SIZES) -> None:
+    """Decode every rank icon and pre-scale the common sizes (call after QApplication exists)."""
+    for _name, min_elo, _max_elo in RANK_THRESHOLDS:
+        for size in sizes:
+            get_rank_pixmap(min_elo, size)
+
+
 def get_rank_color(elo: int) -> str:
     """Return the hex color string for a player's rank based on elo."""
     rank = get_rank_name(elo)
     return RANK_COLORS.get(rank, "#c9c9c9")
 
 
-def _make_cosmic_pixmap(text: str, font_size: int) -> QPixmap:
+def _make_cosmic_pixmap(text: str, font_size: int, dpr: float = 1.0) -> QPixmap:
     """Render text bold at font_size with a horizontal cosmic gradient into a QPixmap."""
     font = QApplication.font()
     font.setPixelSize(font_size)
@@ -45,7 +88,8 @@ def _make_cosmic_pixmap(text: str, font_size: int) -> QPixmap:
     w = fm.horizontalAdvance(text) + 2
     h = fm.height()
 
-    pixmap = QPixmap(w, h)
+    pixmap = QPixmap(round(w * dpr), round(h * dpr))
+    pixmap.setDevicePixelRatio(dpr)
     pixmap.fill(Qt.transparent)
 
     painter = QPainter(pixmap)
@@ -67,6 +111,43 @@ def _make_cosmic_pixmap(text: str, font_size: int) -> QPixmap:
     return pixmap
 
 
+# LRU of rendered gradient text keyed by (text, font_size, dpr), bounded by pixel bytes.
+# Entries are only valid for the application font they were drawn with.
+_cosmic_cache: OrderedDict[tuple[str, int, float], QPixmap] = OrderedDict()
+_cosmic_cache_bytes = 0
+_cosmic_font_key = ""
+
+
+def clear_cosmic_cache() -> None:
+    global _cosmic_cache_bytes
+    _cosmic_cache.clear()
+    _cosmic_cache_bytes = 0
+
+
+def cosmic_text_pixmap(text: str, font_size: int) -> QPixmap:
+    """Return text rendered in the cosmic gradient, memoized per (text, font_size, dpr)."""
+    global _cosmic_cache_bytes, _cosmic_font_key
+    app = QApplication.instance()
+    font_key = QApplication.font().key()
+    if font_key != _cosmic_font_key:
+        clear_cosmic_cache()
+        _cosmic_font_key = font_key
+
+    key = (text, font_size, app.devicePixelRatio() if app else 1.0)
+    pixmap = _cosmic_cache.get(key)
+    if pixmap is not None:
+        _cosmic_cache.move_to_end(key)
+        return pixmap
+
+    pixmap = _make_cosmic_pixmap(text, font_size, key[2])
+    _cosmic_cache[key] = pixmap
+    _cosmic_cache_bytes += pixmap.width() * pixmap.height() * 4
+    while _cosmic_cache_bytes > COSMIC_PIXMAP_CACHE_BYTES and len(_cosmic_cache) > 1:
+        _old_key, old = _cosmic_cache.popitem(last=False)
+        _cosmic_cache_bytes -= old.width() * old.height() * 4
+    return pixmap
+
+
 def apply_rank_label_style(label: QLabel, elo: int, font_size: int, extra_style: str = "") -> None:
     """Apply rank color or cosmic gradient to a name label.
 
@@ -76,7 +157,7 @@ def apply_rank_label_style(label: QLabel, elo: int, font_size: int, extra_style:
     """
     rank = get_rank_name(elo)
     if rank == "cosmic":
-        pixmap = _make_cosmic_pixmap(label.text(), font_size)
+        pixmap = cosmic_text_pixmap(label.text(), font_size)
         base = "background: transparent;"
         label.setStyleSheet(f"{base} {extra_style}".strip())
         label.setPixmap(pixmap)
@@ -92,9 +173,8 @@ def create_rank_icon(elo: int, size: int = 16) -> QLabel:
     """Return a QLabel displaying the rank icon for the given elo."""
     label = QLabel()
     label.setFixedSize(size, size)
-    path = get_rank_icon_path(elo)
-    pixmap = QPixmap(path)
+    pixmap = get_rank_pixmap(elo, size)
     if not pixmap.isNull():
-        label.setPixmap(pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        label.setPixmap(pixmap)
     label.setStyleSheet("background: transparent;")
     return label
@@ -1,46 +1,109 @@
-"""Persistent settings stored in settings.json next to the executable."""
+"""Persistent settings stored in settings.json next to the executable.
 
-import json
-import os
+The file is read once and settings are served from memory. Setters update
+memory, emit notifier.changed(key, value) and schedule a write-behind:
+saves are debounced by SETTINGS_SAVE_DELAY, run on the task pool, and go
+through durable_file (a truncated or corrupt settings.json is recovered
+from its backup). Call flush() before exit to write anything still pending.
+"""
 
-from config import SETTINGS_PATH, DEFAULT_OVERLAY_COLOR
+import logging
+import threading
 
+from PySide6.QtCore import QObject, QTimer, Signal
 
-def _load() -> dict:
-    if os.path.exists(SETTINGS_PATH):
-        with open(SETTINGS_PATH, "r") as f:
-            return json.load(f)
-    return {}
+import durable_file
+import task_pool
+from config import SETTINGS_PATH, DEFAULT_OVERLAY_COLOR, SETTINGS_SAVE_DELAY
 
+log = logging.getLogger(__name__)
 
-def _save(data: dict) -> None:
-    with open(SETTINGS_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+
+class _Notifier(QObject):
+    """Lives on the GUI thread; announces changes and debounces saves."""
+
+    changed = Signal(str, object)  # key, new value (None when removed)
+    _save_requested = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(SETTINGS_SAVE_DELAY * 1000))
+        self._timer.timeout.connect(self._save)
+        # Queued onto the GUI thread when a setter runs elsewhere
+        self._save_requested.connect(self._timer.start)
+
+    def _save(self) -> None:
+        task_pool.submit(flush, on_error=lambda e: log.error("Saving settings failed: %s", e))
+
+
+_lock = threading.Lock()
+_write_lock = threading.Lock()
+_data: dict | None = None
+_version = 0        # bumped on every change
+_saved_version = 0  # last version written to disk
+notifier = _Notifier()  # created on import, i.e. on the GUI thread
+
+
+def _settings() -> dict:
+    """The in-memory settings, read from disk on first use. Call with _lock held."""
+    global _data
+    if _data is None:
+        _data = durable_file.read_json(SETTINGS_PATH, {}, validate=lambda d: isinstance(d, dict))
+    return _data
+
+
+def _get(key: str, default):
+    with _lock:
+        return _settings().get(key, default)
+
+
+def _set(key: str, value) -> None:
+    """Set key, or remove it when value is None, then schedule a save."""
+    global _version
+    with _lock:
+        data = _settings()
+        if value is None:
+            if key not in data:
+                return
+            del data[key]
+        else:
+            if data.get(key) == value:
+                return
+            data[key] = value
+        _version += 1
+    notifier.changed.emit(key, value)
+    notifier._save_requested.emit()
+
+
+def flush() -> None:
+    """Write pending changes now. Blocking; safe to call from any thread."""
+    global _saved_version
+    with _write_lock:
+        with _lock:
+            if _data is None or _version == _saved_version:
+                return
+            snapshot, version = dict(_data), _version
+        durable_file.write_json(SETTINGS_PATH, snapshot)
+        _saved_version = version
 
 
 def get_overlay_color() -> str:
-    data = _load()
-    return data.get("overlay_color", DEFAULT_OVERLAY_COLOR)
+    return _get("overlay_color", DEFAULT_OVERLAY_COLOR)
 
 
 def set_overlay_color(color: str) -> None:
-    data = _load()
-    data["overlay_color"] = color
-    _save(data)
+    _set("overlay_color", color)
 
 
 def get_steam_id() -> str:
-    data = _load()
-    return data.get("steam_id", "")
+    return _get("steam_id", "")
 
 
 def set_steam_id(steam_id: str) -> None:
-    data = _load()
-    data["steam_id"] = steam_id
-    _save(data)
+    _set("steam_id", steam_id)
 
 
 def clear_steam_id() -> None:
-    data = _load()
-    data.pop("steam_id", None)
-    _save(data)
+    _set("steam_id", None)
@@ -0,0 +1,124 @@
+"""Startup timeline: how long the Bridge takes from launch to a usable login screen.
+
+app.py marks each step (imports, QApplication, font load, window shown,
+first paint, login ready) and finish() logs them as one line of offsets
+from launch. On Windows and Linux "launch" is the process creation time,
+so a frozen build's bootloader and interpreter start are included;
+elsewhere it is the first import of this module.
+
+With SPEEDRUN_STARTUP_REPORT set, finish() also writes the timeline there
+as JSON and quits the app; tools/bench_startup.py launches the Bridge
+this way.
+"""
+
+import time
+
+# Taken before anything else is imported; app.py imports this module first
+_t0 = time.perf_counter()
+_t0_wall = time.time()
+
+import json
+import logging
+import os
+import threading
+
+from PySide6.QtCore import QCoreApplication, QEvent, QMetaObject, QObject, Qt, QTimer
+
+from config import STARTUP_REPORT_PATH
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_marks: list[tuple[str, float]] = []  # (step, perf_counter)
+_finished = False
+
+
+def _process_start() -> float | None:
+    """Creation time of this process as a time.time() value, if the OS tells us."""
+    try:
+        if os.name == "nt":
+            import ctypes
+            from ctypes import wintypes
+            times = [wintypes.FILETIME() for _ in range(4)]
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.GetProcessTimes(kernel32.GetCurrentProcess(), *map(ctypes.byref, times)):
+                return None
+            ticks = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+            return ticks / 1e7 - 11644473600  # 100 ns ticks since 1601 -> Unix epoch
+        if os.path.exists("/proc/self/stat"):
+            # Start time is in clock ticks since boot; /proc/uptime is more
+            # precise than /proc/stat's btime for turning that into a date
+            with open("/proc/self/stat") as f:
+                start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+            with open("/proc/uptime") as f:
+                uptime = float(f.read().split()[0])
+            return time.time() - (uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except Exception:
+        pass
+    return None
+
+
+def _launch_offset() -> float:
+    """Seconds from process creation to this module's import (0 if unknown)."""
+    start = _process_start()
+    return max(_t0_wall - start, 0.0) if start is not None else 0.0
+
+
+def mark(step: str) -> None:
+    """Record that step just finished. Repeated steps keep their first time."""
+    with _lock:
+        if _finished or any(name == step for name, _ in _marks):
+            return
+        _marks.append((step, time.perf_counter()))
+
+
+def timeline() -> dict[str, float]:
+    """Milliseconds from launch to each step marked so far, in order."""
+    offset = _launch_offset()
+    with _lock:
+        marks = list(_marks)
+    steps = {"interpreter": offset * 1000} if offset else {}
+    for step, t in marks:
+        steps[step] = (offset + t - _t0) * 1000
+    return steps
+
+
+def finish(step: str) -> None:
+    """Mark the last step and log the whole timeline (once)."""
+    global _finished
+    mark(step)
+    with _lock:
+        if _finished:
+            return
+        _finished = True
+    steps = timeline()
+    log.info("Startup timeline (ms since launch): %s",
+             ", ".join(f"{name} {ms:.0f}" for name, ms in steps.items()))
+    if STARTUP_REPORT_PATH:
+        with open(STARTUP_REPORT_PATH, "w", encoding="utf-8") as f:
+            json.dump({"timeline": steps, "launch_known": _process_start() is not None}, f)
+        # finish() may run on a worker thread (auto-login signals)
+        QMetaObject.invokeMethod(QCoreApplication.instance(), "quit", Qt.QueuedConnection)
+
+
+class _FirstPaint(QObject):
+    def __init__(self, app, callback):
+        super().__init__(app)
+        self._app = app
+        self._callback = callback
+        app.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self._app.removeEventFilter(self)
+            self.deleteLater()
+            mark("first paint")
+            if self._callback is not None:
+                # Not from inside the paint event
+                QTimer.singleShot(0, self._callback)
+        return False
+
+
+def on_first_paint(app, callback=None) -> None:
+    """Mark "first paint" when any widget first paints, then call callback soon after."""
+    _FirstPaint(app, callback)
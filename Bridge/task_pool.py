@@ -0,0 +1,182 @@
+"""Shared bounded worker pool for blocking work (HTTP calls, cache reads).
+
+    task_pool.submit(api_client.get_leaderboard, key="leaderboard",
+                     group="leaderboard_page", on_result=self._populate)
+
+- Work runs on at most TASK_POOL_WORKERS daemon threads, started on demand
+  and then reused, so no thread is created per request. (Daemon threads,
+  unlike concurrent.futures workers, never hold up app exit on a slow call.)
+- Tasks submitted with the same key while one is in flight share it: fn runs
+  once and every submitter gets the result.
+- on_result / on_error are delivered on the GUI thread through a Qt signal.
+- cancel_group(group) abandons every subscription in the group. Callbacks are
+  never delivered for cancelled subscriptions, and tasks that haven't started
+  and have no live subscribers are dropped from the queue.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, Signal
+
+from config import TASK_POOL_WORKERS
+
+log = logging.getLogger(__name__)
+
+
+class TaskHandle:
+    """One submitter's interest in a (possibly shared) task."""
+
+    def __init__(self, task: "_Task", group: str | None,
+                 on_result: Callable[[Any], None] | None, on_error: Callable[[Exception], None] | None):
+        self._task = task
+        self.group = group
+        self.on_result = on_result
+        self.on_error = on_error
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Never deliver this handle's callbacks; drop the task if nobody else wants it."""
+        with _lock:
+            self._cancel_locked()
+
+    def _cancel_locked(self) -> None:
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self.group:
+            _groups.get(self.group, set()).discard(self)
+        task = self._task
+        if not task.started and all(h.cancelled for h in task.handles):
+            task.dropped = True
+            if task.key is not None and _inflight.get(task.key) is task:
+                del _inflight[task.key]
+
+
+class _Task:
+    def __init__(self, key, fn: Callable, args: tuple):
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.handles: list[TaskHandle] = []
+        self.started = False
+        self.dropped = False
+
+
+class _Relay(QObject):
+    """Lives on the GUI thread; hops finished tasks back to it."""
+
+    finished = Signal(object, object, object)  # handles, result, error
+
+    def __init__(self):
+        super().__init__()
+        self.finished.connect(self._deliver)
+
+    def _deliver(self, handles: list[TaskHandle], result, error) -> None:
+        for handle in handles:
+            if handle.cancelled:
+                continue
+            if handle.group:
+                with _lock:
+                    _groups.get(handle.group, set()).discard(handle)
+            callback = handle.on_error if error is not None else handle.on_result
+            try:
+                if error is not None:
+                    if callback is None:
+                        log.error("Background task failed: %s", error)
+                    else:
+                        callback(error)
+                elif callback is not None:
+                    callback(result)
+            except Exception:
+                log.exception("Task callback raised")
+
+
+_queue: "queue.SimpleQueue[_Task]" = queue.SimpleQueue()
+_workers: list[threading.Thread] = []
+_idle = 0    # workers waiting on the queue
+_queued = 0  # tasks put on the queue and not yet taken by a worker
+_lock = threading.Lock()
+_inflight: dict[Any, _Task] = {}
+_groups: dict[str, set[TaskHandle]] = {}
+_stats = {"submitted": 0, "coalesced": 0, "cancelled": 0}
+_relay = _Relay()  # created on import, i.e. on the GUI thread
+
+
+def submit(fn: Callable, *args, key=None, group: str | None = None,
+           on_result: Callable[[Any], None] | None = None,
+           on_error: Callable[[Exception], None] | None = None) -> TaskHandle:
+    """Run fn(*args) on the pool; callbacks are invoked on the GUI thread."""
+    global _queued
+    with _lock:
+        task = _inflight.get(key) if key is not None else None
+        if task is not None:
+            _stats["coalesced"] += 1
+        else:
+            _stats["submitted"] += 1
+            task = _Task(key, fn, args)
+            if key is not None:
+                _inflight[key] = task
+            _queue.put(task)
+            _queued += 1
+            # An idle worker may be about to take an earlier task, so compare
+            # against the backlog rather than just checking for an idle one
+            if _queued > _idle and len(_workers) < TASK_POOL_WORKERS:
+                worker = threading.Thread(target=_worker_loop, name=f"task-{len(_workers)}", daemon=True)
+                _workers.append(worker)
+                worker.start()
+        handle = TaskHandle(task, group, on_result, on_error)
+        task.handles.append(handle)
+        if group:
+            _groups.setdefault(group, set()).add(handle)
+    return handle
+
+
+def _worker_loop() -> None:
+    global _idle, _queued
+    while True:
+        with _lock:
+            _idle += 1
+        task = _queue.get()
+        with _lock:
+            _idle -= 1
+            _queued -= 1
+            if task.dropped:
+                continue
+            task.started = True
+        _run(task)
+
+
+def _run(task: _Task) -> None:
+    result, error = None, None
+    try:
+        result = task.fn(*task.args)
+    except Exception as e:
+        error = e
+    with _lock:
+        # Later submits with this key start a fresh task. submit() holds the
+        # lock until its handle is attached, so no result is ever dropped.
+        if task.key is not None and _inflight.get(task.key) is task:
+            del _inflight[task.key]
+        handles = [h for h in task.handles if not h.cancelled]
+    if handles:
+        _relay.finished.emit(handles, result, error)
+    elif error is not None:
+        log.debug("Abandoned task failed: %s", error)
+
+
+def cancel_group(group: str) -> None:
+    """Abandon every pending subscription submitted with this group."""
+    with _lock:
+        handles = _groups.pop(group, set())
+        for handle in handles:
+            handle._cancel_locked()
+        _stats["cancelled"] += len(handles)
+
+
+def stats() -> dict:
+    """Return submitted / coalesced / cancelled counters and the pool's thread count."""
+    with _lock:
+        return {**_stats, "threads": len(_workers)}
@@ -0,0 +1,79 @@
+"""Font-size fitting for text that must shrink to fit a box.
+
+Glyph advance scales linearly with pixel size, so each (family, bold, text)
+is measured once at a reference size and the fitting size is derived from
+that ratio, then checked against real integer metrics (which round a pixel
+either way). Results are memoized, so repeated fits of the same text,
+e.g. during an overlay drag-resize, cost a dict lookup.
+
+Must be called from the GUI thread.
+"""
+
+import math
+from functools import lru_cache
+
+from PySide6.QtGui import QFont, QFontMetrics, QFontMetricsF
+
+_REF_PX = 100
+
+
+def _font(family: str, bold: bool, size: int) -> QFont:
+    f = QFont(family)
+    f.setPixelSize(size)
+    f.setBold(bold)
+    return f
+
+
+@lru_cache(maxsize=4096)
+def _advance_per_px(family: str, bold: bool, text: str) -> float:
+    return QFontMetricsF(_font(family, bold, _REF_PX)).horizontalAdvance(text) / _REF_PX
+
+
+@lru_cache(maxsize=64)
+def _height_per_px(family: str, bold: bool) -> float:
+    return QFontMetricsF(_font(family, bold, _REF_PX)).height() / _REF_PX
+
+
+def _fits(family: str, bold: bool, text: str, size: int, max_width: int, max_height: int | None) -> bool:
+    fm = QFontMetrics(_font(family, bold, size))
+    if fm.horizontalAdvance(text) > max_width:
+        return False
+    return max_height is None or fm.height() <= max_height
+
+
+@lru_cache(maxsize=4096)
+def _fit(family: str, bold: bool, text: str, max_width: int, max_height: int | None,
+         min_size: int, max_size: int, step: int) -> int:
+    if max_size <= min_size:
+        return min_size
+
+    size = max_size
+    per_px = _advance_per_px(family, bold, text)
+    if per_px > 0:
+        size = min(size, int(max_width / per_px))
+    if max_height is not None:
+        size = min(size, int(max_height / _height_per_px(family, bold)))
+    # Snap down onto the max_size - k*step grid
+    size = max_size - math.ceil((max_size - size) / step) * step
+    size = max(size, min_size)
+
+    # Integer metrics round per size, so the estimate can be off by a step either way
+    if _fits(family, bold, text, size, max_width, max_height):
+        while size + step <= max_size and _fits(family, bold, text, size + step, max_width, max_height):
+            size += step
+    else:
+        while size > min_size and not _fits(family, bold, text, size, max_width, max_height):
+            size -= step
+    return max(size, min_size)
+
+
+def fit_font_size(text: str, max_width: int, max_height: int | None = None, *, bold: bool = True,
+                  min_size: int = 10, max_size: int = 24, step: int = 1) -> int:
+    """Largest pixel size in max_size, max_size - step, ... min_size at which text fits the box."""
+    return _fit(QFont().family(), bold, text, max_width, max_height, min_size, max_size, step)
+
+
+def clear_cache() -> None:
+    _advance_per_px.cache_clear()
+    _height_per_px.cache_clear()
+    _fit.cache_clear()
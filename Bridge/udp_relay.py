@@ -4,15 +4,35 @@ Both sides listen on known ports. The Game initiates contact by sending
 a ping to the Bridge's port. The Bridge only starts its heartbeat pings
 after receiving that first message, so nothing is sent when no Game is
 running.
+
+Match events can take a fast path (set_fast_path): they are handed to a
+forwarder on the receive thread, ahead of the Qt signals, so relaying them
+to the server doesn't wait on the GUI event loop.
+
+Critical messages (send_critical) carry a sequence id that the Game echoes
+back as ack_seq. Each one is tracked until its own ack arrives, and one
+timer thread retransmits unacked messages with backoff.
+
+Datagrams are JSON, or wire_codec's binary frames for the frequent events
+once the Game accepts them in the version handshake.
 """
 
+import concurrent.futures
+import heapq
+import itertools
 import json
+import logging
+import random
 import socket
+import statistics
 import threading
 import time
+from collections import deque
+from typing import Callable
 
 from PySide6.QtCore import QObject, Signal
 
+import wire_codec
 from config import (
     UDP_HOST,
     GAME_UDP_PORT,
@@ -22,8 +42,109 @@ from config import (
     UDP_PONG_TIMEOUT,
     UDP_RETRY_INTERVAL,
     UDP_RETRY_MAX,
+    UDP_RETRY_BACKOFF,
+    UDP_RETRY_MAX_INTERVAL,
+    RELAY_LATENCY_WINDOW,
 )
 
+log = logging.getLogger(__name__)
+
+# Game events relayed during a match; eligible for the fast path
+MATCH_EVENTS = frozenset({
+    "progress", "death", "instant_restart", "completion",
+    "request_seed_change", "request_draw", "forfeit",
+})
+
+
+class RelayLatency:
+    """Rolling window of relay latencies (datagram received -> handed to the WS)."""
+
+    def __init__(self, size: int = RELAY_LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=size)
+        self.total = 0
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.total += 1
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def summary(self) -> dict:
+        """count / p50 / p99 / max over the window, in milliseconds."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0, "total": self.total}
+        return {
+            "count": len(samples),
+            "total": self.total,
+            "p50_ms": statistics.median(samples) * 1000,
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+            "max_ms": samples[-1] * 1000,
+        }
+
+
+class _Pending:
+    """A critical message waiting for its ack."""
+
+    __slots__ = ("seq", "event", "raw", "sends", "first_sent", "future")
+
+    def __init__(self, seq: int, event: str, raw: bytes):
+        self.seq = seq
+        self.event = event
+        self.raw = raw
+        self.sends = 0
+        self.first_sent = 0.0
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+
+
+class _TimerThread:
+    """One thread running scheduled callbacks (resends, coalescing windows) in deadline order."""
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, Callable, tuple]] = []
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        # Each start() runs a thread for a new generation, and a thread exits
+        # once the generation moves on, so an old thread still waking up
+        # after stop() + start() (logout, login) never services the new heap
+        self._generation = 0
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._generation += 1
+            self._heap.clear()
+            generation = self._generation
+        threading.Thread(target=self._run, args=(generation,), name="udp-timer", daemon=True).start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._generation += 1
+            self._cond.notify_all()
+
+    def call_later(self, delay: float, fn: Callable, *args) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._order), fn, args))
+            self._cond.notify_all()
+
+    def _run(self, generation: int) -> None:
+        while True:
+            with self._cond:
+                while self._generation == generation and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    self._cond.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                if self._generation != generation:
+                    return
+                _, _, fn, args = heapq.heappop(self._heap)
+            try:
+                fn(*args)
+            except Exception:
+                log.exception("Timer callback raised")
+
 
 class UDPRelay(QObject):
     """Communicates with the Game over UDP.
@@ -61,6 +182,18 @@ class UDPRelay(QObject):
         self._game_alive = False
         self._recv_thread: threading.Thread | None = None
         self._ping_thread: threading.Thread | None = None
+        self._fast_path: Callable[[str, dict], bool] | None = None
+        self._wire_binary = False  # Game accepted wire_codec frames
+        self.relay_latency = RelayLatency()
+
+        # Reliable delivery for send_critical. Sequence ids start at a random
+        # base so a restarted Bridge doesn't reuse ids the Game just saw.
+        self._seq = itertools.count(random.randrange(1, 1 << 30))
+        self._pending: dict[int, _Pending] = {}
+        self._pending_lock = threading.Lock()
+        self._timer = _TimerThread()
+        self._delivery = {"sent": 0, "delivered": 0, "retransmits": 0, "failed": 0}
+        self.ack_latency = RelayLatency()
 
     def start(self) -> None:
         """Bind to the Bridge's known port and start listener threads.
@@ -79,9 +212,13 @@ class UDPRelay(QObject):
         self._ping_thread = threading.Thread(target=self._ping_loop, daemon=True)
         self._ping_thread.start()
 
+        self._timer.start()
+
     def stop(self) -> None:
         """Shut down the UDP relay."""
         self._running = False
+        self._timer.stop()
+        self._cancel_pending()
         if self._sock:
             try:
                 self._sock.close()
@@ -90,40 +227,111 @@ class UDPRelay(QObject):
             self._sock = None
 
     def send_to_game(self, data: dict) -> None:
-        """Send a JSON message to the Game's server."""
+        """Send a message to the Game's server (binary frame once negotiated, else JSON)."""
+        try:
+            raw = wire_codec.encode(data) if self._wire_binary else None
+            self._send_raw(raw if raw is not None else json.dumps(data).encode("utf-8"))
+        except Exception:
+            pass
+
+    def _send_raw(self, raw: bytes) -> None:
         if self._sock:
-            try:
-                raw = json.dumps(data).encode("utf-8")
-                self._sock.sendto(raw, self._game_addr)
-            except Exception:
-                pass
+            self._sock.sendto(raw, self._game_addr)
+
+    def set_fast_path(self, forward: Callable[[str, dict], bool] | None) -> None:
+        """Hand MATCH_EVENTS to forward(event, data) on the receive thread.
+
+        forward must be thread-safe and return True if it relayed the event;
+        those are timed into relay_latency. The Qt signals still fire
+        afterwards for the UI.
+        """
+        self._fast_path = forward
+
+    def call_later(self, delay: float, fn: Callable[[], None]) -> None:
+        """Run fn on the relay's timer thread after delay seconds (while started)."""
+        self._timer.call_later(delay, fn)
 
     def request_game_version(self) -> None:
-        """Ask the Game to report its mod version."""
-        self.send_to_game({"event": "version_request"})
+        """Ask the Game to report its mod version and offer the binary wire format."""
+        self.send_to_game({"event": "version_request", "wire": [wire_codec.WIRE_VERSION]})
 
-    def send_critical(self, data: dict) -> None:
-        """Send a critical message with retry-until-ack.
+    def send_critical(self, data: dict) -> concurrent.futures.Future:
+        """Send a critical message and retransmit it until the Game acks it.
 
-        Retries up to UDP_RETRY_MAX times at UDP_RETRY_INTERVAL intervals.
-        Waits for an ack message from the Game with the matching event name.
+        The message is tagged with a sequence id (seq) that the Game echoes
+        as ack_seq, so several critical messages can be in flight at once.
+        Resends start after UDP_RETRY_INTERVAL and back off by
+        UDP_RETRY_BACKOFF, up to UDP_RETRY_MAX sends in total. The returned
+        future resolves True on ack, or False when retries run out (the
+        message may have been received anyway).
         """
-        event_name = data.get("event", "")
-
-        def _retry():
-            for _ in range(UDP_RETRY_MAX):
-                self.send_to_game(data)
-                # Wait for ack (checked via _ack_received flag)
-                time.sleep(UDP_RETRY_INTERVAL)
-                if self._ack_received == event_name:
-                    self._ack_received = ""
-                    return
-            # Give up after max retries — message may have been received anyway
+        with self._pending_lock:
+            seq = next(self._seq)
+            pending = _Pending(seq, data.get("event", ""), json.dumps({**data, "seq": seq}).encode("utf-8"))
+            self._pending[seq] = pending
+            self._delivery["sent"] += 1
+        pending.first_sent = time.perf_counter()
+        self._transmit(pending)
+        return pending.future
 
-        self._ack_received = ""
-        threading.Thread(target=_retry, daemon=True).start()
+    def delivery_stats(self) -> dict:
+        """Counters for critical messages plus ack round-trip times in ms."""
+        with self._pending_lock:
+            stats = {**self._delivery, "in_flight": len(self._pending)}
+        for name, value in self.ack_latency.summary().items():
+            if name.endswith("_ms"):
+                stats[f"ack_{name}"] = value
+        return stats
 
-    _ack_received: str = ""
+    def _transmit(self, pending: _Pending) -> None:
+        pending.sends += 1
+        try:
+            self._send_raw(pending.raw)
+        except Exception:
+            pass
+        delay = min(UDP_RETRY_INTERVAL * UDP_RETRY_BACKOFF ** (pending.sends - 1), UDP_RETRY_MAX_INTERVAL)
+        self._schedule_retransmit(delay, pending.seq)
+
+    def _schedule_retransmit(self, delay: float, seq: int) -> None:
+        self._timer.call_later(delay, self._retransmit, seq)
+
+    def _retransmit(self, seq: int) -> None:
+        with self._pending_lock:
+            pending = self._pending.get(seq)
+            if pending is None:
+                return  # acked or cancelled meanwhile
+            give_up = pending.sends >= UDP_RETRY_MAX
+            if give_up:
+                del self._pending[seq]
+                self._delivery["failed"] += 1
+            else:
+                self._delivery["retransmits"] += 1
+        if give_up:
+            log.warning("No ack for %s (seq %d) after %d sends", pending.event, seq, pending.sends)
+            pending.future.set_result(False)
+        else:
+            self._transmit(pending)
+
+    def _on_ack(self, data: dict) -> None:
+        event = data.get("ack_event", "")
+        seq = data.get("ack_seq")
+        with self._pending_lock:
+            if seq is None:
+                # Mods without sequence ids: the ack is for the oldest message of that event
+                seq = next((s for s, p in self._pending.items() if p.event == event), None)
+            pending = self._pending.pop(seq, None)
+            if pending is not None:
+                self._delivery["delivered"] += 1
+        if pending is not None:
+            self.ack_latency.add(time.perf_counter() - pending.first_sent)
+            pending.future.set_result(True)
+        self.game_ack.emit(event)
+
+    def _cancel_pending(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for p in pending:
+            p.future.cancel()
 
     def _recv_loop(self) -> None:
         while self._running:
@@ -141,60 +349,81 @@ class UDPRelay(QObject):
                 break
 
             try:
-                data = json.loads(raw.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                continue
+                self._handle_datagram(raw)
+            except Exception:
+                # One bad datagram or failed relay must not end the session
+                log.exception("Error handling datagram from the Game")
 
-            event = data.get("event")
-            if not event:
-                continue
+    def _handle_datagram(self, raw: bytes) -> None:
+        """Parse one datagram from the Game and emit the matching signal."""
+        received = time.perf_counter()
+        data = wire_codec.loads(raw)
+        if data is None:
+            return
 
-            if not self._game_alive:
-                self._game_alive = True
-                self._last_pong_time = time.time()
-                self.game_connected.emit()
-
-            if event == "pong":
-                self._last_pong_time = time.time()
-            elif event == "ping":
-                self.send_to_game({"event": "pong"})
-                self._last_pong_time = time.time()
-            elif event == "ack":
-                self._ack_received = data.get("ack_event", "")
-                self.game_ack.emit(self._ack_received)
-            elif event == "queue_ready":
-                self.game_queue_ready.emit()
-            elif event == "queue_leave":
-                self.game_queue_leave.emit()
-            elif event == "ban":
-                self.game_ban.emit(data.get("category", ""))
-            elif event == "progress":
-                self.game_progress.emit(data.get("area", 0), data.get("level", 0), data.get("theme", 0))
-            elif event == "death":
-                self.game_death.emit()
-            elif event == "instant_restart":
-                self.game_instant_restart.emit()
-            elif event == "completion":
-                self.game_completion.emit()
-            elif event == "version_response":
-                self.game_version_received.emit(float(data.get("version", 0.0)))
-            elif event == "send_chat":
-                self.game_send_chat.emit(data.get("message", ""))
-            elif event == "request_seed_change":
-                self.game_request_seed_change.emit()
-            elif event == "request_draw":
-                self.game_request_draw.emit()
-            elif event == "forfeit":
-                self.game_forfeit.emit()
-            elif event == "close_postmatch":
-                self.game_close_postmatch.emit()
+        event = data.get("event")
+        if not event:
+            return
+
+        if not self._game_alive:
+            self._game_alive = True
+            self._last_pong_time = time.time()
+            self.game_connected.emit()
+
+        forward = self._fast_path
+        if forward is not None and event in MATCH_EVENTS:
+            try:
+                if forward(event, data):
+                    self.relay_latency.add(time.perf_counter() - received)
+            except Exception:
+                log.exception("Fast-path relay of %s failed", event)
+
+        if event == "pong":
+            self._last_pong_time = time.time()
+        elif event == "ping":
+            self.send_to_game({"event": "pong"})
+            self._last_pong_time = time.time()
+        elif event == "ack":
+            self._on_ack(data)
+        elif event == "queue_ready":
+            self.game_queue_ready.emit()
+        elif event == "queue_leave":
+            self.game_queue_leave.emit()
+        elif event == "ban":
+            self.game_ban.emit(data.get("category", ""))
+        elif event == "progress":
+            self.game_progress.emit(data.get("area", 0), data.get("level", 0), data.get("theme", 0))
+        elif event == "death":
+            self.game_death.emit()
+        elif event == "instant_restart":
+            self.game_instant_restart.emit()
+        elif event == "completion":
+            self.game_completion.emit()
+        elif event == "version_response":
+            self._wire_binary = data.get("wire") == wire_codec.WIRE_VERSION
+            self.game_version_received.emit(float(data.get("version", 0.0)))
+        elif event == "send_chat":
+            self.game_send_chat.emit(data.get("message", ""))
+        elif event == "request_seed_change":
+            self.game_request_seed_change.emit()
+        elif event == "request_draw":
+            self.game_request_draw.emit()
+        elif event == "forfeit":
+            self.game_forfeit.emit()
+        elif event == "close_postmatch":
+            self.game_close_postmatch.emit()
 
     def _ping_loop(self) -> None:
         while self._running:
             time.sleep(UDP_PING_INTERVAL)
-            self.send_to_game({"event": "ping"})
-            if self._game_alive:
-                elapsed = time.time() - self._last_pong_time
-                if elapsed > UDP_PONG_TIMEOUT:
-                    self._game_alive = False
-                    self.game_disconnected.emit()
+            self._heartbeat()
+
+    def _heartbeat(self) -> None:
+        """Ping the Game and report it gone once pongs stop arriving."""
+        self.send_to_game({"event": "ping"})
+        if self._game_alive:
+            elapsed = time.time() - self._last_pong_time
+            if elapsed > UDP_PONG_TIMEOUT:
+                self._game_alive = False
+                self._wire_binary = False  # renegotiated on the next version_request
+                self.game_disconnected.emit()
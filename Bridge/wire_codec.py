@@ -0,0 +1,96 @@
+"""Compact binary encoding for the frequent Bridge <-> Game UDP messages.
+
+A binary frame starts with a one-byte event code (>= 0x80, so it can never
+be mistaken for a JSON object, which starts with '{') followed by fixed
+little-endian fields:
+
+    ping / pong / death / instant_restart / completion    code
+    progress           code, area u8, level u8, theme u8
+    opponent_progress  code, area u8, theme u8
+    ack                code, ack_seq u32, ack_event (utf-8, rest of frame)
+
+Everything else (and any value that doesn't fit its field) stays JSON. The
+Bridge offers WIRE_VERSION in version_request; a mod that understands it
+answers with the same "wire" value in version_response, and from then on
+both sides send binary frames for these events. Both sides always accept
+either form, so a frame in flight during the handshake is never lost.
+Keep the codes in sync with WIRE_CODES in main.lua.
+"""
+
+import json
+import struct
+
+WIRE_VERSION = 1
+
+_CODES = {
+    "ping": 0x80,
+    "pong": 0x81,
+    "ack": 0x82,
+    "progress": 0x83,
+    "death": 0x84,
+    "instant_restart": 0x85,
+    "completion": 0x86,
+    "opponent_progress": 0x87,
+}
+_EVENTS = {code: event for event, code in _CODES.items()}
+
+_PROGRESS = struct.Struct("<BBBB")
+_OPPONENT_PROGRESS = struct.Struct("<BBB")
+_ACK = struct.Struct("<BI")
+
+# Pre-built frames for the events without fields
+_BARE = {event: bytes([code]) for event, code in _CODES.items()
+         if event in ("ping", "pong", "death", "instant_restart", "completion")}
+
+
+def encode(data: dict) -> bytes | None:
+    """Binary frame for data, or None if it must go as JSON."""
+    event = data.get("event")
+    bare = _BARE.get(event)
+    if bare is not None:
+        return bare
+    try:
+        if event == "progress":
+            return _PROGRESS.pack(_CODES["progress"], data.get("area", 0), data.get("level", 0), data.get("theme", 0))
+        if event == "opponent_progress":
+            return _OPPONENT_PROGRESS.pack(_CODES["opponent_progress"], data.get("area", 0), data.get("theme", 0))
+        if event == "ack":
+            return _ACK.pack(_CODES["ack"], data.get("ack_seq") or 0) + data.get("ack_event", "").encode("utf-8")
+    except struct.error:
+        pass  # out of range for the field; send as JSON
+    return None
+
+
+def decode(raw: bytes) -> dict | None:
+    """Parse a binary frame; None if it is malformed or uses an unknown code."""
+    event = _EVENTS.get(raw[0]) if raw else None
+    if event is None:
+        return None
+    try:
+        if event == "progress":
+            _, area, level, theme = _PROGRESS.unpack(raw)
+            return {"event": event, "area": area, "level": level, "theme": theme}
+        if event == "opponent_progress":
+            _, area, theme = _OPPONENT_PROGRESS.unpack(raw)
+            return {"event": event, "area": area, "theme": theme}
+        if event == "ack":
+            _, seq = _ACK.unpack_from(raw)
+            return {"event": event, "ack_seq": seq or None, "ack_event": raw[_ACK.size:].decode("utf-8")}
+    except (struct.error, UnicodeDecodeError):
+        return None
+    return {"event": event} if len(raw) == 1 else None
+
+
+def is_binary(raw: bytes) -> bool:
+    return bool(raw) and raw[0] >= 0x80
+
+
+def loads(raw: bytes) -> dict | None:
+    """Decode a datagram in either form; None if it can't be parsed."""
+    if is_binary(raw):
+        return decode(raw)
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
@@ -1,12 +1,18 @@
 """WebSocket client wrapping python-socketio with Qt signals for thread-safe UI updates."""
 
+import logging
 import threading
-import socketio
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
 
 from config import WS_URL, WS_NAMESPACE
 
+if TYPE_CHECKING:
+    import socketio
+
+log = logging.getLogger(__name__)
+
 
 class WSClient(QObject):
     """Manages the socketio.Client connection to the server's /ws/match namespace.
@@ -31,35 +37,60 @@ class WSClient(QObject):
     receive_draw_request = Signal()
     postmatch_closed = Signal()
 
+    # Active matches feed (see subscribe_active_matches)
+    active_matches_snapshot = Signal(dict)  # {active_matches, recently_finished}
+    active_match_added = Signal(dict)       # full active match
+    active_match_progress = Signal(dict)    # {match_id, changed fields...}
+    active_match_finished = Signal(dict)    # {match_id, winner_id, ...}
+
+    _client_class = "Client"  # in socketio, which is imported on first connect
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._sio: socketio.Client | None = None
+        self._sio: "socketio.Client | None" = None
         self._steam_id: str = ""
+        self._active_subscribed: bool = False
+        # Emits come from the GUI, UDP and timer threads; socketio's sync
+        # Client.emit isn't documented as thread-safe, so they take turns
+        self._emit_lock = threading.Lock()
 
     def connect_to_server(self, steam_id: str) -> None:
         """Connect to the server WebSocket. Call from main thread."""
         self._steam_id = steam_id
 
-        self._sio = socketio.Client(reconnection=True, reconnection_attempts=5)
-
-        # Register event handlers on the namespace
-        self._sio.on("connect", self._on_connect, namespace=WS_NAMESPACE)
-        self._sio.on("disconnect", self._on_disconnect, namespace=WS_NAMESPACE)
-        self._sio.on("paired", self._on_paired, namespace=WS_NAMESPACE)
-        self._sio.on("ban_update", self._on_ban_update, namespace=WS_NAMESPACE)
-        self._sio.on("match_start", self._on_match_start, namespace=WS_NAMESPACE)
-        self._sio.on("opponent_progress", self._on_opponent_progress, namespace=WS_NAMESPACE)
-        self._sio.on("match_result", self._on_match_result, namespace=WS_NAMESPACE)
-        self._sio.on("match_scrapped", self._on_match_scrapped, namespace=WS_NAMESPACE)
-        self._sio.on("receive_chat", self._on_receive_chat, namespace=WS_NAMESPACE)
-        self._sio.on("receive_seed_change_request", self._on_receive_seed_change_request, namespace=WS_NAMESPACE)
-        self._sio.on("do_seed_change", self._on_do_seed_change, namespace=WS_NAMESPACE)
-        self._sio.on("receive_draw_request", self._on_receive_draw_request, namespace=WS_NAMESPACE)
-        self._sio.on("postmatch_closed", self._on_postmatch_closed, namespace=WS_NAMESPACE)
+        self._sio = self._make_client()
+        self._start_connect()
 
+    def _start_connect(self) -> None:
         # Run connection on a background thread
         threading.Thread(target=self._do_connect, daemon=True).start()
 
+    def _make_client(self) -> "socketio.Client":
+        import socketio
+        sio = getattr(socketio, self._client_class)(reconnection=True, reconnection_attempts=5)
+
+        # Register event handlers on the namespace
+        sio.on("connect", self._on_connect, namespace=WS_NAMESPACE)
+        sio.on("disconnect", self._on_disconnect, namespace=WS_NAMESPACE)
+        sio.on("paired", self._on_paired, namespace=WS_NAMESPACE)
+        sio.on("ban_update", self._on_ban_update, namespace=WS_NAMESPACE)
+        sio.on("match_start", self._on_match_start, namespace=WS_NAMESPACE)
+        sio.on("opponent_progress", self._on_opponent_progress, namespace=WS_NAMESPACE)
+        sio.on("match_result", self._on_match_result, namespace=WS_NAMESPACE)
+        sio.on("match_scrapped", self._on_match_scrapped, namespace=WS_NAMESPACE)
+        sio.on("receive_chat", self._on_receive_chat, namespace=WS_NAMESPACE)
+        sio.on("receive_seed_change_request", self._on_receive_seed_change_request, namespace=WS_NAMESPACE)
+        sio.on("do_seed_change", self._on_do_seed_change, namespace=WS_NAMESPACE)
+        sio.on("receive_draw_request", self._on_receive_draw_request, namespace=WS_NAMESPACE)
+        sio.on("postmatch_closed", self._on_postmatch_closed, namespace=WS_NAMESPACE)
+
+        # Active matches feed (only delivered while subscribed)
+        sio.on("active_matches_snapshot", self._on_active_matches_snapshot, namespace=WS_NAMESPACE)
+        sio.on("match_added", self._on_match_added, namespace=WS_NAMESPACE)
+        sio.on("match_progress", self._on_match_progress, namespace=WS_NAMESPACE)
+        sio.on("match_finished", self._on_match_finished, namespace=WS_NAMESPACE)
+        return sio
+
     def _do_connect(self):
         try:
             self._sio.connect(
@@ -73,82 +104,94 @@ class WSClient(QObject):
 
     def reconnect(self) -> None:
         """Attempt to reconnect to the server. Call from main thread."""
-        if self._sio:
-            try:
-                self._sio.disconnect()
-            except Exception:
-                pass
-        self._sio = socketio.Client(reconnection=True, reconnection_attempts=5)
-        self._sio.on("connect", self._on_connect, namespace=WS_NAMESPACE)
-        self._sio.on("disconnect", self._on_disconnect, namespace=WS_NAMESPACE)
-        self._sio.on("paired", self._on_paired, namespace=WS_NAMESPACE)
-        self._sio.on("ban_update", self._on_ban_update, namespace=WS_NAMESPACE)
-        self._sio.on("match_start", self._on_match_start, namespace=WS_NAMESPACE)
-        self._sio.on("opponent_progress", self._on_opponent_progress, namespace=WS_NAMESPACE)
-        self._sio.on("match_result", self._on_match_result, namespace=WS_NAMESPACE)
-        self._sio.on("match_scrapped", self._on_match_scrapped, namespace=WS_NAMESPACE)
-        self._sio.on("receive_chat", self._on_receive_chat, namespace=WS_NAMESPACE)
-        self._sio.on("receive_seed_change_request", self._on_receive_seed_change_request, namespace=WS_NAMESPACE)
-        self._sio.on("do_seed_change", self._on_do_seed_change, namespace=WS_NAMESPACE)
-        self._sio.on("receive_draw_request", self._on_receive_draw_request, namespace=WS_NAMESPACE)
-        self._sio.on("postmatch_closed", self._on_postmatch_closed, namespace=WS_NAMESPACE)
-        threading.Thread(target=self._do_connect, daemon=True).start()
+        self._close_client()
+        self._sio = self._make_client()
+        self._start_connect()
 
     def disconnect_from_server(self) -> None:
+        self._close_client()
+
+    def _close_client(self) -> None:
         if self._sio:
             try:
                 self._sio.disconnect()
             except Exception:
                 pass
 
-    def send_ban(self, category: str) -> None:
+    def _emit(self, event: str, data: dict) -> None:
+        """Send an event to the server if connected; dropped otherwise. Never raises."""
         if self._sio and self._sio.connected:
-            self._sio.emit("ban", {"category": category}, namespace=WS_NAMESPACE)
+            self._send(event, data)
+
+    def _send(self, event: str, data: dict) -> None:
+        # The namespace can drop between the connected check and the emit
+        # (BadNamespaceError); callers include the UDP receive thread, which
+        # must not die over it
+        try:
+            with self._emit_lock:
+                self._sio.emit(event, data, namespace=WS_NAMESPACE)
+        except Exception as e:
+            log.warning("Dropped %s to server: %s", event, e)
+
+    @property
+    def is_connected(self) -> bool:
+        return bool(self._sio and self._sio.connected)
+
+    def subscribe_active_matches(self) -> None:
+        """Join the server's active_matches room.
+
+        The server answers with an active_matches_snapshot, then pushes
+        match_added / match_progress / match_finished deltas. The
+        subscription is re-sent after every reconnect until unsubscribed.
+        """
+        self._active_subscribed = True
+        self._emit("subscribe_active_matches", {})
+
+    def unsubscribe_active_matches(self) -> None:
+        self._active_subscribed = False
+        self._emit("unsubscribe_active_matches", {})
+
+    def send_ban(self, category: str) -> None:
+        self._emit("ban", {"category": category})
 
     def send_progress(self, area: int, level: int, theme: int) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("progress", {"area": area, "level": level, "theme": theme}, namespace=WS_NAMESPACE)
+        self._emit("progress", {"area": area, "level": level, "theme": theme})
 
     def send_death(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("death", {}, namespace=WS_NAMESPACE)
+        self._emit("death", {})
 
     def send_instant_restart(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("instant_restart", {}, namespace=WS_NAMESPACE)
+        self._emit("instant_restart", {})
 
     def send_completion(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("completion", {}, namespace=WS_NAMESPACE)
+        self._emit("completion", {})
 
     def send_chat(self, message: str) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("send_chat", {"message": message}, namespace=WS_NAMESPACE)
+        self._emit("send_chat", {"message": message})
 
     def send_game_disconnect(self) -> None:
         """Notify the server that the game process disconnected mid-match."""
-        if self._sio and self._sio.connected:
-            self._sio.emit("game_disconnect", {}, namespace=WS_NAMESPACE)
+        self._emit("game_disconnect", {})
 
     def send_request_seed_change(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("request_seed_change", {}, namespace=WS_NAMESPACE)
+        self._emit("request_seed_change", {})
 
     def send_request_draw(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("request_draw", {}, namespace=WS_NAMESPACE)
+        self._emit("request_draw", {})
 
     def send_forfeit(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("forfeit", {}, namespace=WS_NAMESPACE)
+        self._emit("forfeit", {})
 
     def send_close_postmatch(self) -> None:
-        if self._sio and self._sio.connected:
-            self._sio.emit("close_postmatch", {}, namespace=WS_NAMESPACE)
+        self._emit("close_postmatch", {})
 
     # ---- socketio event handlers (called from socketio's internal thread) ----
 
     def _on_connect(self):
+        # Room membership doesn't survive a reconnect. (connected isn't set
+        # until the connect call returns, so send without the check.)
+        if self._active_subscribed:
+            self._send("subscribe_active_matches", {})
         self.connected.emit()
 
     def _on_disconnect(self):
@@ -186,3 +229,15 @@ class WSClient(QObject):
 
     def _on_postmatch_closed(self, data=None):
         self.postmatch_closed.emit()
+
+    def _on_active_matches_snapshot(self, data):
+        self.active_matches_snapshot.emit(data if data else {})
+
+    def _on_match_added(self, data):
+        self.active_match_added.emit(data)
+
+    def _on_match_progress(self, data):
+        self.active_match_progress.emit(data)
+
+    def _on_match_finished(self, data):
+        self.active_match_finished.emit(data)
@@ -869,6 +869,64 @@ end
 
 
 
+-- Compact wire format (see Bridge/wire_codec.py). The Bridge offers it in
+-- version_request; once accepted, these events travel as a one-byte code
+-- plus fixed fields instead of JSON. Incoming messages may be either form.
+WIRE_VERSION = 1
+wireBinary = false
+WIRE_CODES = {
+    ping = 0x80, pong = 0x81, ack = 0x82, progress = 0x83,
+    death = 0x84, instant_restart = 0x85, completion = 0x86, opponent_progress = 0x87,
+}
+WIRE_EVENTS = {}
+for event, code in pairs(WIRE_CODES) do WIRE_EVENTS[code] = event end
+
+function encodeMessage(msg)
+    local code = wireBinary and WIRE_CODES[msg.event]
+    if code then
+        if msg.event == "progress" then
+            if msg.area <= 255 and msg.level <= 255 and msg.theme <= 255 then
+                return string.pack("<BBBB", code, msg.area, msg.level, msg.theme)
+            end
+        elseif msg.event == "ack" then
+            return string.pack("<BI4", code, msg.ack_seq or 0) .. msg.ack_event
+        elseif msg.event ~= "opponent_progress" then
+            return string.char(code)
+        end
+    end
+    return json.encode(msg)
+end
+
+function decodeMessage(message)
+    local event = WIRE_EVENTS[message:byte(1)]
+    if event == nil then return json.decode(message) end
+    if event == "opponent_progress" then
+        local _, area, theme = string.unpack("<BBB", message)
+        return { event = event, area = area, theme = theme }
+    end
+    return { event = event }
+end
+
+function sendEvent(msg, address)
+    server:send(encodeMessage(msg), address)
+end
+
+-- Critical messages carry a sequence id (seq) and are resent until acked.
+-- The ack echoes it back as ack_seq; a resend of a message already handled
+-- is recognised by its seq and only acked again.
+lastCriticalSeq = {}
+
+function isDuplicateCritical(data)
+    if data.seq == nil then return false end
+    if lastCriticalSeq[data.event] == data.seq then return true end
+    lastCriticalSeq[data.event] = data.seq
+    return false
+end
+
+function ackCritical(data, bridgeAddress)
+    sendEvent({ event = "ack", ack_event = data.event, ack_seq = data.seq }, bridgeAddress)
+end
+
 function timedOps()
     if server == nil or not server:is_open() then
         print("Game connection not available. Relaunch!")
@@ -884,7 +942,7 @@ function timedOps()
         --read operations
         while server:read(function(message, bridgeAddress)
             -- print("server has message")
-            local data = json.decode(message)
+            local data = decodeMessage(message)
             local event = data.event
             if event == nil then 
                 log_print("no event received")
@@ -892,14 +950,15 @@ function timedOps()
             end
             -- Heartbeat 
             if event == "ping" then
-                server:send(json.encode({ event = "pong" }), bridgeAddress)
+                sendEvent({ event = "pong" }, bridgeAddress)
             elseif event == "pong" then
                 if bridgeConnected == false then
                     queueStateText = "Not in queue"
                 end
                 bridgeConnected = true
             elseif event == "version_request" then
-                server:send(json.encode({ event = "version_response", version = meta.version }), bridgeAddress)
+                wireBinary = data.wire ~= nil and has(data.wire, WIRE_VERSION)
+                sendEvent({ event = "version_response", version = meta.version, wire = wireBinary and WIRE_VERSION or nil }, bridgeAddress)
             elseif event == "version_mismatch" then
                 bridgeConnected = false
                 print("You have an outdated mod version. Please update!")
@@ -928,14 +987,14 @@ function timedOps()
                 banTime()
             -- Match start (ack required)
             elseif event == "match_start" then 
-                if not matchStarted then
+                if not isDuplicateCritical(data) and not matchStarted then
                     matchStarted = true
                     categoryType = data.category
                     seed = tonumber(data.seed, 16)
                     reportCount = 0
                     banTime()
                 end
-                server:send(json.encode({ event = "ack", ack_event = "match_start" }), bridgeAddress)
+                ackCritical(data, bridgeAddress)
 
             --Opponent progress
             elseif event == "opponent_progress" then
@@ -972,7 +1031,7 @@ function timedOps()
 
             -- (ack required)
             elseif event == "do_seed_change" then
-                if not changingSeed then
+                if not isDuplicateCritical(data) and not changingSeed then
                     changingSeed = true
                     seed = tonumber(data.seed, 16)
                     warp(1,1,THEME.BASE_CAMP)
@@ -983,17 +1042,17 @@ function timedOps()
                         clear_callback(id)
                     end, 360)
                 end
-                server:send(json.encode({ event = "ack", ack_event = "do_seed_change" }), bridgeAddress)
+                ackCritical(data, bridgeAddress)
 
             -- Match result (ack required)
             elseif event == "match_result" then
-                if not matchResultReceived and matchStarted then
+                if not isDuplicateCritical(data) and not matchResultReceived and matchStarted then
                     matchResultReceived = true
                     result = data.result
                     eloChange = data.elo_change
                     endMatch()
                 end
-                server:send(json.encode({ event = "ack", ack_event = "match_result"}), bridgeAddress)
+                ackCritical(data, bridgeAddress)
 
             elseif event == "match_scrapped" then
                 print("This match has been scrapped! No Elo was lost.")
@@ -1014,67 +1073,67 @@ end
 --udp functions
 
 function ping()
-    server:send(json.encode({ event = "ping"}), bridgeAddress)
+    sendEvent({ event = "ping"}, bridgeAddress)
 end
 
 function placeInQueue()
-    server:send(json.encode({ event = "queue_ready"}), bridgeAddress)
+    sendEvent({ event = "queue_ready"}, bridgeAddress)
 end
 
 function leaveQueue()
     if matchStarted then return end
     if not inQueue then return end
-    server:send(json.encode({ event = "queue_leave"}), bridgeAddress)
+    sendEvent({ event = "queue_leave"}, bridgeAddress)
     inQueue = false
     queueStateText = "Not in queue"
 end
 
 function ban(category)
-    server:send(json.encode({ event = "ban", category = category}), bridgeAddress)
+    sendEvent({ event = "ban", category = category}, bridgeAddress)
 end
 
 function progressUpdate(area, level, theme)
-    server:send(json.encode({ event = "progress", area = area, level = level, theme = theme }), bridgeAddress)
+    sendEvent({ event = "progress", area = area, level = level, theme = theme }, bridgeAddress)
 end
 
 function deathReport()
-    server:send(json.encode({ event = "death" }), bridgeAddress)
+    sendEvent({ event = "death" }, bridgeAddress)
 end
 
 function restartReport()
-    server:send(json.encode({ event = "instant_restart"}), bridgeAddress)
+    sendEvent({ event = "instant_restart"}, bridgeAddress)
 end
 
 function completionReport()
-    server:send(json.encode({ event = "completion" }), bridgeAddress)
+    sendEvent({ event = "completion" }, bridgeAddress)
 end
 
 function requestSeedChange()
     set_global_timeout(function()
         sentSeedChange = false
     end, 60*seedChangeWindow)
-    server:send(json.encode({ event = "request_seed_change" }), bridgeAddress)
+    sendEvent({ event = "request_seed_change" }, bridgeAddress)
 end
 
 function requestDraw()
     set_global_timeout(function()
         sentDrawVote = false
     end, 60*drawVoteWindow)
-    server:send(json.encode({ event = "request_draw" }), bridgeAddress)
+    sendEvent({ event = "request_draw" }, bridgeAddress)
 end
 
 function sendForfeit()
-    server:send(json.encode({ event = "forfeit" }), bridgeAddress)
+    sendEvent({ event = "forfeit" }, bridgeAddress)
 end
 
 function closePostMatch()
     forceEndPostMatch()
-    server:send(json.encode({ event = "close_postmatch" }), bridgeAddress)
+    sendEvent({ event = "close_postmatch" }, bridgeAddress)
 end
 
 function sendChat()
     returnInputs()
-    server:send(json.encode({ event = "send_chat", message = chatMessage }), bridgeAddress)
+    sendEvent({ event = "send_chat", message = chatMessage }, bridgeAddress)
 end
 
 --general helper functions
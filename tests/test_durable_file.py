@@ -0,0 +1,74 @@
+"""A writer killed mid-write must leave the old or the new settings, never neither."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BRIDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge")
+sys.path.insert(0, BRIDGE_DIR)
+
+import durable_file  # noqa: E402
+
+# Runs in a child process: write version 2 and die (os._exit) partway
+_CHILD = r"""
+import os, sys
+sys.path.insert(0, {bridge!r})
+import durable_file
+
+mode, point = {mode!r}, {point}
+if mode == "bytes":
+    def _write_bytes(f, payload):
+        f.write(payload[:point])
+        f.flush()
+        os._exit(1)
+    durable_file._write_bytes = _write_bytes
+else:
+    calls = [0]
+    real_replace = os.replace
+    def replace(src, dst):
+        if calls[0] == point:
+            os._exit(1)
+        calls[0] += 1
+        real_replace(src, dst)
+    os.replace = replace
+durable_file.write_json({path!r}, {{"version": 2, "padding": "x" * 2000}})
+"""
+
+
+def _settings(version: int) -> dict:
+    return {"version": version, "padding": "x" * 2000}
+
+
+def _load(path: str):
+    return durable_file.read_json(path, None, validate=lambda d: isinstance(d, dict) and "version" in d)
+
+
+@pytest.mark.parametrize("mode, point", [
+    ("bytes", 0), ("bytes", 1), ("bytes", 700), ("bytes", 2000),
+    ("rename", 0), ("rename", 1),
+])
+def test_killed_write_keeps_old_or_new(tmp_path, mode, point):
+    path = str(tmp_path / "settings.json")
+    durable_file.write_json(path, _settings(1))
+
+    code = _CHILD.format(bridge=BRIDGE_DIR, mode=mode, point=point, path=path)
+    proc = subprocess.run([sys.executable, "-c", code], check=False)
+    assert proc.returncode == 1, "child finished the write instead of dying"
+
+    data = _load(path)
+    assert data is not None and data["version"] in (1, 2)
+
+
+def test_truncated_primary_recovered_from_bak(tmp_path):
+    path = str(tmp_path / "settings.json")
+    durable_file.write_json(path, _settings(1))
+    durable_file.write_json(path, _settings(2))
+    with open(path, "r+b") as f:
+        f.truncate(37)
+
+    assert _load(path)["version"] == 1
+    with open(path + ".bak", encoding="utf-8") as f:
+        assert json.load(f)["version"] == 1
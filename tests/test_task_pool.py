@@ -0,0 +1,31 @@
+"""A quick task must not queue behind a slow one while the pool has room."""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge"))
+
+import task_pool  # noqa: E402
+
+
+def test_fast_task_not_blocked_by_slow_task():
+    release = threading.Event()
+    fast_done = threading.Event()
+    try:
+        # Warm one worker so it's idle when both tasks arrive, the case
+        # where the fast task used to wait behind the slow one
+        warmed = threading.Event()
+        task_pool.submit(warmed.set)
+        assert warmed.wait(2)
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        task_pool.submit(release.wait, 2)
+        task_pool.submit(fast_done.set)
+        assert fast_done.wait(1), "fast task waited for the slow one"
+        assert time.monotonic() - start < 0.5
+        assert task_pool.stats()["threads"] >= 2
+    finally:
+        release.set()
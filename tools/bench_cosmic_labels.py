@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark cosmic-rank name labels with and without the pixmap cache.
+
+Simulates a leaderboard whose top rows are all cosmic players and times
+apply_rank_label_style per label, first re-rendering every gradient (cache
+cleared before each call) and then with the memoized pixmaps.
+
+Usage:
+    python tools/bench_cosmic_labels.py [--rows 50] [--rounds 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+BRIDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge")
+
+
+def _time_labels(labels, names, elo, font_size, before_each=None) -> list[float]:
+    from rank_utils import apply_rank_label_style
+
+    samples = []
+    for label, name in zip(labels, names):
+        if before_each:
+            before_each()
+        label.setText(name)
+        start = time.perf_counter()
+        apply_rank_label_style(label, elo, font_size)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> None:
+    print(f"{name:<10} mean={statistics.mean(samples):7.3f} ms  "
+          f"p50={statistics.median(samples):7.3f} ms  "
+          f"max={max(samples):7.3f} ms  ({len(samples)} labels)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, BRIDGE_DIR)
+    from PySide6.QtWidgets import QApplication, QLabel
+    import rank_utils
+    from config import RANK_THRESHOLDS
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    cosmic_elo = next(lo for name, lo, _hi in RANK_THRESHOLDS if name == "cosmic")
+    names = [f"CosmicPlayer{i:02d}" for i in range(args.rows)]
+    labels = [QLabel() for _ in names]
+
+    uncached, cached = [], []
+    for _ in range(args.rounds):
+        uncached += _time_labels(labels, names, cosmic_elo, 26, before_each=rank_utils.clear_cosmic_cache)
+    for _ in range(args.rounds):
+        cached += _time_labels(labels, names, cosmic_elo, 26)
+
+    _report("uncached", uncached)
+    _report("cached", cached)
+    print(f"speedup    {statistics.mean(uncached) / statistics.mean(cached):.1f}x")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
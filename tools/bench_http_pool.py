@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark api_client's pooled session against bare requests.get.
+
+Starts a local keep-alive HTTP stub that answers /matches, then times 100
+sequential get_matches calls each way and prints p50/p99 latency.
+
+Usage:
+    python tools/bench_http_pool.py [--calls 100]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BRIDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def do_GET(self):
+        body = json.dumps({"matches": [{"match_id": i} for i in range(10)]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _time_calls(fn, calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> None:
+    print(f"{name:<10} p50={_percentile(samples, 50):7.3f} ms  "
+          f"p99={_percentile(samples, 99):7.3f} ms  "
+          f"mean={statistics.mean(samples):7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # api_client reads SERVER_URL from config at import time
+    os.environ["SPEEDRUN_SERVER_URL"] = url
+    sys.path.insert(0, BRIDGE_DIR)
+    import requests
+    import api_client
+
+    def unpooled():
+        resp = requests.get(f"{url}/matches", params={"offset": 0, "limit": 10}, timeout=10)
+        resp.raise_for_status()
+        return resp.json().get("matches", [])
+
+    # Warm up both paths once so neither pays for imports or DNS
+    unpooled()
+    api_client.get_matches()
+
+    _report("unpooled", _time_calls(unpooled, args.calls))
+    _report("pooled", _time_calls(api_client.get_matches, args.calls))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Time Bridge startup from source and from the frozen S2Ranked build.
+
+Each run launches the Bridge headless (offscreen QPA) with an empty data
+directory, so it stops at the login screen rather than auto-logging in.
+SPEEDRUN_STARTUP_REPORT makes it write its startup timeline (ms since
+process creation for imports, QApplication, font load, window shown,
+first paint, login ready; see Bridge/startup_timeline.py) and quit.
+"window shown" is MainWindow.show() and "login ready" is the login page
+being interactive.
+
+One more run per mode collects an import-time breakdown. Source runs use
+-X importtime. Frozen runs set PYTHONPROFILEIMPORTTIME, and the breakdown
+is null when the build ignores it.
+
+Results (per-run timelines, medians, import breakdown, build info) go to
+a JSON file. --compare prints the change against an earlier result file
+and exits 1 if a median step got slower by more than --threshold.
+
+Usage:
+    python tools/bench_startup.py [--runs 10] [--out startup.json]
+    python tools/bench_startup.py --frozen executables/S2Ranked/S2Ranked.exe --compare old.json
+    python tools/bench_startup.py --modes source
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BRIDGE_APP = os.path.join(ROOT_DIR, "Bridge", "app.py")
+DEFAULT_FROZEN = os.path.join(
+    ROOT_DIR, "executables", "S2Ranked", "S2Ranked.exe" if os.name == "nt" else "S2Ranked"
+)
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _launch(cmd: list[str], extra_env: dict, timeout: float) -> tuple[dict | None, float, str]:
+    """Run the Bridge once; returns (report, seconds until exit, stderr)."""
+    data_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    report_path = os.path.join(data_dir, "startup.json")
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", SPEEDRUN_DATA_DIR=data_dir,
+               SPEEDRUN_STARTUP_REPORT=report_path, **extra_env)
+    try:
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              timeout=timeout, text=True, errors="replace")
+        elapsed = time.perf_counter() - start
+        report = None
+        if os.path.exists(report_path):
+            with open(report_path, encoding="utf-8") as f:
+                report = json.load(f)
+        return report, elapsed, proc.stderr
+    except subprocess.TimeoutExpired:
+        return None, timeout, ""
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def _parse_importtime(stderr: str, top: int) -> dict | None:
+    """Summarize -X importtime output: totals per package and the slowest modules."""
+    modules = []
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            modules.append((m.group(4), int(m.group(1)) / 1000, int(m.group(2)) / 1000, len(m.group(3)) // 2))
+    if not modules:
+        return None
+    packages: dict[str, float] = {}
+    for name, self_ms, _cum, _depth in modules:
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0.0) + self_ms
+    by_self = sorted(modules, key=lambda m: m[1], reverse=True)[:top]
+    return {
+        "total_ms": round(sum(m[1] for m in modules), 2),
+        "modules": len(modules),
+        "packages_ms": {k: round(v, 2) for k, v in sorted(packages.items(), key=lambda kv: -kv[1])[:top]},
+        "slowest_self_ms": [{"module": n, "self_ms": round(s, 2), "cumulative_ms": round(c, 2)}
+                            for n, s, c, _ in by_self],
+        "top_level_ms": {n: round(c, 2) for n, _s, c, d in modules if d == 0},
+    }
+
+
+def _bench_mode(name: str, cmd: list[str], importtime_cmd: list[str], importtime_env: dict,
+                runs: int, warmup: int, timeout: float, top: int) -> dict:
+    timelines, exits, failures = [], [], 0
+    for i in range(warmup + runs):
+        report, elapsed, stderr = _launch(cmd, {}, timeout)
+        if report is None:
+            failures += 1
+            print(f"  {name} run {i}: no startup report (exit after {elapsed:.1f}s)", file=sys.stderr)
+            if stderr.strip():
+                print("    " + stderr.strip().splitlines()[-1], file=sys.stderr)
+            continue
+        if i >= warmup:
+            timelines.append(report["timeline"])
+            exits.append(elapsed * 1000)
+
+    steps = list(timelines[0]) if timelines else []
+    median = {step: round(statistics.median(t[step] for t in timelines if step in t), 2) for step in steps}
+    spread = {step: [round(min(t[step] for t in timelines if step in t), 2),
+                     round(max(t[step] for t in timelines if step in t), 2)] for step in steps}
+
+    _report, _elapsed, stderr = _launch(importtime_cmd, importtime_env, timeout)
+    return {
+        "command": cmd,
+        "runs": len(timelines),
+        "failed_runs": failures,
+        "median_ms": median,
+        "min_max_ms": spread,
+        "process_exit_median_ms": round(statistics.median(exits), 2) if exits else None,
+        "timelines": [{k: round(v, 2) for k, v in t.items()} for t in timelines],
+        "importtime": _parse_importtime(stderr, top),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(old: dict, new: dict, threshold: float) -> bool:
+    """Print per-step median changes; True if any step regressed past threshold."""
+    regressed = False
+    for mode, result in new["modes"].items():
+        before = old.get("modes", {}).get(mode)
+        if not before or "median_ms" not in before or "median_ms" not in result:
+            continue
+        print(f"\n{mode}: {old.get('git') or '?'} -> {new.get('git') or '?'}")
+        for step, ms in result["median_ms"].items():
+            prev = before["median_ms"].get(step)
+            if prev is None:
+                continue
+            change = (ms - prev) / prev if prev else 0.0
+            flag = ""
+            if change > threshold:
+                flag, regressed = "  REGRESSION", True
+            print(f"  {step:<14} {prev:8.1f} -> {ms:8.1f} ms  ({change:+.0%}){flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", default="source,frozen", help="comma separated: source, frozen")
+    parser.add_argument("--frozen", default=DEFAULT_FROZEN, help="path to the built S2Ranked executable")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs first (cold disk cache)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per launch")
+    parser.add_argument("--top", type=int, default=15, help="entries kept in the import breakdown")
+    parser.add_argument("--out", default="startup_bench.json")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown counted as a regression")
+    args = parser.parse_args()
+
+    result = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git": _git_revision(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "modes": {},
+    }
+    for mode in (m.strip() for m in args.modes.split(",") if m.strip()):
+        if mode == "source":
+            cmd = [sys.executable, BRIDGE_APP]
+            importtime_cmd, importtime_env = [sys.executable, "-X", "importtime", BRIDGE_APP], {}
+        elif mode == "frozen":
+            if not os.path.exists(args.frozen):
+                print(f"frozen: {args.frozen} not found (run build/build_bridge.py), skipping")
+                result["modes"]["frozen"] = {"skipped": f"{args.frozen} not found"}
+                continue
+            cmd = [os.path.abspath(args.frozen)]
+            importtime_cmd, importtime_env = cmd, {"PYTHONPROFILEIMPORTTIME": "1"}
+        else:
+            parser.error(f"unknown mode {mode!r}")
+        print(f"{mode}: {args.warmup} warmup + {args.runs} runs ...")
+        result["modes"][mode] = _bench_mode(mode, cmd, importtime_cmd, importtime_env,
+                                            args.runs, args.warmup, args.timeout, args.top)
+
+    for mode, data in result["modes"].items():
+        if "median_ms" not in data:
+            continue
+        print(f"\n{mode} (median of {data['runs']}, ms since process start)")
+        for step, ms in data["median_ms"].items():
+            low, high = data["min_max_ms"][step]
+            print(f"  {step:<14} {ms:8.1f}   [{low:.1f} .. {high:.1f}]")
+        imports = data["importtime"]
+        if imports:
+            heavy = ", ".join(f"{k} {v:.0f}" for k, v in list(imports["packages_ms"].items())[:6])
+            print(f"  imports: {imports['total_ms']:.0f} ms in {imports['modules']} modules ({heavy})")
+        else:
+            print("  imports: no -X importtime breakdown available")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nwrote {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        if _compare(old, result, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
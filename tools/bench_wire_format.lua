@@ -0,0 +1,78 @@
+-- Benchmark JSON vs the binary wire format on the game side.
+--
+-- Mirrors encodeMessage/decodeMessage from main.lua (keep in sync) and times
+-- them per event against a JSON library. Needs Lua 5.3+ for string.pack and
+-- a json module on package.path (rxi/json.lua or dkjson); without one only
+-- the binary timings are printed.
+--
+-- Usage:
+--     lua5.4 tools/bench_wire_format.lua [iterations]
+
+local ok, json = pcall(require, "json")
+if not ok then ok, json = pcall(require, "dkjson") end
+if not ok then json = nil end
+
+local N = tonumber(arg[1]) or 200000
+
+local WIRE_CODES = {
+    ping = 0x80, pong = 0x81, ack = 0x82, progress = 0x83,
+    death = 0x84, instant_restart = 0x85, completion = 0x86, opponent_progress = 0x87,
+}
+local WIRE_EVENTS = {}
+for event, code in pairs(WIRE_CODES) do WIRE_EVENTS[code] = event end
+
+local function encodeBinary(msg)
+    local code = WIRE_CODES[msg.event]
+    if msg.event == "progress" then
+        return string.pack("<BBBB", code, msg.area, msg.level, msg.theme)
+    elseif msg.event == "ack" then
+        return string.pack("<BI4", code, msg.ack_seq or 0) .. msg.ack_event
+    end
+    return string.char(code)
+end
+
+local function decodeBinary(message)
+    local event = WIRE_EVENTS[message:byte(1)]
+    if event == "opponent_progress" then
+        local _, area, theme = string.unpack("<BBB", message)
+        return { event = event, area = area, theme = theme }
+    end
+    return { event = event }
+end
+
+-- What the game sends (encode) and receives (decode)
+local OUTGOING = {
+    { event = "ping" },
+    { event = "progress", area = 3, level = 2, theme = 5 },
+    { event = "death" },
+    { event = "ack", ack_event = "match_start", ack_seq = 123456789 },
+}
+local INCOMING = {
+    { event = "pong" },
+    { event = "opponent_progress", area = 4, theme = 7 },
+}
+
+local function perCallNs(fn, value)
+    local start = os.clock()
+    for _ = 1, N do fn(value) end
+    return (os.clock() - start) / N * 1e9
+end
+
+local function row(kind, msg, raw, binFn, jsonFn, jsonArg)
+    local bin = perCallNs(binFn, raw or msg)
+    local js = json and string.format("%8.0f", perCallNs(jsonFn, jsonArg)) or "       -"
+    print(string.format("%-7s %-18s %s ns json  %8.0f ns binary", kind, msg.event, js, bin))
+end
+
+for _, msg in ipairs(OUTGOING) do
+    row("encode", msg, nil, encodeBinary, json and json.encode, msg)
+end
+for _, msg in ipairs(INCOMING) do
+    local raw
+    if msg.event == "opponent_progress" then
+        raw = string.pack("<BBB", WIRE_CODES[msg.event], msg.area, msg.theme)
+    else
+        raw = string.char(WIRE_CODES[msg.event])
+    end
+    row("decode", msg, raw, decodeBinary, json and json.decode, json and json.encode(msg))
+end
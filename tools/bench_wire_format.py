@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark JSON vs the binary wire format for Bridge <-> Game UDP messages.
+
+Times encode and decode per event on the Bridge side: json.dumps/json.loads
+against wire_codec.encode/wire_codec.loads, which is what UDPRelay does
+for every datagram. Also prints the datagram size in each format. The game
+side has a matching script, tools/bench_wire_format.lua.
+
+Usage:
+    python tools/bench_wire_format.py [--n 200000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+BRIDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge")
+
+MESSAGES = [
+    {"event": "ping"},
+    {"event": "pong"},
+    {"event": "progress", "area": 3, "level": 2, "theme": 5},
+    {"event": "opponent_progress", "area": 4, "theme": 7},
+    {"event": "death"},
+    {"event": "ack", "ack_event": "match_start", "ack_seq": 123456789},
+]
+
+
+def _per_call_ns(fn, arg, n: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(n):
+        fn(arg)
+    return (time.perf_counter_ns() - start) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=200_000, help="iterations per measurement")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BRIDGE_DIR)
+    import wire_codec
+
+    def json_encode(msg):
+        return json.dumps(msg).encode("utf-8")
+
+    def json_decode(raw):
+        return json.loads(raw.decode("utf-8"))
+
+    print(f"{'event':<18}{'bytes':>12}{'encode ns':>20}{'decode ns':>20}")
+    print(f"{'':<18}{'json/bin':>12}{'json/bin':>20}{'json/bin':>20}")
+    for msg in MESSAGES:
+        raw_json = json_encode(msg)
+        raw_bin = wire_codec.encode(msg)
+        assert wire_codec.loads(raw_bin) == json_decode(raw_json), msg
+        enc = (_per_call_ns(json_encode, msg, args.n), _per_call_ns(wire_codec.encode, msg, args.n))
+        dec = (_per_call_ns(json_decode, raw_json, args.n), _per_call_ns(wire_codec.loads, raw_bin, args.n))
+        print(f"{msg['event']:<18}{len(raw_json):>6}/{len(raw_bin):<5}"
+              f"{enc[0]:>12.0f}/{enc[1]:<7.0f}{dec[0]:>12.0f}/{dec[1]:<7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Kill a settings writer mid-write and check that the file always survives.
+
+Each trial starts from a committed settings file (version N), then runs a
+child process that writes version N+1 and is killed (os._exit) either
+after a random number of payload bytes or just before one of the renames.
+The parent then loads the file and checks it got version N or N+1 intact.
+
+The same trials run against the old plain open("w") + json.dump writer,
+for comparison. A truncated file there is a load failure on next start.
+The last check damages the primary file directly and expects
+read_json to recover it from the .bak.
+
+Usage:
+    python tools/fault_inject_durable.py [--trials 200] [--seed 1]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+BRIDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge")
+
+# Runs in the child: write version `version` to `path` and die at the chosen point
+_CHILD = r"""
+import json, os, sys
+sys.path.insert(0, {bridge!r})
+import durable_file
+
+path, version, mode, point = {path!r}, {version}, {mode!r}, {point}
+data = {{"version": version, "overlay_color": "#%06x" % version, "padding": "x" * 2000}}
+
+def die_after(n):
+    def write(f, payload):
+        f.write(payload[:n])
+        f.flush()
+        os._exit(1)
+    return write
+
+if mode == "naive":
+    payload = json.dumps(data, indent=2).encode()
+    with open(path, "wb") as f:
+        f.write(payload[:point])
+        f.flush()
+        os._exit(1)
+elif mode == "bytes":
+    durable_file._write_bytes = die_after(point)
+elif mode == "rename":
+    calls = [0]
+    real_replace = os.replace
+    def replace(src, dst):
+        if calls[0] == point:
+            os._exit(1)
+        calls[0] += 1
+        real_replace(src, dst)
+    os.replace = replace
+durable_file.write_json(path, data)
+"""
+
+
+def _committed(path: str, version: int) -> None:
+    import durable_file
+    durable_file.write_json(path, {"version": version, "overlay_color": "#%06x" % version, "padding": "x" * 2000})
+
+
+def _load(path: str, durable: bool):
+    import durable_file
+    if durable:
+        return durable_file.read_json(path, None, validate=lambda d: isinstance(d, dict) and "version" in d)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _trial(directory: str, version: int, mode: str, point: int) -> object:
+    path = os.path.join(directory, "settings.json")
+    code = _CHILD.format(bridge=BRIDGE_DIR, path=path, version=version + 1, mode=mode, point=point)
+    subprocess.run([sys.executable, "-c", code], check=False)
+    return _load(path, durable=(mode != "naive"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BRIDGE_DIR)
+    import logging
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    payload_size = len(json.dumps({"version": 1, "overlay_color": "#000001", "padding": "x" * 2000}, indent=2))
+
+    results = {"naive": [0, 0], "durable": [0, 0]}  # [survived, lost]
+    for n in range(args.trials):
+        for kind in ("naive", "durable"):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "settings.json")
+                _committed(path, n)
+                if kind == "naive":
+                    mode, point = "naive", rng.randrange(payload_size)
+                elif rng.random() < 0.8:
+                    mode, point = "bytes", rng.randrange(payload_size)
+                else:
+                    mode, point = "rename", rng.randrange(2)
+                data = _trial(directory, n, mode, point)
+                ok = isinstance(data, dict) and data.get("version") in (n, n + 1)
+                results[kind][0 if ok else 1] += 1
+
+    # Primary damaged outright (e.g. by an older Bridge): recovered from .bak
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "settings.json")
+        _committed(path, 1)
+        _committed(path, 2)
+        with open(path, "r+b") as f:
+            f.truncate(37)
+        recovered = _load(path, durable=True)
+        bak_ok = isinstance(recovered, dict) and recovered.get("version") == 1
+
+    for kind, (survived, lost) in results.items():
+        print(f"{kind:<8} {survived:4d} survived  {lost:4d} lost  ({args.trials} kills)")
+    print(f"truncated primary recovered from .bak: {'yes' if bak_ok else 'NO'}")
+    sys.exit(0 if results["durable"][1] == 0 and bak_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
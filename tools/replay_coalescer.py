@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Replay a match event trace through EventCoalescer and count saved emits.
+
+Runs the trace on a virtual clock (no sleeping) through the same
+EventCoalescer the Bridge uses, then checks that coalescing kept the
+meaning of the trace:
+  - the last progress state sent equals the last one the Game reported
+  - every death / instant_restart is sent, one emit each
+  - no completion / forfeit / request is sent before anything that
+    arrived ahead of it
+  - no event is held longer than one coalescing window
+and prints events in, emits out and the added delay. Exits 1 if a check fails.
+
+Without --trace a typical ranked run is synthesized: level transitions
+every 20-60 s, deaths followed by the warp back through every level to
+the world's checkpoint, and bursts of instant restarts (restart + 1-1
+progress, repeated a few times). A trace file is JSON lines of
+{"t": seconds, "event": ..., <event fields>}.
+
+Usage:
+    python tools/replay_coalescer.py [--seed 1] [--window 0.25] [--trace run.jsonl] [--dump run.jsonl]
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import os
+import random
+import sys
+
+BRIDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Bridge")
+
+CRITICAL = {"completion", "forfeit", "request_seed_change", "request_draw"}
+
+
+def synth_trace(rng: random.Random) -> list[dict]:
+    """A ~15 minute run to the end of the game with mistakes along the way."""
+    trace, t = [], 0.0
+
+    def add(dt: float, event: str, **fields) -> None:
+        nonlocal t
+        t += dt
+        trace.append({"t": round(t, 4), "event": event, **fields})
+
+    def progress(dt: float, area: int, level: int, theme: int) -> None:
+        add(dt, "progress", area=area, level=level, theme=theme)
+
+    progress(0.0, 1, 1, 1)
+    levels = [(w, lv) for w in range(1, 8) for lv in range(1, 5)][:26]
+    themes = {1: 1, 2: 2, 3: 3, 4: 5, 5: 6, 6: 7, 7: 9}
+    i = 0
+    while i < len(levels) - 1:
+        t_level = rng.uniform(20, 60)
+        roll = rng.random()
+        if roll < 0.06:
+            # Restart spam: a bad start, mashed a few times
+            t += rng.uniform(2, 10)
+            for _ in range(rng.randint(2, 6)):
+                add(rng.uniform(0.08, 0.3), "instant_restart")
+                progress(rng.uniform(0.02, 0.06), 1, 1, 1)
+            i = 0
+            continue
+        if roll < 0.12:
+            # Death: reported on reset; the run restarts at 1-1 and then
+            # warps level by level (fades skipped) to the world's checkpoint
+            add(t_level * rng.uniform(0.2, 0.9), "death")
+            checkpoint = levels.index((levels[i][0], 1))
+            for back in range(checkpoint + 1):
+                w, lv = levels[back]
+                progress(rng.uniform(0.05, 0.15), w, lv, themes[w])
+            i = checkpoint
+            continue
+        i += 1
+        w, lv = levels[i]
+        progress(t_level, w, lv, themes[w])
+        if rng.random() < 0.02:
+            add(rng.uniform(1, 5), "request_draw")
+    add(rng.uniform(20, 60), "completion")
+    return trace
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+        self._heap: list = []
+        self._order = itertools.count()
+
+    def call_later(self, delay: float, fn) -> None:
+        heapq.heappush(self._heap, (self.now + delay, next(self._order), fn))
+
+    def advance_to(self, t: float) -> None:
+        while self._heap and self._heap[0][0] <= t:
+            self.now, _, fn = heapq.heappop(self._heap)
+            fn()
+        self.now = t
+
+    def drain(self) -> None:
+        while self._heap:
+            self.advance_to(self._heap[0][0])
+
+
+def replay(trace: list[dict], window: float) -> tuple[dict, list[str]]:
+    from event_coalescer import EventCoalescer
+
+    clock = VirtualClock()
+    submitted = {"death": 0, "instant_restart": 0}
+    emitted = {"death": 0, "instant_restart": 0}
+    state = {"submitted_progress": None, "sent_progress": None, "pending_since": None, "max_delay": 0.0}
+    failures = []
+
+    def send(event: str, data: dict) -> None:
+        if event == "progress":
+            state["sent_progress"] = data
+        elif event in emitted:
+            emitted[event] += 1
+        elif event in CRITICAL:
+            if emitted != submitted or state["sent_progress"] != state["submitted_progress"]:
+                failures.append(f"{event} at {clock.now:.3f}s overtook earlier events")
+        caught_up = emitted == submitted and state["sent_progress"] == state["submitted_progress"]
+        if caught_up and state["pending_since"] is not None:
+            state["max_delay"] = max(state["max_delay"], clock.now - state["pending_since"])
+            state["pending_since"] = None
+
+    coalescer = EventCoalescer(send, clock.call_later, window)
+    for entry in trace:
+        clock.advance_to(entry["t"])
+        event = entry["event"]
+        data = {k: v for k, v in entry.items() if k not in ("t", "event")}
+        if event == "progress":
+            state["submitted_progress"] = data
+        elif event in submitted:
+            submitted[event] += 1
+        if state["pending_since"] is None:
+            state["pending_since"] = clock.now
+        coalescer.submit(event, data)
+        if emitted == submitted and state["sent_progress"] == state["submitted_progress"]:
+            state["pending_since"] = None
+    clock.drain()
+
+    if state["sent_progress"] != state["submitted_progress"]:
+        failures.append(f"final progress {state['sent_progress']} != {state['submitted_progress']}")
+    if emitted != submitted:
+        failures.append(f"counts sent {emitted} != received {submitted}")
+    if state["max_delay"] > window + 1e-9:
+        failures.append(f"an event was held {state['max_delay']:.3f}s (> window {window}s)")
+    return {**coalescer.stats(), "max_delay": state["max_delay"]}, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--runs", type=int, default=20, help="synthesized runs (ignored with --trace)")
+    parser.add_argument("--window", type=float, default=None, help="seconds (default RELAY_COALESCE_WINDOW)")
+    parser.add_argument("--trace", help="JSON-lines trace to replay instead of synthesized runs")
+    parser.add_argument("--dump", help="write the first synthesized trace here")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BRIDGE_DIR)
+    from config import RELAY_COALESCE_WINDOW
+    window = args.window if args.window is not None else RELAY_COALESCE_WINDOW
+
+    if args.trace:
+        with open(args.trace, encoding="utf-8") as f:
+            traces = [[json.loads(line) for line in f if line.strip()]]
+    else:
+        rng = random.Random(args.seed)
+        traces = [synth_trace(rng) for _ in range(args.runs)]
+        if args.dump:
+            with open(args.dump, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in traces[0])
+
+    total_events = total_emits = 0
+    max_delay = 0.0
+    failed = False
+    for n, trace in enumerate(traces):
+        stats, failures = replay(trace, window)
+        total_events += stats["events"]
+        total_emits += stats["emits"]
+        max_delay = max(max_delay, stats["max_delay"])
+        for failure in failures:
+            failed = True
+            print(f"trace {n}: FAIL {failure}")
+
+    saved = total_events - total_emits
+    print(f"{len(traces)} trace(s), window {window * 1000:.0f} ms: "
+          f"{total_events} events -> {total_emits} emits "
+          f"({saved} saved, {saved / max(total_events, 1):.0%}), "
+          f"max added delay {max_delay * 1000:.0f} ms")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Local stand-in for the server's active matches feed.
+
+Serves the /ws/match Socket.IO namespace and GET /matches/active, and runs
+a small simulation of matches starting, progressing and finishing so the
+Bridge's active matches page can be exercised without the real server.
+
+Subscribed clients get an active_matches_snapshot followed by match_added /
+match_progress / match_finished deltas; GET /matches/active returns the same
+state as a full snapshot for the polling fallback. On exit it prints how
+many snapshots and deltas were served.
+
+Usage:
+    python tools/stub_ws_server.py [--port 5000] [--tick 2.0]
+    SPEEDRUN_WS_URL=http://127.0.0.1:5000 SPEEDRUN_SERVER_URL=http://127.0.0.1:5000 python Bridge/app.py
+"""
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import socketio
+
+NAMESPACE = "/ws/match"
+ROOM = "active_matches"
+CATEGORIES = ["Any%", "Low%", "Sunken City%", "Cosmic Ocean%"]
+
+_lock = threading.Lock()
+_active: dict[int, dict] = {}
+_finished: list[dict] = []
+_stats = {"snapshots_ws": 0, "snapshots_rest": 0, "deltas": 0}
+_ids = itertools.count(1)
+
+# wsgiref can't hand the raw socket to a websocket upgrade, so stay on long-polling
+sio = socketio.Server(async_mode="threading", cors_allowed_origins="*", transports=["polling"])
+
+
+def _snapshot() -> dict:
+    with _lock:
+        return {"active_matches": list(_active.values()), "recently_finished": list(_finished)}
+
+
+@sio.on("connect", namespace=NAMESPACE)
+def _on_connect(sid, environ, auth=None):
+    print(f"connect {sid} steam_id={(auth or {}).get('steam_id')}")
+
+
+@sio.on("subscribe_active_matches", namespace=NAMESPACE)
+def _on_subscribe(sid, data=None):
+    sio.enter_room(sid, ROOM, namespace=NAMESPACE)
+    _stats["snapshots_ws"] += 1
+    sio.emit("active_matches_snapshot", _snapshot(), to=sid, namespace=NAMESPACE)
+
+
+@sio.on("unsubscribe_active_matches", namespace=NAMESPACE)
+def _on_unsubscribe(sid, data=None):
+    sio.leave_room(sid, ROOM, namespace=NAMESPACE)
+
+
+def _broadcast(event: str, data: dict) -> None:
+    _stats["deltas"] += 1
+    sio.emit(event, data, room=ROOM, namespace=NAMESPACE)
+
+
+def _new_match() -> dict:
+    mid = next(_ids)
+    return {
+        "match_id": mid,
+        "category": random.choice(CATEGORIES),
+        "match_start_time": datetime.now(timezone.utc).isoformat(),
+        "player_1_id": f"p{mid}a", "player_1_name": f"Runner{mid}A", "player_1_elo": random.randint(0, 2000),
+        "player_2_id": f"p{mid}b", "player_2_name": f"Runner{mid}B", "player_2_elo": random.randint(0, 2000),
+        "player_1_area": 1, "player_1_theme": 1, "player_2_area": 1, "player_2_theme": 1,
+    }
+
+
+def _simulate(tick: float) -> None:
+    while True:
+        time.sleep(tick)
+        roll = random.random()
+        with _lock:
+            ids = list(_active)
+        if not ids or roll < 0.2:
+            match = _new_match()
+            with _lock:
+                _active[match["match_id"]] = match
+            _broadcast("match_added", match)
+        elif roll < 0.85:
+            mid = random.choice(ids)
+            side = random.choice((1, 2))
+            with _lock:
+                match = _active[mid]
+                area = match[f"player_{side}_area"] + 1
+                delta = {"match_id": mid, f"player_{side}_area": area, f"player_{side}_theme": min(area, 9)}
+                match.update(delta)
+            _broadcast("match_progress", delta)
+        else:
+            mid = random.choice(ids)
+            with _lock:
+                match = _active.pop(mid)
+                done = {"match_id": mid, "winner_id": random.choice((match["player_1_id"], match["player_2_id"]))}
+                _finished.append({**match, **done})
+                del _finished[:-20]
+            _broadcast("match_finished", done)
+
+
+def _rest_app(environ, start_response):
+    if environ.get("PATH_INFO") == "/matches/active":
+        _stats["snapshots_rest"] += 1
+        body = json.dumps(_snapshot()).encode()
+        start_response("200 OK", [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+        return [body]
+    start_response("404 Not Found", [("Content-Type", "text/plain")])
+    return [b"not found"]
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--tick", type=float, default=2.0, help="seconds between simulated events")
+    args = parser.parse_args()
+
+    threading.Thread(target=_simulate, args=(args.tick,), daemon=True).start()
+    app = socketio.WSGIApp(sio, _rest_app)
+    server = make_server("127.0.0.1", args.port, app, _ThreadingWSGIServer, _QuietHandler)
+    print(f"Stub server on http://127.0.0.1:{args.port} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"served: {_stats['snapshots_ws']} WS snapshots, {_stats['deltas']} deltas, "
+          f"{_stats['snapshots_rest']} REST snapshots")
+
+
+if __name__ == "__main__":
+    main()